@@ -0,0 +1,125 @@
+"""
+alias_sampler.py
+Walker/Vose alias tables for ricochet and snow-net targets.
+
+mechanics.pick_ricochet_targets_ids rebuilds the pool, the weights and the
+Quinn cap for every draw and scans the cumulative sums. RicochetSampler
+builds one alias table over the whole roster (stray_magnet and quinn_cap
+already applied) and draws in O(1): the thrower and earlier picks are
+rejected and redrawn, which leaves the remaining weights' proportions
+as they are. The table is rebuilt only when Quinn's stray_magnet changes.
+
+Same distribution as pick_ricochet_targets_ids (including the cap being
+recomputed as a net shrinks the pool), but not the same random draws: a
+seed does not replay the scan's picks. Opt-in via
+`iter_simulation(..., alias_sampling=True)`.
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+from . import mechanics
+
+
+class AliasTable:
+    """Vose's alias method: O(n) build, one rng.random() per draw."""
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("AliasTable needs at least one weight")
+        total = float(sum(weights))
+        if total <= 0 or min(weights) < 0:
+            raise ValueError("AliasTable weights must be non-negative with a positive sum")
+
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers are 1.0 up to rounding
+        self.n = n
+
+    def draw(self, rng: random.Random) -> int:
+        u = rng.random() * self.n
+        i = int(u)
+        if i >= self.n:  # u rounded up to n
+            i = self.n - 1
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+
+class RicochetSampler:
+    """
+    Ricochet / snow-net target picks over a RosterTable's ids. Every weight
+    is 1.0 except Quinn's (1.0 + stray_magnet, capped at `quinn_cap` of the
+    pool), so one table serves every thrower.
+    """
+
+    def __init__(self, table: "RosterTable", quinn_cap: float = 0.45):
+        self.table = table
+        self.quinn_cap = quinn_cap
+        self._stray: Optional[float] = None
+        self._alias: Optional[AliasTable] = None
+        self._quinn_weight = 1.0
+
+    def quinn_weight(self, pool_size: int, stray: float) -> float:
+        """Quinn's weight in a pool of `pool_size` ids (mechanics.pick_ricochet_targets_ids)."""
+        wq = 1.0 + stray
+        other = pool_size - 1
+        if wq / (other + wq) > self.quinn_cap:
+            wq = (self.quinn_cap * other) / (1.0 - self.quinn_cap) if (1.0 - self.quinn_cap) > 0 else wq
+            wq = max(0.01, wq)
+        return wq
+
+    def _refresh(self) -> bool:
+        """Rebuilds the alias table if stray_magnet changed; False when it cannot be used."""
+        quinn = self.table.quinn
+        stray = self.table.agents[quinn].stray_magnet if quinn is not None else 0.0
+        if self._alias is not None and stray == self._stray:
+            return True
+        if 1.0 + stray < 0.01:
+            # Below the cap's 0.01 floor (or non-positive): the scan handles it
+            self._alias = None
+            return False
+        self._stray = stray
+        weights = [1.0] * len(self.table)
+        if quinn is not None:
+            # Quinn's weight in the n - 1 pool of any other thrower
+            self._quinn_weight = weights[quinn] = self.quinn_weight(len(self.table) - 1, stray)
+        self._alias = AliasTable(weights)
+        return True
+
+    def pick(self, rng: random.Random, exclude: int, count: int = 1) -> List[int]:
+        """Up to `count` distinct ids other than `exclude`, like pick_ricochet_targets_ids."""
+        n = len(self.table)
+        if n < 2 or count <= 0:
+            return []
+        if not self._refresh():
+            return mechanics.pick_ricochet_targets_ids(rng, self.table, exclude, quinn_cap=self.quinn_cap, count=count)
+
+        quinn = self.table.quinn
+        taken = {exclude}
+        picked: List[int] = []
+        for _ in range(min(count, n - 1)):
+            # With picks removed the cap applies to a smaller pool; Quinn's
+            # weight can only go down, so thinning his draws is enough.
+            accept_quinn = 1.0
+            if quinn is not None and quinn not in taken:
+                accept_quinn = self.quinn_weight(n - len(taken), self._stray) / self._quinn_weight
+            while True:
+                i = self._alias.draw(rng)
+                if i in taken:
+                    continue
+                if i == quinn and accept_quinn < 1.0 and rng.random() >= accept_quinn:
+                    continue
+                break
+            picked.append(i)
+            taken.add(i)
+        return picked
@@ -10,18 +10,33 @@ class AuditManager:
     
     def __init__(self, mode: str = "transparent"):
         self.mode = mode # transparent | stabilize | conditional
+        self.last_anomaly: Optional[Event] = None
 
-    def evaluate_audit(self, current_turn: int, recent_events: List[Event], roster: Dict[str, Any]) -> List[Event]:
+    @staticmethod
+    def is_anomaly(evt: Event) -> bool:
+        return "RICOCHET" in evt.outcome or "LAYER_EXEMPTION" in evt.outcome
+
+    def observe(self, evt: Event) -> None:
+        """Incremental history: remembers the latest anomaly as events happen."""
+        if self.is_anomaly(evt):
+            self.last_anomaly = evt
+
+    def evaluate_audit(self, current_turn: int, recent_events: Optional[List[Event]], roster: Dict[str, Any]) -> List[Event]:
         """
         Scan recent events for anomalies (Ricochets) and issue a Verdict.
+        With `recent_events=None` the anomaly tracked by `observe` is used
+        instead of walking the history (constant cost on long runs).
         """
         
         # 1. Find the most recent ricochet OR exemption event
         audit_target_event = None
-        for evt in reversed(recent_events):
-            if "RICOCHET" in evt.outcome or "LAYER_EXEMPTION" in evt.outcome:
-                audit_target_event = evt
-                break
+        if recent_events is None:
+            audit_target_event = self.last_anomaly
+        else:
+            for evt in reversed(recent_events):
+                if self.is_anomaly(evt):
+                    audit_target_event = evt
+                    break
                 
         if not audit_target_event:
             # Nothing to audit
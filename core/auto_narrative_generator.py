@@ -262,8 +262,10 @@ def load_voice_anchors(char_dir: Path) -> Dict[str, Dict[str, List[str]]]:
 class MicroNarrator:
     """Witness Mode: Logic-driven narrative generation based on rich context"""
     
-    def __init__(self, character_voices: Dict):
+    def __init__(self, character_voices: Dict, seed: int = 0):
+        from .rng import component_rng
         self.voices = character_voices
+        self.rng = component_rng(seed, "MicroNarrator")  # same seed, same voice lines
         
     def narrate(self, event: Dict) -> str:
         """Generate a single line of narration for an event"""
@@ -376,44 +378,98 @@ class MicroNarrator:
         # Priority Injection from Anchors
         voices = self.voices.get(char, {})
         if tone in ["ceremonial", "witnessing"] and "anchored" in voices:
-             import random
-             return f"{random.choice(voices['anchored'])}"
+             return f"{self.rng.choice(voices['anchored'])}"
              
         # Standard lookup
-        import random
         lines = voices.get(tone, voices.get("neutral", ["grace"]))
-        return random.choice(lines) if lines else "composure"
+        return self.rng.choice(lines) if lines else "composure"
 
 
 class LedgerParser:
     """Parses JSONL Skeletor Ledger into structured events"""
     
     def __init__(self, ledger_path: Path):
+        # A ledger file/store path, or an in-memory sink (anything with `.records`)
         self.ledger_path = ledger_path
         self.events = []
         self.characters = {}
         
     def parse(self) -> Tuple[List[Dict], Dict[str, CharacterState]]:
         """Parse ledger and return events + character states"""
+        return self.parse_records(self._iter_records())
+
+    def parse_records(self, records) -> Tuple[List[Dict], Dict[str, CharacterState]]:
+        """Parse already-decoded ledger records (e.g. one run from a LedgerStore)"""
         
-        with open(self.ledger_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        event = json.loads(line)
-                        # Skip header if present (marked by metadata)
-                        if "event_type" not in event and "context" in event:
-                            continue
-                        # Or if header uses a different event_type
-                        if event.get("event_type") == "LEDGER_HEADER":
-                            continue
-                            
-                        self.events.append(event)
-                        self._update_character_state(event)
-                    except json.JSONDecodeError:
-                        continue
+        for event in self._resolve_contexts(records):
+            # Skip header if present (marked by metadata)
+            if "event_type" not in event and "context" in event:
+                continue
+            # Or if header uses a different event_type
+            if event.get("event_type") == "LEDGER_HEADER":
+                continue
+                
+            self.events.append(event)
+            self._update_character_state(event)
         
         return self.events, self.characters
+
+    def parse_window(self, start_tick: int, end_tick: int) -> Tuple[List[Dict], Dict[str, CharacterState]]:
+        """
+        Parse only events with start_tick <= tick <= end_tick.
+        Uses the sidecar index (memory-mapped, no full scan) when the ledger has one.
+        """
+        from .ledger_index import IndexedLedgerReader, index_path
+        
+        if isinstance(self.ledger_path, Path) and index_path(self.ledger_path).exists():
+            with IndexedLedgerReader(self.ledger_path) as reader:
+                records = list(reader.events_in_ticks(start_tick, end_tick))
+        else:
+            # Resolve shared contexts first: a snapshot may be named before the window
+            records = [r for r in self._resolve_contexts(self._iter_records())
+                       if isinstance(r.get("tick"), int) and start_tick <= r["tick"] <= end_tick]
+        
+        return self.parse_records(records)
+
+    @staticmethod
+    def _resolve_contexts(records):
+        """
+        v1.5 ledgers: the first event of a turn snapshot carries `context_id`,
+        later ones only `context_ref`. Yields v1.4-shaped events that share
+        one context dict per snapshot again.
+        """
+        turn_contexts = {}
+        for event in records:
+            if event.get("event_type") == "LEDGER_HEADER":
+                turn_contexts = {} # Snapshot ids are scoped to one run
+            elif "context_id" in event:
+                event = dict(event)
+                turn_contexts[event.pop("context_id")] = event["context"]
+            elif "context_ref" in event:
+                event = dict(event)
+                event["context"] = turn_contexts.get(event.pop("context_ref"), {})
+                event["weaver_turns_left"] = event.pop("weaver_turns_left", 0) # Keep v1.4 key order
+            yield event
+
+    def _iter_records(self):
+        """
+        Yield raw ledger records. Auto-detects JSONL vs binary (SKLB), streams
+        gzip/xz segments directly, reads every segment of a LedgerStore dir,
+        and reads a MemoryLedgerSink's records as-is.
+        """
+        from .ledger_store import LedgerStore, MANIFEST_NAME, iter_ledger_file
+        
+        records = getattr(self.ledger_path, "records", None)
+        if records is not None:
+            # In-memory sink: no file round-trip
+            yield from records
+            return
+        
+        if self.ledger_path.is_dir() and (self.ledger_path / MANIFEST_NAME).exists():
+            yield from LedgerStore(self.ledger_path).iter_records()
+            return
+        
+        yield from iter_ledger_file(self.ledger_path)
     
     def _update_character_state(self, event: Dict):
         """Update character states based on event"""
@@ -643,12 +699,14 @@ class StoryGenerator:
     
     def __init__(self, events: List[Dict], characters: Dict[str, CharacterState], 
                  patterns: List[NarrativePattern], seed: int, style: str = "epic"):
+        from .rng import component_rng
         self.events = events
         self.characters = characters
         self.patterns = patterns
         self.seed = seed
         self.style = style
         self.story_beats = []
+        self.rng = component_rng(seed, "StoryGenerator")  # same seed, same reactions
     
     def generate(self) -> str:
         """Generate complete story markdown"""
@@ -867,7 +925,7 @@ Reality *hiccupped*. The training ground shuddered. Snow that had been falling g
                 processed_events.append(evt)
 
         # Now pass to Director
-        micro_narrator = MicroNarrator(CHARACTER_VOICES)
+        micro_narrator = MicroNarrator(CHARACTER_VOICES, seed=self.seed)
         director = ZoomDirector(micro_narrator)
         return director.process(processed_events)
 
@@ -917,13 +975,11 @@ Reality *hiccupped*. The training ground shuddered. Snow that had been falling g
         
         # Priority Injection: If 'anchored' phrases exist and this is a special tone, force use
         if tone in ["ceremonial", "witnessing"] and "anchored" in voices:
-             import random
-             return f"{random.choice(voices['anchored'])}"
+             return f"{self.rng.choice(voices['anchored'])}"
         
         reactions = voices.get(tone, voices.get("neutral", ["grace"]))
         
-        import random
-        return random.choice(reactions) if reactions else "composure"
+        return self.rng.choice(reactions) if reactions else "composure"
     
     def _generate_epilogue(self) -> str:
         """Generate final scoreboard and reflections"""
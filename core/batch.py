@@ -0,0 +1,424 @@
+"""
+batch.py
+Monte Carlo batch runner.
+
+Balance numbers used to come from scripting thousands of `snowball.py play`
+subprocesses. run_batch spreads a seed range across a ProcessPoolExecutor:
+each worker loads the roster and the sample dyad classes once, then runs its
+seeds with `stats_only=True` (no ledger, no Event objects) and only ships a
+small per-run summary back. Summaries are folded in seed order, so the result does not depend on the
+number of workers. Runs draw only from their own seeded streams (core/rng.py)
+and never touch the global `random`; a dyad that does is not reproducible
+and DyadManager warns about it (_warn_global_random).
+
+run_paired_batch compares two configurations seed by seed on common random
+numbers (core/crn.py), optionally with antithetic pairs, and reports the
+difference with its standard error.
+"""
+
+import contextlib
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .simulation import load_roster, run_simulation
+from .dyad_manager import load_sample_dyad_classes
+
+
+@dataclass
+class RunSummary:
+    """What a worker sends back for one seed."""
+    seed: int
+    landed: Dict[str, int]
+    taken: Dict[str, int]
+    mvp: Optional[str]
+    outcomes: Dict[str, Dict[str, int]]  # thrower -> outcome -> count
+
+
+@dataclass
+class AgentStats:
+    name: str
+    runs: int = 0
+    landed_sum: int = 0
+    landed_sq: int = 0
+    taken_sum: int = 0
+    taken_sq: int = 0
+    mvp_count: int = 0
+    outcomes: Counter = field(default_factory=Counter)
+
+    def add(self, landed: int, taken: int, mvp: bool) -> None:
+        self.runs += 1
+        self.landed_sum += landed
+        self.landed_sq += landed * landed
+        self.taken_sum += taken
+        self.taken_sq += taken * taken
+        self.mvp_count += int(mvp)
+
+    @staticmethod
+    def _mean_var(total: int, squares: int, n: int):
+        if n == 0:
+            return 0.0, 0.0
+        mean = total / n
+        # Population variance over the batch's runs
+        return mean, max(0.0, squares / n - mean * mean)
+
+    @property
+    def landed_mean(self) -> float:
+        return self._mean_var(self.landed_sum, self.landed_sq, self.runs)[0]
+
+    @property
+    def landed_var(self) -> float:
+        return self._mean_var(self.landed_sum, self.landed_sq, self.runs)[1]
+
+    @property
+    def taken_mean(self) -> float:
+        return self._mean_var(self.taken_sum, self.taken_sq, self.runs)[0]
+
+    @property
+    def taken_var(self) -> float:
+        return self._mean_var(self.taken_sum, self.taken_sq, self.runs)[1]
+
+    def to_dict(self, total_runs: int) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "landed": {"mean": self.landed_mean, "var": self.landed_var},
+            "taken": {"mean": self.taken_mean, "var": self.taken_var},
+            "mvp": {"count": self.mvp_count, "rate": self.mvp_count / total_runs if total_runs else 0.0},
+            "outcomes": dict(self.outcomes.most_common()),
+        }
+
+
+@dataclass
+class BatchResult:
+    runs: int = 0
+    agents: Dict[str, AgentStats] = field(default_factory=dict)
+    outcomes: Counter = field(default_factory=Counter)
+
+    def add(self, summary: RunSummary) -> None:
+        self.runs += 1
+        for name in summary.landed:
+            stats = self.agents.get(name)
+            if stats is None:
+                stats = self.agents[name] = AgentStats(name)
+            stats.add(summary.landed[name], summary.taken[name], summary.mvp == name)
+        for thrower, counts in summary.outcomes.items():
+            self.outcomes.update(counts)
+            stats = self.agents.get(thrower)
+            if stats is not None:
+                stats.outcomes.update(counts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "outcomes": dict(self.outcomes.most_common()),
+            "agents": {name: s.to_dict(self.runs) for name, s in self.agents.items()},
+        }
+
+
+@dataclass
+class PairSummary:
+    """One seed of a paired batch: agent -> (landed, taken) under each config."""
+    seed: int
+    a: Dict[str, Tuple[float, float]]
+    b: Dict[str, Tuple[float, float]]
+
+
+@dataclass
+class PairedStats:
+    """One counter under configs A and B, and their per-seed difference B - A."""
+    runs: int = 0
+    a_sum: float = 0.0
+    a_sq: float = 0.0
+    b_sum: float = 0.0
+    b_sq: float = 0.0
+    diff_sum: float = 0.0
+    diff_sq: float = 0.0
+
+    def add(self, a: float, b: float) -> None:
+        self.runs += 1
+        self.a_sum += a
+        self.a_sq += a * a
+        self.b_sum += b
+        self.b_sq += b * b
+        self.diff_sum += b - a
+        self.diff_sq += (b - a) * (b - a)
+
+    def _var(self, total: float, squares: float) -> float:
+        # Sample variance (n - 1): these feed standard errors
+        if self.runs < 2:
+            return 0.0
+        return max(0.0, (squares - total * total / self.runs) / (self.runs - 1))
+
+    @property
+    def a_mean(self) -> float:
+        return self.a_sum / self.runs if self.runs else 0.0
+
+    @property
+    def b_mean(self) -> float:
+        return self.b_sum / self.runs if self.runs else 0.0
+
+    @property
+    def diff_mean(self) -> float:
+        return self.diff_sum / self.runs if self.runs else 0.0
+
+    @property
+    def diff_se(self) -> float:
+        """Standard error of the paired difference."""
+        return math.sqrt(self._var(self.diff_sum, self.diff_sq) / self.runs) if self.runs else 0.0
+
+    @property
+    def independent_se(self) -> float:
+        """Standard error the same runs would give as two independent batches."""
+        if not self.runs:
+            return 0.0
+        return math.sqrt((self._var(self.a_sum, self.a_sq) + self._var(self.b_sum, self.b_sq)) / self.runs)
+
+    @property
+    def variance_reduction(self) -> float:
+        """independent / paired variance: how many times fewer runs pairing needs."""
+        se = self.diff_se
+        return (self.independent_se / se) ** 2 if se > 0 else math.inf
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "a_mean": self.a_mean,
+            "b_mean": self.b_mean,
+            "diff": self.diff_mean,
+            "diff_se": self.diff_se,
+            "ci95": [self.diff_mean - 1.96 * self.diff_se, self.diff_mean + 1.96 * self.diff_se],
+            "independent_se": self.independent_se,
+            "variance_reduction": self.variance_reduction if self.diff_se > 0 else None,
+        }
+
+
+@dataclass
+class PairedResult:
+    runs: int = 0
+    antithetic: bool = False
+    agents: Dict[str, Dict[str, PairedStats]] = field(default_factory=dict)  # agent -> landed/taken
+
+    def add(self, summary: PairSummary) -> None:
+        self.runs += 1
+        for name in summary.a.keys() | summary.b.keys():
+            stats = self.agents.get(name)
+            if stats is None:
+                stats = self.agents[name] = {"landed": PairedStats(), "taken": PairedStats()}
+            a_landed, a_taken = summary.a.get(name, (0.0, 0.0))
+            b_landed, b_taken = summary.b.get(name, (0.0, 0.0))
+            stats["landed"].add(a_landed, b_landed)
+            stats["taken"].add(a_taken, b_taken)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "antithetic": self.antithetic,
+            "agents": {
+                name: {counter: s.to_dict() for counter, s in stats.items()}
+                for name, stats in self.agents.items()
+            },
+        }
+
+
+# --- Worker side ---
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(char_dir: Path, use_samples: bool, settings: Dict[str, Any], quiet: bool, variants: Optional[Tuple[Dict[str, Any], ...]] = None) -> None:
+    """Runs once per worker process: roster and dyad classes are loaded here, not per seed."""
+    _WORKER["stdout"] = open(os.devnull, "w", encoding="utf-8") if quiet else None
+    with _quiet():
+        _WORKER["roster"] = load_roster(char_dir, use_samples=use_samples)
+        _WORKER["dyad_classes"] = load_sample_dyad_classes()
+    _WORKER["char_dir"] = char_dir
+    _WORKER["settings"] = settings
+    _WORKER["variants"] = variants
+
+
+def _quiet():
+    """Silences per-run prints (roster/dyad loading) unless the batch is verbose."""
+    if _WORKER.get("stdout") is None:
+        return contextlib.nullcontext()
+    return contextlib.redirect_stdout(_WORKER["stdout"])
+
+
+def _simulate(seed: int, settings: Dict[str, Any]):
+    with _quiet():
+        return run_simulation(
+            seed=seed,
+            ledger_path=None,
+            char_dir=_WORKER["char_dir"],
+            roster=_WORKER["roster"],
+            dyad_classes=_WORKER["dyad_classes"],
+            stats_only=True,
+            **settings
+        )
+
+
+def _run_seed(seed: int) -> RunSummary:
+    stats, roster = _simulate(seed, _WORKER["settings"])
+
+    top_scorer = max(roster.values(), key=lambda a: a.landed) if roster else None
+    return RunSummary(
+        seed=seed,
+        landed=stats.landed,
+        taken=stats.taken,
+        mvp=top_scorer.name if top_scorer else None,
+        outcomes=stats.outcomes,
+    )
+
+
+def _run_pair(seed: int) -> PairSummary:
+    """Both configs on the seed's keyed streams (and their mirror image, averaged)."""
+    counters = []
+    for variant in _WORKER["variants"]:
+        runs = [_simulate(seed, {**_WORKER["settings"], **variant, "antithetic": mirror})[0]
+                for mirror in ((False, True) if _WORKER["settings"]["antithetic"] else (False,))]
+        counters.append({
+            name: (
+                sum(s.landed.get(name, 0) for s in runs) / len(runs),
+                sum(s.taken.get(name, 0) for s in runs) / len(runs),
+            )
+            for name in runs[0].landed
+        })
+    return PairSummary(seed=seed, a=counters[0], b=counters[1])
+
+
+def _map_seeds(fn: Callable[[int], Any], seeds: List[int], init_args: tuple, workers: Optional[int], chunksize: Optional[int]) -> Iterator[Any]:
+    """fn(seed) for every seed, in seed order, in-process or on a worker pool."""
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(seeds) <= 1:
+        _init_worker(*init_args)
+        try:
+            for seed in seeds:
+                yield fn(seed)
+        finally:
+            if _WORKER["stdout"] is not None:
+                _WORKER["stdout"].close()
+            _WORKER.clear()
+        return
+
+    if chunksize is None:
+        # A few chunks per worker: low IPC overhead, still balanced
+        chunksize = max(1, len(seeds) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as pool:
+        yield from pool.map(fn, seeds, chunksize=chunksize)
+
+
+# --- Public API ---
+
+def run_batch(
+    seeds: Iterable[int],
+    turns: int,
+    char_dir: Path,
+    mode: str = "open",
+    scenario_name: str = None,
+    audit_mode: str = "transparent",
+    force_ricochet_target: str = None,
+    use_samples: bool = False,
+    weaver_bankai: bool = True,
+    weaver_intensity: float = 1.0,
+    rng_backend: str = "mt",
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    quiet: bool = True,
+) -> BatchResult:
+    """
+    Runs one headless simulation per seed and aggregates per-agent stats.
+    `workers=1` runs in-process (no pool); `None` uses os.cpu_count().
+    `rng_backend` picks the per-run random stream (core/rng.py).
+    """
+    seeds = list(seeds)
+    settings = {
+        "turns": turns,
+        "mode": mode,
+        "scenario_name": scenario_name,
+        "audit_mode": audit_mode,
+        "force_ricochet_target": force_ricochet_target,
+        "use_samples": use_samples,
+        "weaver_bankai": weaver_bankai,
+        "weaver_intensity": weaver_intensity,
+        "rng_backend": rng_backend,
+    }
+    init_args = (Path(char_dir), use_samples, settings, quiet)
+    result = BatchResult()
+    for summary in _map_seeds(_run_seed, seeds, init_args, workers, chunksize):
+        result.add(summary)
+    return result
+
+
+# Set by run_paired_batch for both configs; a compare variant may not override them
+PAIRING_OPTIONS = ("common_random_numbers", "antithetic")
+
+
+def run_paired_batch(
+    seeds: Iterable[int],
+    turns: int,
+    char_dir: Path,
+    a: Dict[str, Any],
+    b: Dict[str, Any],
+    antithetic: bool = False,
+    mode: str = "open",
+    scenario_name: str = None,
+    audit_mode: str = "transparent",
+    use_samples: bool = False,
+    weaver_bankai: bool = True,
+    weaver_intensity: float = 1.0,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    quiet: bool = True,
+) -> PairedResult:
+    """
+    Runs every seed under config A and config B (option overrides, e.g.
+    `{"audit_mode": "stabilize"}`) on common random numbers and aggregates
+    the per-seed difference B - A. `antithetic=True` also runs each seed
+    mirrored and averages the pair. Each PairedStats reports the difference,
+    its standard error and the variance reduction over independent batches.
+    Raises ValueError if A or B overrides one of PAIRING_OPTIONS.
+    """
+    for label, variant in (("A", a), ("B", b)):
+        fixed = sorted(set(variant) & set(PAIRING_OPTIONS))
+        if fixed:
+            raise ValueError(
+                f"Config {label} cannot override {', '.join(fixed)}: the pairing sets it for both configs"
+            )
+    seeds = list(seeds)
+    settings = {
+        "turns": turns,
+        "mode": mode,
+        "scenario_name": scenario_name,
+        "audit_mode": audit_mode,
+        "use_samples": use_samples,
+        "weaver_bankai": weaver_bankai,
+        "weaver_intensity": weaver_intensity,
+        "common_random_numbers": True,
+        "antithetic": antithetic,
+    }
+    init_args = (Path(char_dir), use_samples, settings, quiet, (dict(a), dict(b)))
+    result = PairedResult(antithetic=antithetic)
+    for summary in _map_seeds(_run_pair, seeds, init_args, workers, chunksize):
+        result.add(summary)
+    return result
+
+
+def parse_seed_range(spec: str) -> List[int]:
+    """'1-1000', '7', or '1,5,10-12' -> list of seeds (ranges are inclusive)."""
+    seeds: List[int] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, sep, end = part.partition("-")
+        if sep and start:
+            lo, hi = int(start), int(end)
+            if hi < lo:
+                raise ValueError(f"Empty seed range: {part}")
+            seeds.extend(range(lo, hi + 1))
+        else:
+            seeds.append(int(part))
+    return seeds
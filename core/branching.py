@@ -0,0 +1,120 @@
+"""
+branching.py
+What-if branches from a simulation checkpoint.
+
+"What happens from turn 40 on if the audit mode changes?" used to mean
+re-simulating from turn 1 for every variant. capture_checkpoint plays the
+trunk once, up to the fork turn; fork_branches resumes copies of that state,
+each with its own option overrides, in-process or on a ProcessPoolExecutor.
+All branches start from the same RNG state, so they differ by their options
+rather than by luck.
+
+    cp = capture_checkpoint(seed=777, turns=100, at_turn=40, char_dir=Path("characters"))
+    results = fork_branches(cp, [{}, {"audit_mode": "stabilize"}, {"weaver_intensity": 1.5}])
+"""
+
+import contextlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .models import Agent, SimulationCheckpoint, SimulationStats, SimulationSummary
+from .simulation import iter_simulation
+
+
+@dataclass
+class BranchResult:
+    index: int
+    options: Dict[str, Any]  # overrides applied on top of the checkpoint's options
+    roster: Dict[str, Agent]
+    stats: Optional[SimulationStats]  # counters from turn 1 (trunk + branch)
+    ledger_path: Optional[Path] = None
+
+
+def capture_checkpoint(
+    seed: int,
+    turns: int,
+    at_turn: int,
+    char_dir: Path,
+    ledger_path: Optional[Path] = None,
+    **options: Any
+) -> SimulationCheckpoint:
+    """
+    Plays turns 1..at_turn-1 and returns the state before `at_turn`.
+    `turns` is the full run length the branches play to. Without a
+    ledger_path the trunk runs headless in stats mode, so the checkpoint
+    (and every branch) carries SimulationStats counters.
+    """
+    if not 1 <= at_turn <= turns:
+        raise ValueError(f"Checkpoint turn {at_turn} is outside 1..{turns}")
+    if ledger_path is None and options.get("ledger_sink") is None:
+        options["stats_only"] = True
+
+    run = iter_simulation(seed, turns, ledger_path, char_dir, checkpoint_at=[at_turn], **options)
+    try:
+        for item in run:
+            if isinstance(item, SimulationCheckpoint):
+                return item
+    finally:
+        run.close()  # Closes the trunk ledger
+    raise ValueError(f"Simulation ended before turn {at_turn}")
+
+
+def _run_branch(task: tuple) -> BranchResult:
+    index, checkpoint, overrides, char_dir, ledger_path, quiet = task
+    options = {**checkpoint.options, **overrides}
+    turns = options.pop("turns")
+    if ledger_path is None:
+        options["stats_only"] = True
+
+    summary = None
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            # Dyad loading prints once per branch
+            sink = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+            stack.enter_context(contextlib.redirect_stdout(sink))
+        for item in iter_simulation(checkpoint.seed, turns, ledger_path, char_dir, resume=checkpoint, **options):
+            if isinstance(item, SimulationSummary):
+                summary = item
+
+    return BranchResult(
+        index=index,
+        options=dict(overrides),
+        roster=summary.roster,
+        stats=summary.stats,
+        ledger_path=ledger_path,
+    )
+
+
+def fork_branches(
+    checkpoint: SimulationCheckpoint,
+    branches: Sequence[Dict[str, Any]],
+    char_dir: Path = Path("characters"),
+    ledger_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    quiet: bool = True,
+) -> List[BranchResult]:
+    """
+    Resumes one run per entry of `branches` (option overrides, e.g.
+    `{"audit_mode": "stabilize"}`) from the same checkpoint.
+    With `ledger_dir`, branch i writes `branch-<i>.jsonl` (replacing an
+    earlier one); otherwise branches run headless.
+    `workers=1` runs in-process; `None` uses os.cpu_count().
+    Results come back in branch order.
+    """
+    tasks = []
+    for index, overrides in enumerate(branches):
+        ledger_path = None
+        if ledger_dir is not None:
+            ledger_path = Path(ledger_dir) / f"branch-{index:03d}.jsonl"
+            ledger_path.unlink(missing_ok=True)  # The writer appends
+        tasks.append((index, checkpoint, dict(overrides), Path(char_dir), ledger_path, quiet))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        return [_run_branch(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(_run_branch, tasks))
@@ -0,0 +1,114 @@
+"""
+crn.py
+Keyed random streams for paired configuration comparisons.
+
+A run draws every random number from one random.Random, so two configs
+(audit_mode, weaver_intensity, ...) with the same seed part ways at the
+first draw one of them makes and the other does not. RandomStreams gives
+each decision point (thrower pick, target pick, hit roll, ricochet roll,
+paradox reroll, ricochet/net target picks, dyad hooks) its own stream, and
+the n-th draw of a point in turn t is a hash of (seed, point, t, n). A
+config that spends an extra draw only shifts that point for the rest of
+that turn, so paired runs keep consuming the same numbers (common random
+numbers) and their difference has far less noise than two independent
+batches.
+
+`antithetic=True` mirrors every draw (u -> 1 - u, picks from the other
+end of the range); averaging a seed's plain and antithetic runs cancels
+part of the remaining noise. batch.run_paired_batch does both.
+
+    iter_simulation(seed, turns, ..., common_random_numbers=True)
+"""
+
+import hashlib
+import random
+from typing import Dict, Tuple
+
+# Decision points, in iter_simulation's order
+DECISION_POINTS = ("thrower", "target", "hit", "ricochet", "paradox", "pick", "hooks")
+
+_BITS = 53
+_SCALE = 1.0 / (1 << _BITS)
+_TOP = (1 << _BITS) - 1
+
+
+class KeyedStream(random.Random):
+    """
+    random.Random whose n-th draw in a turn is a hash of (key, turn, n).
+    Every method (choice, randrange, sample, ...) goes through random() or
+    getrandbits(), so mirrored draws stay mirrored.
+    """
+
+    def __init__(self, key: str, antithetic: bool = False):
+        self.key = key.encode("utf-8")
+        self.antithetic = antithetic
+        self.turn = 0
+        self.count = 0
+        super().__init__()
+
+    def seed(self, a=None, version: int = 2) -> None:
+        # random.Random.__init__ calls this; an explicit seed re-keys the stream
+        if a is not None:
+            self.key = str(a).encode("utf-8")
+            self.turn = 0
+            self.count = 0
+
+    def begin_turn(self, turn: int) -> None:
+        self.turn = turn
+        self.count = 0
+
+    def _next(self) -> int:
+        digest = hashlib.blake2b(b"%s:%d:%d" % (self.key, self.turn, self.count), digest_size=8).digest()
+        self.count += 1
+        return int.from_bytes(digest, "big")
+
+    def random(self) -> float:
+        k = self._next() >> (64 - _BITS)
+        if self.antithetic:
+            k = _TOP - k
+        return k * _SCALE
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next() << shift
+        bits &= (1 << k) - 1
+        return ((1 << k) - 1) - bits if self.antithetic else bits
+
+    def _randbelow(self, n: int) -> int:
+        # Monotone in random(), so an antithetic pick mirrors the plain one
+        return min(int(self.random() * n), n - 1)
+
+    def getstate(self) -> Tuple[bytes, int, int]:
+        # Mirroring is the run's option, not part of the position
+        return (self.key, self.turn, self.count)
+
+    def setstate(self, state: Tuple[bytes, int, int]) -> None:
+        self.key, self.turn, self.count = state
+
+
+class RandomStreams:
+    """One KeyedStream per decision point of a run."""
+
+    def __init__(self, seed: int, antithetic: bool = False):
+        self.seed = seed
+        self.antithetic = antithetic
+        self.streams: Dict[str, KeyedStream] = {
+            point: KeyedStream(f"{seed}:{point}", antithetic) for point in DECISION_POINTS
+        }
+
+    def __getitem__(self, point: str) -> KeyedStream:
+        return self.streams[point]
+
+    def begin_turn(self, turn: int) -> None:
+        for stream in self.streams.values():
+            stream.begin_turn(turn)
+
+    def getstate(self) -> Dict[str, Tuple[bytes, int, int]]:
+        return {point: stream.getstate() for point, stream in self.streams.items()}
+
+    def setstate(self, state: Dict[str, Tuple[bytes, int, int]]) -> None:
+        for point, stream_state in state.items():
+            self.streams[point].setstate(stream_state)
@@ -3,8 +3,11 @@ dyads.py (Manager)
 
 Orchestrates all active Dyads in the simulation.
 """
-from typing import List, Dict, Any, Optional
+import copy
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 from .models import Event, Agent
+from .rng import uses_global_random
 from dyads.base import Dyad
 # Optional Canon Imports (Soul Logic)
 try:
@@ -27,13 +30,105 @@ try:
 except ImportError:
     CeremonialEmergenceDyad = None
 
+import hashlib
 import importlib
 import pkgutil
 import sys
 from pathlib import Path
 
+SAMPLES_DIR = Path(__file__).parent.parent / "dyads" / "samples"
+
+# Hooks a dyad may declare in `hooks`; throw hooks also honour `watch_throwers` / `watch_targets`
+TURN_HOOKS = ("on_turn_start", "on_turn_end")
+THROW_HOOKS = ("on_target_selected", "on_hit", "check_interception")
+
+# Dyad classes already warned about drawing from the global `random`
+_GLOBAL_RANDOM_WARNED: set = set()
+
+# Sample dyad classes already reported as loaded (once per class, not per run)
+_LOADED_REPORTED: set = set()
+
+@dataclass
+class _SamplePlugin:
+    """One imported dyads/samples/ file and the dyad classes it defined."""
+    mtime_ns: int
+    size: int
+    digest: str
+    classes: List[type]
+
+# Process-wide plugin registry: each sample file is imported once, and again
+# only when its contents change (mtime/size, then hash)
+_SAMPLE_REGISTRY: Dict[Path, _SamplePlugin] = {}
+
+def _import_sample_dyads(file_path: Path) -> List[type]:
+    """Executes one sample file and returns the dyad classes it defines."""
+    classes: List[type] = []
+    module_name = file_path.stem
+    try:
+        # Import the module
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            
+            # Scan for classes
+            for attr_name in dir(module):
+                attr = getattr(module, attr_name)
+                if isinstance(attr, type) and hasattr(attr, "check_requirements"):
+                    classes.append(attr)
+
+    except Exception as e:
+        print(f"⚠️ Failed to load sample dyad {module_name}: {e}")
+    return classes
+
+def load_sample_dyad_classes(samples_dir: Path = SAMPLES_DIR) -> List[type]:
+    """
+    Returns every dyad class (anything with a `check_requirements`) defined
+    in dyads/samples/*.py. Files are imported once per process and cached;
+    a file is re-imported when its mtime or size changes and its hash with
+    it, so repeated runs only pay for a stat per file.
+    """
+    classes: List[type] = []
+    if not samples_dir.exists():
+        return classes
+
+    # Add to path to allow sibling imports
+    if str(samples_dir) not in sys.path:
+        sys.path.append(str(samples_dir))
+
+    samples_dir = samples_dir.resolve()
+    seen = set()
+    for file_path in samples_dir.glob("*.py"):
+        if file_path.name.startswith("_"):
+            continue
+
+        seen.add(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        entry = _SAMPLE_REGISTRY.get(file_path)
+        if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            if entry is None or entry.digest != digest:
+                entry = _SamplePlugin(stat.st_mtime_ns, stat.st_size, digest, _import_sample_dyads(file_path))
+            else:
+                # Touched, not edited
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+            _SAMPLE_REGISTRY[file_path] = entry
+        classes.extend(entry.classes)
+
+    # Forget files that were removed from this directory
+    for key in [k for k in _SAMPLE_REGISTRY if k.parent == samples_dir and k not in seen]:
+        del _SAMPLE_REGISTRY[key]
+    return classes
+
+def clear_sample_registry() -> None:
+    """Forgets every cached sample file: the next load re-imports them all."""
+    _SAMPLE_REGISTRY.clear()
+
 class DyadManager:
-    def __init__(self, roster: Dict[str, Agent]):
+    def __init__(self, roster: Dict[str, Agent], sample_classes: Optional[List[type]] = None):
         self.dyads: List[Dyad] = []
         
         # Auto-detect and initialize known dyads
@@ -54,66 +149,120 @@ class DyadManager:
         if CeremonialEmergenceDyad and "Oracle" in roster and "Mico" in roster:
             self.dyads.append(CeremonialEmergenceDyad())
 
-        # 5. Dynamic Sample Loading
-        self._load_sample_dyads(roster)
+        # 5. Dynamic Sample Loading (pre-loaded classes skip the re-import)
+        self._load_sample_dyads(roster, sample_classes)
+        self._warn_global_random()
+        self._build_dispatch()
 
-    def _load_sample_dyads(self, roster: Dict[str, Agent]) -> None:
-        """Dynamically load dyads from dyads/samples/"""
-        samples_dir = Path(__file__).parent.parent / "dyads" / "samples"
-        if not samples_dir.exists():
-            return
+    def _load_sample_dyads(self, roster: Dict[str, Agent], sample_classes: Optional[List[type]] = None) -> None:
+        """Instantiate the sample dyads (dyads/samples/) whose requirements are met"""
+        if sample_classes is None:
+            sample_classes = load_sample_dyad_classes()
 
-        # Add to path temporarily to allow imports
-        if str(samples_dir) not in sys.path:
-            sys.path.append(str(samples_dir))
+        for attr in sample_classes:
+            # Check requirements
+            try:
+                required = attr.check_requirements(roster)
+            except Exception as e:
+                print(f"⚠️ Failed to load sample dyad {attr.__module__}: {e}")
+                continue
+            if required:
+                # Instantiate and add
+                try:
+                    self.dyads.append(attr())
+                except Exception as e:
+                    print(f"⚠️ Failed to instantiate {attr.__name__}: {e}")
+                    continue
+                if attr not in _LOADED_REPORTED:
+                    _LOADED_REPORTED.add(attr)
+                    print(f"✨ Custom Dyad Loaded: {attr.__name__}")
+
+    def _build_dispatch(self) -> None:
+        """
+        Precomputes which dyads each hook calls. A dyad subscribes to the
+        hooks in its `hooks` (default: every hook method it has); throw hooks
+        only reach it when the thrower is in its `watch_throwers` or the
+        target in its `watch_targets` (no watch lists: every throw).
+        """
+        subscribed: Dict[str, List[Tuple[int, Any]]] = {hook: [] for hook in TURN_HOOKS + THROW_HOOKS}
+        for index, dyad in enumerate(self.dyads):
+            hooks = getattr(dyad, "hooks", None)
+            for hook in subscribed:
+                if (hooks is None or hook in hooks) and callable(getattr(dyad, hook, None)):
+                    subscribed[hook].append((index, dyad))
 
-        for file_path in samples_dir.glob("*.py"):
-            if file_path.name.startswith("_"):
+        self._turn_dispatch: Dict[str, List[Any]] = {hook: [dyad for _, dyad in subscribed[hook]] for hook in TURN_HOOKS}
+        # Throw hooks: (hook, agent) -> [(index, dyad)], merged per call (O(hooks x agents) tables)
+        self._every_throw: Dict[str, List[Tuple[int, Any]]] = {hook: [] for hook in THROW_HOOKS}
+        self._by_thrower: Dict[Tuple[str, str], List[Tuple[int, Any]]] = {}
+        self._by_target: Dict[Tuple[str, str], List[Tuple[int, Any]]] = {}
+        for hook in THROW_HOOKS:
+            for index, dyad in subscribed[hook]:
+                throwers = getattr(dyad, "watch_throwers", None)
+                targets = getattr(dyad, "watch_targets", None)
+                if throwers is None and targets is None:
+                    self._every_throw[hook].append((index, dyad))
+                    continue
+                for name in throwers or ():
+                    self._by_thrower.setdefault((hook, name), []).append((index, dyad))
+                for name in targets or ():
+                    self._by_target.setdefault((hook, name), []).append((index, dyad))
+        self._every_throw_dyads: Dict[str, List[Any]] = {
+            hook: [dyad for _, dyad in subscribed] for hook, subscribed in self._every_throw.items()
+        }
+
+    def _dispatch(self, hook: str, thrower_id: str, target_id: str) -> List[Any]:
+        """Dyads subscribed to a throw hook for this thrower and target, in load order."""
+        by_thrower = self._by_thrower.get((hook, thrower_id))
+        by_target = self._by_target.get((hook, target_id))
+        if by_thrower is None and by_target is None:
+            return self._every_throw_dyads[hook]
+        merged = dict(self._every_throw[hook])
+        merged.update(by_thrower or ())
+        merged.update(by_target or ())
+        return [merged[index] for index in sorted(merged)]
+
+    def _warn_global_random(self) -> None:
+        """Dyads should roll on ctx.rng_for(name): the global `random` breaks seed replay."""
+        for dyad in self.dyads:
+            cls = type(dyad)
+            if cls in _GLOBAL_RANDOM_WARNED:
                 continue
-            
-            module_name = file_path.stem
-            try:
-                # Import the module
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    # Scan for classes
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if isinstance(attr, type) and hasattr(attr, "check_requirements"):
-                            # Check requirements
-                            if attr.check_requirements(roster):
-                                # Instantiate and add
-                                try:
-                                    self.dyads.append(attr())
-                                    print(f"✨ Custom Dyad Loaded: {attr.__name__}")
-                                except Exception as e:
-                                    print(f"⚠️ Failed to instantiate {attr.__name__}: {e}")
+            if uses_global_random(cls):
+                _GLOBAL_RANDOM_WARNED.add(cls)
+                print(f"⚠️ Dyad {cls.__name__} uses the global `random`: same-seed runs may differ. Use ctx.rng_for(name) instead.")
 
-            except Exception as e:
-                print(f"⚠️ Failed to load sample dyad {module_name}: {e}")
+    def get_state(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Snapshot of every dyad's internal attributes (checkpoints)."""
+        return [(type(dyad).__name__, copy.deepcopy(vars(dyad))) for dyad in self.dyads]
+
+    def set_state(self, states: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Restores a get_state() snapshot onto the same set of dyads."""
+        names = [type(dyad).__name__ for dyad in self.dyads]
+        if names != [name for name, _ in states]:
+            raise ValueError(f"Checkpoint dyads {[name for name, _ in states]} do not match active dyads {names}")
+        for dyad, (_, attrs) in zip(self.dyads, states):
+            vars(dyad).update(copy.deepcopy(attrs))
 
     def on_turn_start(self, ctx: Any) -> List[Event]:
         events = []
-        for dyad in self.dyads:
+        for dyad in self._turn_dispatch["on_turn_start"]:
             events.extend(dyad.on_turn_start(ctx))
         return events
 
     def on_target_selected(self, ctx: Any, thrower_id: str, target_id: str) -> None:
-        for dyad in self.dyads:
+        for dyad in self._dispatch("on_target_selected", thrower_id, target_id):
             dyad.on_target_selected(ctx, thrower_id, target_id)
 
     def on_hit(self, ctx: Any, thrower_id: str, target_id: str) -> List[Event]:
         events = []
-        for dyad in self.dyads:
+        for dyad in self._dispatch("on_hit", thrower_id, target_id):
             events.extend(dyad.on_hit(ctx, thrower_id, target_id))
         return events
 
     def on_turn_end(self, ctx: Any) -> List[Event]:
         events = []
-        for dyad in self.dyads:
+        for dyad in self._turn_dispatch["on_turn_end"]:
             events.extend(dyad.on_turn_end(ctx))
         return events
 
@@ -122,9 +271,8 @@ class DyadManager:
         Polls dyads to see if any interception occurs (e.g. Twin Rescue).
         Returns the new target ID if intercepted, else None.
         """
-        for dyad in self.dyads:
-            if hasattr(dyad, "check_interception"):
-                new_target = dyad.check_interception(ctx, thrower_id, target_id, rng)
-                if new_target:
-                    return new_target
+        for dyad in self._dispatch("check_interception", thrower_id, target_id):
+            new_target = dyad.check_interception(ctx, thrower_id, target_id, rng)
+            if new_target:
+                return new_target
         return None
@@ -0,0 +1,514 @@
+"""
+exact_engine.py
+Exact landed/taken expectations for dyad-free rosters (dynamic programming).
+
+Without dyads or a scenario, a turn of run_simulation is a Markov step. The
+random choices are the uniform thrower and target, compute_p_hit, Janus'
+paradox reroll, the 25% ricochet with its Quinn-capped weighted target, and
+the Weaver net. Between turns the only thing that carries over is a small
+state: Ace's spite meter, Kryssie's beer state (bonus, frame, accuracy after a
+knock), Weaver turns left, Janus' budget and the Bankai meters/durations.
+solve_exact propagates the probability of every reachable state turn by
+turn. Alongside it goes the first and second moment of each agent's
+counters, which gives exact means and variances (what `snowball.py batch`
+estimates from thousands of seeds) in one pass.
+
+Rules come from the same code the engine uses: the prologue is a zero-turn
+run, turn-start decay and Bankai go through mechanics / BankaiManager on
+scratch agents, and p_hit through mechanics.compute_p_hit. Only the beer
+knock (a closure in iter_simulation) is restated here. Expectations are
+over seeds; the seed 9999 ritual turns are not modelled.
+
+Cost follows the number of reachable states, not the turn count. A plain
+roster has one state and solves in milliseconds. The canon roster (spite x
+Janus' budget x both Bankai meters) reaches about 11,000 states after 12
+turns (seconds) and 30,000 after 20 (minutes). `prune=eps` drops states
+whose probability falls below eps. On the canon roster at 12 turns, 1e-10
+halves the time and moves the means by about 4e-7. The result reports the
+mass dropped and a bound on the error it puts on every mean
+(`mean_error_bound`).
+
+    result = solve_exact(load_roster(Path("characters")), turns=20)
+    result.landed_mean["Ace"], result.landed_var["Ace"]
+"""
+
+import copy
+import dataclasses
+import types
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import mechanics
+from .bankai_manager import BankaiManager, BankaiState
+from .dyad_manager import DyadManager
+from .models import Agent
+from .vector_engine import UnsupportedRosterError
+
+RICOCHET_CHANCE = 0.25  # run_simulation: roll_ric < 0.25
+NET_SIZES = (2, 3, 4)  # rng.randint(2, 4)
+QUINN_NAME = "Quinn"
+QUINN_CAP = 0.45  # mechanics.pick_ricochet_targets default
+
+# knock_beer_and_summon_weaver
+WEAVER_TURNS = 5
+KNOCK_ACCURACY_BONUS = 0.08
+
+# The CLI warns above this many turns without --prune (canon rosters take minutes)
+EXACT_TURNS_WARN = 20
+
+# Most a counter grows in one turn (a 4-agent snow net credits its thrower 4 times)
+MAX_COUNT_PER_TURN = max(NET_SIZES)
+
+# Spite / beer values are merged at this precision (paths that only differ
+# in the last bits of the spite meter are the same state). Bankai meters
+# move in fixed steps and are kept as the engine computes them, up to 1.0.
+STATE_DIGITS = 12
+
+# (spite, kryssie holding, kryssie bonus, kryssie ontological, kryssie accuracy,
+#  janus budget, weaver turns left, BankaiState fields)
+State = Tuple[Any, ...]
+# (counter, E[delta], E[delta^2]) per unit of probability
+Moments = Tuple[Tuple[int, float, float], ...]
+# ((thrower, outcome), expected count) per unit of probability
+Counts = List[Tuple[Tuple[str, str], float]]
+
+
+@dataclass
+class ExactResult:
+    names: List[str]
+    turns: int
+    landed_mean: Dict[str, float]
+    landed_var: Dict[str, float]
+    taken_mean: Dict[str, float]
+    taken_var: Dict[str, float]
+    outcomes: Dict[str, Dict[str, float]]  # thrower -> outcome -> expected count (prologue included)
+    states: int  # most distinct states held at one turn boundary
+    dropped_mass: float = 0.0  # probability pruned away (prune=eps)
+    mean_error_bound: float = 0.0  # every mean is low by at most this (pruning)
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        totals: Dict[str, float] = defaultdict(float)
+        for counts in self.outcomes.values():
+            for outcome, expected in counts.items():
+                totals[outcome] += expected
+        return {
+            "turns": self.turns,
+            "states": self.states,
+            "dropped_mass": self.dropped_mass,
+            "mean_error_bound": self.mean_error_bound,
+            "outcomes": dict(sorted(totals.items(), key=lambda kv: -kv[1])),
+            "agents": {
+                name: {
+                    "landed": {"mean": self.landed_mean[name], "var": self.landed_var[name]},
+                    "taken": {"mean": self.taken_mean[name], "var": self.taken_var[name]},
+                    "outcomes": dict(self.outcomes.get(name, {})),
+                }
+                for name in self.names
+            },
+        }
+
+
+BANKAI_FIELDS = tuple(f.name for f in dataclasses.fields(BankaiState))
+
+
+def _r(x: float) -> float:
+    return round(x, STATE_DIGITS)
+
+
+def _bankai_tuple(state: BankaiState) -> Tuple[Any, ...]:
+    return tuple(getattr(state, name) for name in BANKAI_FIELDS)
+
+
+class _Model:
+    """One turn of iter_simulation as a distribution over next states."""
+
+    def __init__(self, roster: Dict[str, Agent], weaver_bankai: bool, weaver_intensity: float, resonance_debuff: float):
+        self.roster = {name: copy.deepcopy(agent) for name, agent in roster.items()}  # scratch agents
+        self.agents = list(self.roster.values())
+        self.names = [a.name for a in self.agents]
+        self.n = len(self.agents)
+        ids = {name: i for i, name in enumerate(self.names)}
+        self.ace = ids.get("Ace")
+        self.janus = ids.get("Janus")
+        self.kryssie = ids.get("Kryssie")
+        self.quinn = ids.get(QUINN_NAME)
+        self.bankai = BankaiManager(self.roster)
+        self.weaver_bankai = weaver_bankai
+        self.weaver_intensity = weaver_intensity
+        self.resonance_debuff = resonance_debuff
+        self._transitions: Dict[State, Tuple[Tuple[Tuple[State, float, Moments], ...], Counts]] = {}
+        self._nets: Dict[Tuple[int, int], Dict[frozenset, float]] = {}
+        self._hits: Dict[Tuple[State, int, int, bool], Tuple[State, Counts]] = {}
+        self._ricochets: Dict[int, List[Tuple[int, float]]] = {}
+        self._meters: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+        self._net_stats: Dict[int, Tuple[Moments, Counts]] = {}
+
+        if self.quinn is not None and 1.0 + self.agents[self.quinn].stray_magnet < 0:
+            raise UnsupportedRosterError("Roster is not supported: negative Quinn ricochet weight")
+
+    # --- State <-> scratch agents ---
+
+    def initial_state(self) -> State:
+        ace = self.agents[self.ace] if self.ace is not None else None
+        k = self.agents[self.kryssie] if self.kryssie is not None else None
+        janus = self.agents[self.janus] if self.janus is not None else None
+        return self._with((
+            _r(ace.spite_meter) if ace else 0.0,
+            k.holding_beer if k else False,
+            _r(k.beer_dodge_bonus) if k else 0.0,
+            k.frame == "ONTOLOGICAL" if k else False,
+            _r(k.accuracy) if k else 0.0,
+            janus.paradox_budget if janus else 0,
+            0,
+            _bankai_tuple(BankaiState()),
+        ))
+
+    def _load(self, state: State) -> None:
+        spite, holding, bonus, onto, k_acc, budget, _, _ = state
+        for agent in self.agents:
+            agent.accuracy_mod = 1.0
+            agent.dodge_mod = 1.0
+        if self.ace is not None:
+            self.agents[self.ace].spite_meter = spite
+        if self.kryssie is not None:
+            k = self.agents[self.kryssie]
+            k.holding_beer = holding
+            k.beer_dodge_bonus = bonus
+            k.frame = "ONTOLOGICAL" if onto else "COMBAT"
+            k.accuracy = k_acc
+        if self.janus is not None:
+            self.agents[self.janus].paradox_budget = budget
+
+    @staticmethod
+    def _with(state: State, **changes: Any) -> State:
+        spite, holding, bonus, onto, k_acc, budget, weaver, bankai = state
+        values = dict(spite=spite, holding=holding, bonus=bonus, onto=onto, k_acc=k_acc,
+                      budget=budget, weaver=weaver, bankai=bankai)
+        values.update(changes)
+        if values["holding"] and values["onto"]:
+            # Sipping Kryssie is ONTOLOGICAL: never hit, so never knocked, and
+            # her dodge bonus is never read again. One state for all bonuses.
+            values["bonus"] = 0.0
+        return (
+            _r(values["spite"]), values["holding"], _r(values["bonus"]), values["onto"], _r(values["k_acc"]),
+            values["budget"], values["weaver"], values["bankai"],
+        )
+
+    # --- Pieces of a turn ---
+
+    def _landed(self, state: State, credit: int, victim: int, direct: bool) -> Tuple[State, Counts]:
+        """State after `credit` lands on `victim` (spite, beer knock, Bankai meters)."""
+        key = (state, credit, victim, direct)
+        cached = self._hits.get(key)
+        if cached is not None:
+            return cached
+        changes: Dict[str, Any] = {}
+        events: Counts = []
+        if victim == self.ace:
+            ace = self.agents[self.ace]
+            changes["spite"] = mechanics.clamp(state[0] + ace.spite_gain_on_hit)
+        if victim == self.kryssie and state[1]:
+            # knock_beer_and_summon_weaver
+            changes.update(holding=False, onto=False, weaver=WEAVER_TURNS, bonus=0.0,
+                           k_acc=mechanics.clamp(state[4] + KNOCK_ACCURACY_BONUS))
+            events.append((("Weaver", "WEAVER_DESCENDS"), 1.0))
+        if direct:
+            bankai = self._on_hit(state[7], credit, victim)
+            if bankai != state[7]:
+                changes["bankai"] = bankai
+        result = (self._with(state, **changes) if changes else state), events
+        self._hits[key] = result
+        return result
+
+    def _on_hit(self, bankai: Tuple[Any, ...], credit: int, victim: int) -> Tuple[Any, ...]:
+        """BankaiManager.on_hit for a direct hit, on the state's Bankai tuple."""
+        key = (bankai, credit, victim)
+        cached = self._meters.get(key)
+        if cached is None:
+            self.bankai.state = BankaiState(*bankai)
+            self.bankai.on_hit(None, self.names[credit], self.names[victim])
+            meters = self.bankai.state
+            # Any meter >= 1.0 triggers at the next turn start and resets
+            meters.ace_focus = min(meters.ace_focus, 1.0)
+            meters.mega_audit = min(meters.mega_audit, 1.0)
+            cached = self._meters[key] = _bankai_tuple(meters)
+        return cached
+
+    def _pick_weights(self, pool: List[int]) -> List[Tuple[int, float]]:
+        """mechanics.pick_ricochet_targets_ids, one draw: (id, probability) over `pool`."""
+        weights = [1.0] * len(pool)
+        q_idx = pool.index(self.quinn) if self.quinn in pool else None
+        if q_idx is not None:
+            weights[q_idx] += self.agents[self.quinn].stray_magnet
+        total = sum(weights)
+        if total <= 0:
+            return [(i, 1.0 / len(pool)) for i in pool]
+        if q_idx is not None and weights[q_idx] / total > QUINN_CAP:
+            other = total - weights[q_idx]
+            weights[q_idx] = max(0.01, (QUINN_CAP * other) / (1.0 - QUINN_CAP))
+            total = sum(weights)
+        return [(i, w / total) for i, w in zip(pool, weights)]
+
+    def _ricochet(self, thrower: int) -> List[Tuple[int, float]]:
+        """Single ricochet target after `thrower` misses: (id, probability)."""
+        picks = self._ricochets.get(thrower)
+        if picks is None:
+            picks = self._ricochets[thrower] = self._pick_weights([a for a in range(self.n) if a != thrower])
+        return picks
+
+    def _net(self, thrower: int, size: int) -> Dict[frozenset, float]:
+        """Snow net of `size` distinct targets: probability of each target set."""
+        key = (thrower, size)
+        if key not in self._nets:
+            sets: Dict[frozenset, float] = defaultdict(float)
+
+            def draw(picked: Tuple[int, ...], prob: float) -> None:
+                pool = [i for i in range(self.n) if i != thrower and i not in picked]
+                if len(picked) == size or not pool:
+                    sets[frozenset(picked)] += prob
+                    return
+                for i, p in self._pick_weights(pool):
+                    draw(picked + (i,), prob * p)
+
+            draw((), 1.0)
+            self._nets[key] = dict(sets)
+        return self._nets[key]
+
+    def _net_moments(self, thrower: int) -> Tuple[Moments, Counts]:
+        """Counter moments and expected outcome counts of a net after `thrower` misses (size 2-4)."""
+        cached = self._net_stats.get(thrower)
+        if cached is None:
+            n = self.n
+            name = self.names[thrower]
+            credit = self.kryssie if self.kryssie is not None else thrower
+            e1: Dict[int, float] = defaultdict(float)
+            e2: Dict[int, float] = defaultdict(float)
+            labels: Dict[Tuple[str, str], float] = defaultdict(float)
+            for size in NET_SIZES:
+                for targets, p_set in self._net(thrower, size).items():
+                    p = p_set / len(NET_SIZES)
+                    deltas = {n + a: 1 for a in targets}
+                    deltas[credit] = deltas.get(credit, 0) + len(targets)
+                    for k, d in deltas.items():
+                        e1[k] += p * d
+                        e2[k] += p * d * d
+                    for idx in range(1, len(targets) + 1):
+                        labels[(name, f"SNOW_NET_HIT ({idx}/{len(targets)})")] += p
+            cached = self._net_stats[thrower] = (
+                tuple((k, e1[k], e2[k]) for k in e1),
+                list(labels.items()),
+            )
+        return cached
+
+    def transitions(self, state: State) -> Tuple[Tuple[Tuple[State, float, Moments], ...], Counts]:
+        """
+        (next state, probability, counter moments) and ((thrower, outcome),
+        expected count) for one turn from `state`. Counters are landed
+        (0..n-1) and taken (n..2n-1); moments are summed over the move, not
+        per unit of probability.
+        """
+        cached = self._transitions.get(state)
+        if cached is not None:
+            return cached
+
+        n = self.n
+        out: Dict[State, list] = {}
+        rates: Dict[Tuple[str, str], float] = defaultdict(float)
+
+        def add(p: float, nxt: State, moments: Moments, events: Counts) -> None:
+            if p <= 0.0:
+                return
+            slot = out.get(nxt)
+            if slot is None:
+                slot = out[nxt] = [0.0, defaultdict(float), defaultdict(float)]
+            slot[0] += p
+            for k, e1, e2 in moments:
+                slot[1][k] += p * e1
+                slot[2][k] += p * e2
+            for event, count in events:
+                rates[event] += p * count
+
+        # Turn start: mods reset, spite decay, Weaver countdown, Bankai
+        self._load(state)
+        mechanics.apply_turn_decay(self.roster)
+        weaver = state[6] - 1 if state[6] > 0 else 0
+        self.bankai.state = BankaiState(*state[7])
+        start_events = [(e.thrower, e.outcome) for e in self.bankai.on_turn_start(types.SimpleNamespace(tick=0))]
+        for event in start_events:
+            rates[event] += 1.0
+        bankai = _bankai_tuple(self.bankai.state)
+        spite = self.agents[self.ace].spite_meter if self.ace is not None else state[0]
+        base = self._with(state, spite=spite, weaver=weaver, bankai=bankai)
+
+        weaver_active = weaver > 0
+        debuff = self.resonance_debuff if (weaver_active and self.weaver_bankai) else 0.0
+        frames = [a.frame for a in self.agents]
+
+        for i in range(n):
+            thrower = self.agents[i]
+            name = self.names[i]
+            p_thrower = 1.0 / n
+
+            if i == self.kryssie and thrower.holding_beer:
+                bonus = mechanics.clamp(thrower.beer_dodge_bonus + thrower.beer_dodge_bonus_step, 0.0, thrower.beer_dodge_bonus_cap)
+                add(p_thrower, self._with(base, onto=True, bonus=bonus), (), [(("Kryssie", "BEER_SIP"), 1.0)])
+                continue
+
+            missed: Dict[State, float] = defaultdict(float)
+            for j in range(n):
+                if j == i:
+                    continue
+                p_pair = p_thrower / (n - 1)
+                if frames[j] == "ONTOLOGICAL":
+                    add(p_pair, base, (), [((name, "LAYER_EXEMPTION"), 1.0)])
+                    continue
+
+                # Janus' paradox reroll spends budget; the fresh roll has the same odds
+                branches = [(1.0, base)]
+                if i == self.janus and base[5] > 0:
+                    chance = thrower.paradox_chance
+                    branches = [(chance, self._with(base, budget=base[5] - 1)), (1.0 - chance, base)]
+
+                for p_branch, st in branches:
+                    p = p_pair * p_branch
+                    if j == self.janus and self.agents[j].untouchable_while_budget and st[5] > 0:
+                        add(p, self._with(st, budget=st[5] - 1), (), [((name, "UNTOUCHABLE"), 1.0)])
+                        continue
+
+                    p_hit = mechanics.compute_p_hit(
+                        self.roster, thrower, self.agents[j],
+                        weaver_active=weaver_active,
+                        weaver_intensity=self.weaver_intensity,
+                        resonance_debuff=debuff,
+                    )
+                    nxt, events = self._landed(st, i, j, direct=True)
+                    add(p * p_hit, nxt, ((i, 1, 1), (n + j, 1, 1)), [((name, "HIT"), 1.0)] + events)
+
+                    missed[st] += p * (1.0 - p_hit)
+
+            # What follows a miss depends on the thrower only: once per state
+            for st, p_miss in missed.items():
+                if weaver_active:
+                    # Nets never change the state: one averaged branch
+                    add(p_miss, st, *self._net_moments(i))
+                    continue
+
+                add(p_miss * (1.0 - RICOCHET_CHANCE), st, (), [((name, "MISS"), 1.0)])
+                for a, p_a in self._ricochet(i):
+                    p_ric = p_miss * RICOCHET_CHANCE * p_a
+                    if frames[a] == "ONTOLOGICAL":
+                        add(p_ric, st, (), [((name, "LAYER_EXEMPTION"), 1.0)])
+                        continue
+                    nxt, events = self._landed(st, i, a, direct=False)
+                    add(p_ric, nxt, ((i, 1, 1), (n + a, 1, 1)), [((name, "RICOCHET_HIT"), 1.0)] + events)
+
+        # Compact: every reachable state's moves stay cached for the whole run
+        result = (
+            tuple((nxt, q, tuple((k, e1[k], e2[k]) for k in e1)) for nxt, (q, e1, e2) in out.items()),
+            list(rates.items()),
+        )
+        self._transitions[state] = result
+        return result
+
+
+def solve_exact(
+    roster: Dict[str, Agent],
+    turns: int,
+    mode: str = "open",
+    weaver_bankai: bool = True,
+    weaver_intensity: float = 1.0,
+    resonance_debuff: float = 0.06,
+    dyad_classes: Optional[List[type]] = None,
+    prune: float = 0.0,
+) -> ExactResult:
+    """
+    Exact per-agent landed/taken mean and variance (and expected outcome
+    counts) over `turns` turns, i.e. the limit of run_batch over infinitely
+    many seeds with the same options. Raises UnsupportedRosterError when
+    the roster has active dyads.
+
+    `prune=eps` drops states whose probability is below eps after each
+    turn. The pruned means are low by at most `mean_error_bound`: the
+    dropped mass times the largest value a counter can reach.
+    """
+    from .simulation import run_simulation
+
+    dyads = DyadManager(roster, sample_classes=dyad_classes).dyads
+    if dyads:
+        raise UnsupportedRosterError("Roster is not dyad-free: " + ", ".join(type(d).__name__ for d in dyads))
+
+    # The prologue (and classic-mode roster lock) as the engine plays it
+    prologue, start = run_simulation(
+        0, 0, None, Path("."),
+        roster=roster, dyad_classes=dyad_classes, stats_only=True, mode=mode,
+    )
+    if len(start) < 2:
+        raise UnsupportedRosterError("Roster is not supported: needs at least two agents")
+
+    model = _Model(start, weaver_bankai, weaver_intensity, resonance_debuff)
+    n = model.n
+    counters0 = [float(a.landed) for a in model.agents] + [float(a.taken) for a in model.agents]
+    outcomes: Dict[Tuple[str, str], float] = defaultdict(float)
+    for thrower, counts in prologue.outcomes.items():
+        for outcome, count in counts.items():
+            outcomes[(thrower, outcome)] += count
+
+    # state -> [P(state), E[counter; state], E[counter^2; state]]
+    layer: Dict[State, list] = {model.initial_state(): [1.0, counters0, [c * c for c in counters0]]}
+    peak = 1
+    dropped = 0.0
+    for _ in range(turns):
+        nxt: Dict[State, list] = {}
+        for state, (mass, m1, m2) in layer.items():
+            moves, rates = model.transitions(state)
+            for event, rate in rates:
+                outcomes[event] += mass * rate
+            for target, q, moments in moves:
+                slot = nxt.get(target)
+                if slot is None:
+                    s1 = [q * b for b in m1]
+                    s2 = [q * b for b in m2]
+                    slot = nxt[target] = [q * mass, s1, s2]
+                else:
+                    slot[0] += q * mass
+                    s1 = slot[1] = [a + q * b for a, b in zip(slot[1], m1)]
+                    s2 = slot[2] = [a + q * b for a, b in zip(slot[2], m2)]
+                # (c + d)^2 = c^2 + 2cd + d^2
+                for k, e1, e2 in moments:
+                    s1[k] += e1 * mass
+                    s2[k] += 2.0 * e1 * m1[k] + e2 * mass
+        if prune:
+            for state in [s for s, slot in nxt.items() if slot[0] < prune]:
+                dropped += nxt.pop(state)[0]
+        layer = nxt
+        peak = max(peak, len(layer))
+
+    first = [0.0] * (2 * n)
+    second = [0.0] * (2 * n)
+    for mass, m1, m2 in layer.values():
+        for k in range(2 * n):
+            first[k] += m1[k]
+            second[k] += m2[k]
+    var = [max(0.0, second[k] - first[k] * first[k]) for k in range(2 * n)]
+
+    per_thrower: Dict[str, Dict[str, float]] = defaultdict(dict)
+    for (thrower, outcome), expected in sorted(outcomes.items(), key=lambda kv: -kv[1]):
+        per_thrower[thrower][outcome] = expected
+
+    names = model.names
+    most = max(counters0) + MAX_COUNT_PER_TURN * turns
+    return ExactResult(
+        names=names,
+        turns=turns,
+        landed_mean={name: first[i] for i, name in enumerate(names)},
+        landed_var={name: var[i] for i, name in enumerate(names)},
+        taken_mean={name: first[n + i] for i, name in enumerate(names)},
+        taken_var={name: var[n + i] for i, name in enumerate(names)},
+        outcomes=dict(per_thrower),
+        states=peak,
+        dropped_mass=dropped,
+        mean_error_bound=dropped * most,
+    )
@@ -0,0 +1,85 @@
+"""
+hit_table.py
+Cached hit probabilities (thrower x target).
+
+compute_p_hit re-derived accuracy x mods x Ace spite and effective dodge x
+mods for every throw, although those inputs only change at turn boundaries
+or on hits. p_hit(i, j) is a function of the thrower's accuracy term and
+the target's dodge term (plus the Weaver debuff, which applies to every
+target alike), so HitTable caches those two per-agent terms: the thrower x
+target matrix costs O(n) memory instead of O(n^2) and a lookup is one
+multiply. The RosterTable views invalidate an agent's terms when one of
+its inputs is written (mods, mods reset, spite, beer state, accuracy/dodge).
+
+Values are bit-identical to mechanics.compute_p_hit_ids.
+
+    hit_probability_table(checkpoint.roster, weaver_active=True)
+    # {"Ace": {"Claude": 0.41, ...}, ...}
+"""
+
+from typing import Dict, List, Optional
+
+from . import mechanics
+from .models import Agent
+from .roster_table import RosterTable
+
+
+class HitTable:
+    """Lazily filled per-agent p_hit terms over a RosterTable."""
+
+    def __init__(self, table: RosterTable):
+        self.table = table
+        self.accuracy: List[Optional[float]] = [None] * len(table)
+        self.dodge: List[Optional[float]] = [None] * len(table)
+        table.hit_table = self
+
+    def invalidate(self, i: Optional[int] = None) -> None:
+        """Drops agent `i`'s cached terms (everyone's when None)."""
+        if i is None:
+            self.accuracy = [None] * len(self.table)
+            self.dodge = [None] * len(self.table)
+        else:
+            self.accuracy[i] = None
+            self.dodge[i] = None
+
+    def p_hit(self, thrower: int, target: int, weaver_active: bool = False, weaver_intensity: float = 1.0, resonance_debuff: float = 0.0) -> float:
+        acc = self.accuracy[thrower]
+        if acc is None:
+            acc = self.accuracy[thrower] = mechanics.thrower_accuracy_ids(self.table, thrower)
+        dod = self.dodge[target]
+        if dod is None:
+            dod = self.dodge[target] = mechanics.target_dodge_ids(self.table, target)
+        return mechanics.p_hit_from_parts(acc, dod, weaver_active, weaver_intensity, resonance_debuff)
+
+    def matrix(self, weaver_active: bool = False, weaver_intensity: float = 1.0, resonance_debuff: float = 0.0) -> List[List[Optional[float]]]:
+        """Full thrower x target table by id (None on the diagonal)."""
+        n = len(self.table)
+        return [
+            [
+                None if i == j else self.p_hit(i, j, weaver_active, weaver_intensity, resonance_debuff)
+                for j in range(n)
+            ]
+            for i in range(n)
+        ]
+
+
+def hit_probability_table(
+    roster: Dict[str, Agent],
+    weaver_active: bool = False,
+    weaver_intensity: float = 1.0,
+    resonance_debuff: float = 0.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    p_hit for every thrower/target pair of a roster, e.g. a checkpoint's or
+    a summary's (`iter_simulation(..., checkpoint_at=...)` gives any turn).
+    The roster is read as is: its mods are those it holds (a checkpoint
+    carries the previous turn's). Pass the run's Weaver settings to see the
+    Bankai debuff (`resonance_debuff` only applies with weaver_bankai).
+    """
+    table = RosterTable(list(roster.values()))
+    hits = HitTable(table)
+    names = table.names
+    return {
+        names[i]: {names[j]: p for j, p in enumerate(row) if p is not None}
+        for i, row in enumerate(hits.matrix(weaver_active, weaver_intensity, resonance_debuff))
+    }
@@ -0,0 +1,314 @@
+"""
+incremental.py
+Incremental re-simulation after roster edits.
+
+Tweaking one agent's `accuracy` used to mean re-running every seed from
+turn 1. IncrementalRunner keeps, per seed, keyframes (SimulationCheckpoints
+every few turns) and a ReadLog: the first turn each (agent, field) was read
+or written. After an edit, a seed whose run never read the edited values
+reuses its cached stats; otherwise it resumes from the last keyframe before
+the first read. Results are identical to a fresh run of the edited roster.
+
+    runner = IncrementalRunner(Path("characters"), turns=20, cache_dir=Path(".snowball_cache"))
+    result = runner.run(range(1, 1001))   # full runs, keyframes cached
+    # ...edit characters/quinn.json...
+    result = runner.run(range(1, 1001))   # replays only what the edit touched
+"""
+
+import copy
+import dataclasses
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import Agent, SimulationCheckpoint, SimulationStats, SimulationSummary
+from .roster_table import VIEW_FIELDS, RosterTable
+from .simulation import iter_simulation, load_roster
+from .dyad_manager import load_sample_dyad_classes
+
+# Roster JSON fields whose reads are logged (`name` is the agent's identity)
+TRACKED_FIELDS = frozenset(f.name for f in dataclasses.fields(Agent)) - {"name"}
+
+DEFAULT_KEYFRAME_EVERY = 10
+CACHE_VERSION = 1
+
+FieldKey = Tuple[str, str]  # (agent name, field)
+
+
+class _TracedAgent(Agent):
+    """Agent that reports field reads and writes to its run's ReadLog."""
+    __slots__ = ()
+    _log: "ReadLog"
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in TRACKED_FIELDS:
+            log = type(self)._log
+            key = (object.__getattribute__(self, "name"), name)
+            if key not in log.reads:
+                log.reads[key] = log.tick
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in TRACKED_FIELDS:
+            log = type(self)._log
+            key = (object.__getattribute__(self, "name"), name)
+            if key not in log.writes:
+                log.writes[key] = log.tick
+        object.__setattr__(self, name, value)
+
+    # deepcopy (checkpoints) is the base's: Agent.__deepcopy__ or the
+    # RosterTable view's, both plain untraced Agents read without logging
+
+
+class _TracedColumn(list):
+    """RosterTable column that reports reads and writes by agent id."""
+
+    def __init__(self, values: List[Any], field: str, names: List[str], log: "ReadLog"):
+        super().__init__(values)
+        self.field = field
+        self.names = names
+        self.log = log
+
+    def __getitem__(self, i):
+        key = (self.names[i], self.field)
+        if key not in self.log.reads:
+            self.log.reads[key] = self.log.tick
+        return list.__getitem__(self, i)
+
+    def __setitem__(self, i, value) -> None:
+        ids = range(len(self))[i] if isinstance(i, slice) else (i,)
+        for j in ids:
+            key = (self.names[j], self.field)
+            if key not in self.log.writes:
+                self.log.writes[key] = self.log.tick
+        list.__setitem__(self, i, value)
+
+
+class ReadLog:
+    """
+    First turn each (agent, field) was read / written during one run.
+    Turn 0 is the prologue. iter_simulation attaches it to its roster copy
+    and RosterTable (`read_log=`) and advances `tick` at every turn boundary.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.reads: Dict[FieldKey, int] = {}
+        self.writes: Dict[FieldKey, int] = {}
+        self._traced_classes: Dict[type, type] = {}
+        self._table: Optional[RosterTable] = None
+
+    def attach(self, roster: Dict[str, Agent], table: Optional[RosterTable] = None) -> None:
+        for agent in roster.values():
+            base = type(agent)
+            cls = self._traced_classes.get(base)
+            if cls is None:
+                cls = self._traced_classes[base] = type(
+                    "TracedAgent", (_TracedAgent, base), {"_log": self, "_base": base, "__slots__": ()}
+                )
+            agent.__class__ = cls
+        # The engine reads the table's lists directly
+        self._table = table
+        if table is not None:
+            for field in VIEW_FIELDS:
+                setattr(table, field, _TracedColumn(getattr(table, field), field, table.names, self))
+
+    def detach(self, roster: Dict[str, Agent]) -> None:
+        for agent in roster.values():
+            agent.__class__ = type(agent)._base
+        if self._table is not None:
+            for field in VIEW_FIELDS:
+                setattr(self._table, field, list(getattr(self._table, field)))
+            self._table = None
+
+
+@dataclass
+class SeedRecord:
+    """Everything cached for one seed."""
+    seed: int
+    settings: Dict[str, Any]
+    roster: Dict[str, Dict[str, Any]]  # agent -> field values the run is valid for
+    reads: Dict[FieldKey, int]
+    writes: Dict[FieldKey, int]
+    keyframes: List[SimulationCheckpoint]  # ascending turn
+    stats: SimulationStats
+    version: int = CACHE_VERSION
+
+
+def roster_values(roster: Dict[str, Agent]) -> Dict[str, Dict[str, Any]]:
+    return {name: dataclasses.asdict(agent) for name, agent in roster.items()}
+
+
+@dataclass
+class IncrementalRunner:
+    """
+    Seed-by-seed batch runner with a keyframe cache (in memory, and in
+    `cache_dir` when given). Settings are those of run_batch; changing them
+    invalidates the cache. `replayed` maps each seed of the last run() to the
+    turn it was re-simulated from (1 = full run, None = cache hit).
+    """
+    char_dir: Path
+    turns: int
+    cache_dir: Optional[Path] = None
+    keyframe_every: int = DEFAULT_KEYFRAME_EVERY
+    mode: str = "open"
+    scenario_name: Optional[str] = None
+    audit_mode: str = "transparent"
+    force_ricochet_target: Optional[str] = None
+    use_samples: bool = False
+    weaver_bankai: bool = True
+    weaver_intensity: float = 1.0
+    replayed: Dict[int, Optional[int]] = field(default_factory=dict)
+    _records: Dict[int, SeedRecord] = field(default_factory=dict, repr=False)
+    _dyad_classes: Optional[List[type]] = field(default=None, repr=False)
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "mode": self.mode,
+            "scenario_name": self.scenario_name,
+            "audit_mode": self.audit_mode,
+            "force_ricochet_target": self.force_ricochet_target,
+            "use_samples": self.use_samples,
+            "weaver_bankai": self.weaver_bankai,
+            "weaver_intensity": self.weaver_intensity,
+        }
+
+    def run(self, seeds: Iterable[int]):
+        """Runs (or reuses) every seed against the current roster files; returns a BatchResult."""
+        from .batch import BatchResult, RunSummary
+        roster = load_roster(Path(self.char_dir), use_samples=self.use_samples)
+        if self._dyad_classes is None:
+            self._dyad_classes = load_sample_dyad_classes()
+        self.replayed = {}
+        result = BatchResult()
+
+        for seed in seeds:
+            stats = self.run_seed(seed, roster)
+            mvp = max(stats.landed, key=stats.landed.get) if stats.landed else None
+            result.add(RunSummary(seed=seed, landed=stats.landed, taken=stats.taken, mvp=mvp, outcomes=stats.outcomes))
+        return result
+
+    def run_seed(self, seed: int, roster: Dict[str, Agent]) -> SimulationStats:
+        current = roster_values(roster)
+        record = self._load(seed)
+        if record is None or record.settings != self.settings or set(record.roster) != set(current):
+            return self._simulate(seed, roster, current)
+
+        changed = [
+            (name, key)
+            for name, values in current.items()
+            for key, value in values.items()
+            if record.roster[name].get(key) != value
+        ]
+        if not changed:
+            self.replayed[seed] = None
+            return record.stats
+
+        first_read = min(record.reads.get(key, self.turns + 1) for key in changed)
+        keyframes = [k for k in record.keyframes if k.turn <= first_read]
+        for keyframe in keyframes:
+            self._patch_keyframe(keyframe, record, changed, current)
+        record.keyframes = keyframes
+        record.roster = current
+
+        if first_read > self.turns:
+            # The run never looked at the edited values
+            self.replayed[seed] = None
+            self._save(record)
+            return record.stats
+        if not keyframes:
+            return self._simulate(seed, roster, current)
+        return self._simulate(seed, roster, current, record=record)
+
+    @staticmethod
+    def _patch_keyframe(keyframe: SimulationCheckpoint, record: SeedRecord, changed: List[FieldKey], current: Dict[str, Dict[str, Any]]) -> None:
+        """Carries an edit into a keyframe taken before the edited field was read."""
+        for name, key in changed:
+            # Written before the keyframe without being read: the run's value stands
+            if record.writes.get((name, key), keyframe.turn) < keyframe.turn:
+                continue
+            setattr(keyframe.roster[name], key, copy.deepcopy(current[name][key]))
+
+    def _simulate(self, seed: int, roster: Dict[str, Agent], current: Dict[str, Dict[str, Any]], record: Optional[SeedRecord] = None) -> SimulationStats:
+        log = ReadLog()
+        options = dict(self.settings)
+        turns = options.pop("turns")
+        if record is None:
+            resume = None
+            start = 1
+            keyframes: List[SimulationCheckpoint] = []
+            reads: Dict[FieldKey, int] = {}
+            writes: Dict[FieldKey, int] = {}
+        else:
+            resume = record.keyframes[-1]
+            start = resume.turn
+            keyframes = list(record.keyframes)
+            # The prefix before the keyframe is unchanged, and so are its reads
+            reads = {k: t for k, t in record.reads.items() if t < start}
+            writes = {k: t for k, t in record.writes.items() if t < start}
+
+        log.tick = start
+        summary = None
+        checkpoint_at = range(start + self.keyframe_every if resume else 1, turns + 1, self.keyframe_every)
+        for item in iter_simulation(
+            seed, turns, None, Path(self.char_dir),
+            roster=roster,
+            dyad_classes=self._dyad_classes,
+            stats_only=True,
+            checkpoint_at=checkpoint_at,
+            resume=resume,
+            read_log=log,
+            **options
+        ):
+            if isinstance(item, SimulationCheckpoint):
+                keyframes.append(item)
+            elif isinstance(item, SimulationSummary):
+                summary = item
+
+        for key, tick in log.reads.items():
+            reads.setdefault(key, tick)
+        for key, tick in log.writes.items():
+            writes.setdefault(key, tick)
+        record = SeedRecord(
+            seed=seed,
+            settings=self.settings,
+            roster=current,
+            reads=reads,
+            writes=writes,
+            keyframes=keyframes,
+            stats=summary.stats,
+        )
+        self.replayed[seed] = start
+        self._save(record)
+        return record.stats
+
+    # --- Cache ---
+
+    def _cache_path(self, seed: int) -> Path:
+        return Path(self.cache_dir) / f"seed-{seed}.pkl"
+
+    def _load(self, seed: int) -> Optional[SeedRecord]:
+        record = self._records.get(seed)
+        if record is None and self.cache_dir is not None:
+            path = self._cache_path(seed)
+            if path.exists():
+                try:
+                    with path.open("rb") as f:
+                        record = pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                    record = None
+                if not isinstance(record, SeedRecord) or record.version != CACHE_VERSION:
+                    record = None
+            if record is not None:
+                self._records[seed] = record
+        return record
+
+    def _save(self, record: SeedRecord) -> None:
+        self._records[record.seed] = record
+        if self.cache_dir is not None:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+            with self._cache_path(record.seed).open("wb") as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,332 @@
+"""
+ledger.py
+Skeletor Ledger writers.
+
+The simulation used to reopen the ledger file for every single event.
+LedgerWriter keeps one handle open for the whole run and batches the
+serialized JSONL lines, flushing on a byte or turn threshold and on close.
+The on-disk format is unchanged: one `json.dumps(payload, ensure_ascii=False)`
+line per record, so LedgerParser reads it exactly as before.
+
+AsyncLedgerWriter moves encoding and disk writes onto a background thread.
+
+All writers implement the LedgerSink protocol. For headless runs,
+MemoryLedgerSink keeps payloads in a list (LedgerParser reads it directly)
+and NullLedgerSink discards them without ever touching disk.
+"""
+
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+
+DEFAULT_FLUSH_BYTES = 64 * 1024
+DEFAULT_FLUSH_TURNS = 50
+
+
+class LedgerSink(Protocol):
+    """
+    Destination for ledger payloads (the dicts built by run_simulation).
+    File sinks: LedgerWriter, BinaryLedgerWriter, AsyncLedgerWriter.
+    `records_payloads = False` lets the simulation skip building payloads at all.
+    """
+    records_payloads: bool
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        """Record one ledger payload."""
+        ...
+
+    def end_turn(self) -> None:
+        """Called at every turn boundary."""
+        ...
+
+    def flush(self) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class LedgerWriter:
+    """
+    Buffered, append-only JSONL writer.
+    Lines are encoded eagerly (so later mutation of a payload cannot leak into
+    the ledger) and written to disk in batches.
+    """
+    records_payloads = True
+
+    def __init__(
+        self,
+        path: Path,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_turns: int = DEFAULT_FLUSH_TURNS,
+        index: bool = False,
+    ):
+        self.path = Path(path)
+        self.flush_bytes = flush_bytes
+        self.flush_turns = flush_turns
+        # Optional tick/agent sidecar (ledger_index.py), saved on close.
+        self._index = None
+        if index:
+            from .ledger_index import open_index_for_append
+            self._index = open_index_for_append(self.path, "jsonl")
+            self._pos = self.path.stat().st_size if self.path.exists() else 0
+        self._handle = self.path.open("a", encoding="utf-8")
+        self._buffer: List[str] = []
+        self._buffered_bytes = 0
+        self._turns_since_flush = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._handle is None
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        """Serialize one record and buffer it."""
+        line = json.dumps(payload, ensure_ascii=False) + "\n"
+        if self._index is not None:
+            from .ledger_index import NEWLINE_EXTRA
+            self._index.add(self._pos, payload)
+            self._pos += len(line.encode("utf-8")) + NEWLINE_EXTRA
+        self.write_line(line)
+
+    def write_line(self, line: str) -> None:
+        """Buffer an already-encoded JSONL line (must end with a newline)."""
+        if self._handle is None:
+            raise ValueError(f"Ledger already closed: {self.path}")
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+        if self._buffered_bytes >= self.flush_bytes:
+            self.flush()
+
+    def end_turn(self) -> None:
+        """Signal a turn boundary; flushes every `flush_turns` turns."""
+        self._turns_since_flush += 1
+        if self.flush_turns and self._turns_since_flush >= self.flush_turns:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._handle is None:
+            return
+        if self._buffer:
+            self._handle.write("".join(self._buffer))
+            self._buffer = []
+            self._buffered_bytes = 0
+        self._handle.flush()
+        self._turns_since_flush = 0
+
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._handle.close()
+            self._handle = None
+        if self._index is not None:
+            from .ledger_index import index_path
+            self._index.save(index_path(self.path), self._pos)
+
+    def __enter__(self) -> "LedgerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+DEFAULT_QUEUE_SIZE = 4096
+
+_TURN_MARK = object()
+_CLOSE = object()
+
+
+class _FlushMark:
+    """Queued by AsyncLedgerWriter.flush; set once the writer thread has flushed."""
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class AsyncLedgerWriter:
+    """
+    Opt-in background sink: payload dicts go onto a bounded queue and a writer
+    thread does the JSON encoding and disk I/O (through a LedgerWriter).
+
+    Backpressure: `write` blocks while the queue is full, so a slow disk
+    throttles the simulation instead of growing memory. `flush` and `close`
+    wait for the queue to drain. Payloads must not be mutated after they are submitted.
+    """
+    records_payloads = True
+
+    def __init__(
+        self,
+        path: Path,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_turns: int = DEFAULT_FLUSH_TURNS,
+        writer_cls: Any = LedgerWriter,
+        index: bool = False,
+    ):
+        self.path = Path(path)
+        self._writer = writer_cls(self.path, flush_bytes=flush_bytes, flush_turns=flush_turns, index=index)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, name="ledger-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        self._put(payload)
+
+    def end_turn(self) -> None:
+        self._put(_TURN_MARK)
+
+    def flush(self) -> None:
+        """Waits until everything queued so far is written and flushed to disk."""
+        if self._closed:
+            return
+        mark = _FlushMark()
+        self._put(mark)
+        mark.done.wait()
+        self._raise_pending()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._raise_pending()
+
+    def _put(self, item: Any) -> None:
+        if self._closed:
+            raise ValueError(f"Ledger already closed: {self.path}")
+        self._raise_pending()
+        self._queue.put(item)
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _drain(self) -> None:
+        writer = self._writer
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                break
+            if isinstance(item, _FlushMark):
+                try:
+                    if self._error is None:
+                        writer.flush()
+                except BaseException as e:
+                    self._error = e
+                finally:
+                    item.done.set()
+                continue
+            if self._error is not None:
+                continue  # Keep draining so producers never block forever.
+            try:
+                if item is _TURN_MARK:
+                    writer.end_turn()
+                else:
+                    writer.write(item)
+            except BaseException as e:
+                self._error = e
+        try:
+            writer.close()
+        except BaseException as e:
+            if self._error is None:
+                self._error = e
+
+    def __enter__(self) -> "AsyncLedgerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class MemoryLedgerSink:
+    """
+    Keeps payloads in memory instead of writing a file.
+    Pass it to LedgerParser in place of a path: `LedgerParser(sink).parse()`.
+    The tags list and context dict are copied, so later mutation of an
+    Event cannot rewrite history (same guarantee as an encoded line).
+    """
+    records_payloads = True
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        record = dict(payload)
+        if isinstance(record.get("tags"), (list, tuple)):
+            record["tags"] = list(record["tags"])  # A list, as decoded from a line
+        if isinstance(record.get("context"), dict):
+            record["context"] = dict(record["context"])
+        self.records.append(record)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Records without the LEDGER_HEADER."""
+        return [r for r in self.records if r.get("event_type") != "LEDGER_HEADER"]
+
+    def end_turn(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class NullLedgerSink:
+    """Discards everything; the simulation skips payload construction entirely."""
+    records_payloads = False
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        pass
+
+    def end_turn(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+LEDGER_FORMATS = ("jsonl", "binary")
+
+
+def open_ledger(
+    path: Path,
+    async_io: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    fmt: str = "jsonl",
+    index: bool = False,
+):
+    """
+    Returns the ledger writer for a run.
+    `fmt` selects JSONL or compact SKLB (see ledger_binary.py);
+    `async_io` wraps it in a background writer thread;
+    `index` writes the tick/agent sidecar (see ledger_index.py).
+    """
+    if fmt == "jsonl":
+        writer_cls = LedgerWriter
+    elif fmt == "binary":
+        from .ledger_binary import BinaryLedgerWriter
+        writer_cls = BinaryLedgerWriter
+    else:
+        raise ValueError(f"Unknown ledger format: {fmt} (expected one of {LEDGER_FORMATS})")
+
+    if async_io:
+        return AsyncLedgerWriter(path, queue_size=queue_size, writer_cls=writer_cls, index=index)
+    return writer_cls(path, index=index)
@@ -0,0 +1,521 @@
+"""
+ledger_binary.py
+Compact binary Skeletor Ledger ("SKLB").
+
+Every JSONL event line repeats its key names, agent names, outcome, notes,
+tags and full context. The binary form stores each event as a short record
+of varints plus its three rolls, and moves the repeated text into interned
+tables:
+
+    MAGIC (8 bytes)
+    then a stream of tagged items:
+      'S' u32 len, utf-8       -> string table entry (agent names, outcomes, notes)
+      'G' u32 len, utf-8 json  -> tags table entry (a list)
+      'C' u32 len, utf-8 json  -> context table entry: [context],
+                                  [context, context_id] or [null, context_ref]
+                                  (v1.5 shared turn context)
+      'K' i64                  -> current seed for the records that follow
+      'V' compact record       -> one SNOWBALL_EVENT:v2.0 (see below)
+      'J' u32 len, utf-8 json  -> any other ledger line, verbatim (headers, ...)
+      'R'                      -> reset tables (start of an appended run, or
+                                  once a run has interned `max_table_entries`)
+
+    'V' record: zigzag varint tick delta (from the previous record of the
+    table scope), varint ids of thrower, intended, outcome, actual, notes
+    (strings), tags, context, varint weaver_turns_left, then roll_hit,
+    roll_ricochet, p_hit as little-endian doubles.
+
+Notes, tags and context are interned separately, so a context that changes
+every turn does not make the notes and tags be written again. Table entries
+get ids in order of appearance, so the file can be written and read in a
+single streaming pass. Events whose shape does not fit the record exactly
+are stored as 'J' lines, which keeps conversion back to JSONL byte-for-byte.
+
+Files from the first SKLB writer ('E' fixed records over an 'X' side table
+of [notes, tags, context] entries) are still read.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .ledger import DEFAULT_FLUSH_BYTES, DEFAULT_FLUSH_TURNS
+from .models import FrozenDict
+
+MAGIC = b"SKLB\x00\x01\r\n"
+
+EVENT_TYPE = "SNOWBALL_EVENT:v2.0"
+
+# Key order of the payload built by run_simulation.log_event_to_ledger.
+EVENT_KEYS = (
+    "event_type", "seed", "tick", "thrower", "intended", "outcome", "actual",
+    "notes", "roll_hit", "roll_ricochet", "p_hit", "tags", "context", "weaver_turns_left",
+)
+# v1.5: first event of a turn snapshot names it, later ones reference it.
+EVENT_KEYS_ID = EVENT_KEYS[:13] + ("context_id",) + EVENT_KEYS[13:]
+EVENT_KEYS_REF = EVENT_KEYS[:12] + ("context_ref",) + EVENT_KEYS[13:]
+
+ROLLS = struct.Struct("<ddd")
+SEED = struct.Struct("<q")
+LENGTH = struct.Struct("<I")
+# First-format fixed record ('E'): tick, thrower, intended, outcome, actual,
+# weaver_turns_left, roll_hit, roll_ricochet, p_hit, side
+RECORD = struct.Struct("<iIIIIHdddI")
+
+TAG_STRING = b"S"
+TAG_TAGS = b"G"
+TAG_CONTEXT = b"C"
+TAG_SEED = b"K"
+TAG_COMPACT = b"V"
+TAG_JSON = b"J"
+TAG_RESET = b"R"
+TAG_SIDE = b"X"  # first format, read only
+TAG_EVENT = b"E"  # first format, read only
+
+# Table entries (strings + tags + contexts) a writer interns before it
+# starts a fresh table scope, so long runs do not grow the tables unbounded
+MAX_TABLE_ENTRIES = 1 << 16
+
+# (notes, tags, context, snapshot id): context None -> the id is a context_ref,
+# otherwise a non-None id is the context_id of that context.
+Side = Tuple[str, List[str], Optional[Dict[str, Any]], Optional[int]]
+# (context, snapshot id), as in Side
+ContextEntry = Tuple[Optional[Dict[str, Any]], Optional[int]]
+
+
+def is_binary_ledger(path: Path) -> bool:
+    """True if the file starts with the SKLB magic."""
+    try:
+        with Path(path).open("rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _fits_record(payload: Dict[str, Any]) -> bool:
+    """Only canonical event payloads become compact records; the rest stay JSON."""
+    keys = tuple(payload.keys())
+    if keys == EVENT_KEYS_ID or keys == EVENT_KEYS_REF:
+        if type(payload.get("context_id", payload.get("context_ref"))) is not int:
+            return False
+    elif keys != EVENT_KEYS:
+        return False
+    if payload["event_type"] != EVENT_TYPE:
+        return False
+    for key in ("seed", "tick", "weaver_turns_left"):
+        if type(payload[key]) is not int:
+            return False
+    for key in ("thrower", "intended", "outcome", "actual", "notes"):
+        if type(payload[key]) is not str:
+            return False
+    for key in ("roll_hit", "roll_ricochet", "p_hit"):
+        if type(payload[key]) is not float:
+            return False
+    return payload["weaver_turns_left"] >= 0 and -2**63 <= payload["seed"] < 2**63
+
+
+def _put_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _get_varint(buf: Any, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def read_compact_record(buf: Any, pos: int) -> Tuple[List[int], Tuple[float, float, float], int]:
+    """
+    Decodes the body of a 'V' record at `pos` (after its tag): the nine
+    varints (tick delta still zigzagged), the three rolls and the next offset.
+    """
+    fields = []
+    for _ in range(9):
+        n, pos = _get_varint(buf, pos)
+        fields.append(n)
+    rolls = ROLLS.unpack_from(buf, pos)
+    return fields, rolls, pos + ROLLS.size
+
+
+def _zigzag(n: int) -> int:
+    return n << 1 if n >= 0 else ((-n) << 1) - 1
+
+
+def _unzigzag(n: int) -> int:
+    return (n >> 1) ^ -(n & 1)
+
+
+class BinaryLedgerWriter:
+    """
+    Drop-in replacement for LedgerWriter that writes SKLB.
+    Appending to a non-empty SKLB file starts a fresh table scope ('R'), and
+    so does a run once it has interned `max_table_entries` table entries.
+    """
+    records_payloads = True
+
+    def __init__(
+        self,
+        path: Path,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_turns: int = DEFAULT_FLUSH_TURNS,
+        index: bool = False,
+        max_table_entries: int = MAX_TABLE_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.flush_bytes = flush_bytes
+        self.flush_turns = flush_turns
+        self.max_table_entries = max_table_entries
+        existing = self.path.stat().st_size if self.path.exists() else 0
+        if existing and not is_binary_ledger(self.path):
+            raise ValueError(f"Refusing to append binary records to a non-SKLB ledger: {self.path}")
+        self._index = None
+        if index:
+            from .ledger_index import open_index_for_append
+            self._index = open_index_for_append(self.path, "binary")
+        self._handle = self.path.open("ab")
+        self._buffer = bytearray(TAG_RESET if existing else MAGIC)
+        self._pos = existing + len(self._buffer)  # absolute offset of the next byte
+        self._turns_since_flush = 0
+        self._seed: Optional[int] = None
+        self._reset_tables()
+
+    def _reset_tables(self) -> None:
+        self._strings: Dict[str, int] = {}
+        self._tags: Dict[str, int] = {}
+        self._contexts: Dict[str, int] = {}
+        self._tag_offsets: List[int] = []
+        self._context_offsets: List[int] = []
+        self._entries = 0
+        self._tick = 0
+        # Read-only contexts (a turn's TurnContext) are shared by the turn's events
+        self._last_context: Optional[Tuple[Any, Optional[int], int]] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._handle is None
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        if _fits_record(payload):
+            self._write_event(payload)
+        else:
+            self.write_json_line(json.dumps(payload, ensure_ascii=False), payload)
+
+    def write_json_line(self, line: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        """Store a ledger line verbatim (no trailing newline)."""
+        if self._index is not None:
+            if payload is None:
+                try:
+                    payload = json.loads(line)
+                except json.JSONDecodeError:
+                    payload = None
+            if isinstance(payload, dict):
+                self._index.add(self._pos, payload)
+        self._append(TAG_JSON + self._blob(line))
+
+    def _write_event(self, p: Dict[str, Any]) -> None:
+        out = bytearray()
+        if self._entries >= self.max_table_entries:
+            out += TAG_RESET
+            self._reset_tables()
+        if p["seed"] != self._seed:
+            self._seed = p["seed"]
+            out += TAG_SEED + SEED.pack(self._seed)
+        ids = [self._intern(out, p[k]) for k in ("thrower", "intended", "outcome", "actual", "notes")]
+        tags_id = self._intern_json(out, TAG_TAGS, self._tags, self._tag_offsets, p["tags"])
+        context_id = self._intern_context(out, p)
+        if self._index is not None:
+            self._index.add(self._pos + len(out), p, (self._tag_offsets[tags_id], self._context_offsets[context_id]))
+        out += TAG_COMPACT
+        delta = p["tick"] - self._tick
+        self._tick = p["tick"]
+        _put_varint(out, _zigzag(delta))
+        for n in ids:
+            _put_varint(out, n)
+        _put_varint(out, tags_id)
+        _put_varint(out, context_id)
+        _put_varint(out, p["weaver_turns_left"])
+        out += ROLLS.pack(p["roll_hit"], p["roll_ricochet"], p["p_hit"])
+        self._append(out)
+
+    def _intern(self, out: bytearray, s: str) -> int:
+        sid = self._strings.get(s)
+        if sid is None:
+            sid = self._strings[s] = len(self._strings)
+            self._entries += 1
+            out += TAG_STRING + self._blob(s)
+        return sid
+
+    def _intern_json(self, out: bytearray, tag: bytes, table: Dict[str, int], offsets: List[int], value: Any) -> int:
+        text = json.dumps(value, ensure_ascii=False)
+        entry_id = table.get(text)
+        if entry_id is None:
+            entry_id = table[text] = len(table)
+            self._entries += 1
+            offsets.append(self._pos + len(out))
+            out += tag + self._blob(text)
+        return entry_id
+
+    def _intern_context(self, out: bytearray, p: Dict[str, Any]) -> int:
+        if "context_ref" in p:
+            return self._intern_json(out, TAG_CONTEXT, self._contexts, self._context_offsets, [None, p["context_ref"]])
+        context = p["context"]
+        snapshot_id = p.get("context_id")
+        last = self._last_context
+        if last is not None and last[0] is context and last[1] == snapshot_id:
+            return last[2]
+        entry = [context] if snapshot_id is None else [context, snapshot_id]
+        entry_id = self._intern_json(out, TAG_CONTEXT, self._contexts, self._context_offsets, entry)
+        if isinstance(context, FrozenDict):
+            self._last_context = (context, snapshot_id, entry_id)
+        return entry_id
+
+    @staticmethod
+    def _blob(s: str) -> bytes:
+        data = s.encode("utf-8")
+        return LENGTH.pack(len(data)) + data
+
+    def _append(self, data: bytes) -> None:
+        if self._handle is None:
+            raise ValueError(f"Ledger already closed: {self.path}")
+        self._buffer += data
+        self._pos += len(data)
+        if len(self._buffer) >= self.flush_bytes:
+            self.flush()
+
+    def end_turn(self) -> None:
+        self._turns_since_flush += 1
+        if self.flush_turns and self._turns_since_flush >= self.flush_turns:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._handle is None:
+            return
+        if self._buffer:
+            self._handle.write(self._buffer)
+            self._buffer = bytearray()
+        self._handle.flush()
+        self._turns_since_flush = 0
+
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._handle.close()
+            self._handle = None
+        if self._index is not None:
+            from .ledger_index import index_path
+            self._index.save(index_path(self.path), self._pos)
+
+    def __enter__(self) -> "BinaryLedgerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def iter_binary_records(data: Union[bytes, memoryview], raw: bool = False) -> Iterator[Union[Dict[str, Any], str]]:
+    """
+    Decodes an SKLB buffer in file order.
+    Yields payload dicts; with `raw=True`, 'J' items are yielded as their
+    verbatim JSON text instead of being parsed.
+    """
+    for _, item, _ in scan_binary_records(data, raw=raw):
+        yield item
+
+
+def scan_binary_records(
+    data: Union[bytes, memoryview], raw: bool = False
+) -> Iterator[Tuple[int, Union[Dict[str, Any], str], Tuple[int, int]]]:
+    """
+    Like iter_binary_records, but yields `(offset, record, refs)`: the byte
+    offset of the record's tag and, for event records, the offsets of the
+    table entries it references: (tags entry, context entry) for 'V'
+    records, (-1, side entry) for first-format 'E' records, (-1, -1) for
+    'J' lines. Used by the index.
+    """
+    view = memoryview(data)
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not an SKLB ledger (bad magic)")
+    pos = len(MAGIC)
+    end = len(view)
+    strings: List[str] = []
+    tags: List[List[str]] = []
+    tag_offsets: List[int] = []
+    contexts: List[ContextEntry] = []
+    context_offsets: List[int] = []
+    sides: List[Side] = []
+    side_offsets: List[int] = []
+    seed = 0
+    tick = 0
+    rec_size = RECORD.size
+    len_size = LENGTH.size
+
+    while pos < end:
+        offset = pos
+        tag = view[pos:pos + 1].tobytes()
+        pos += 1
+        if tag == TAG_COMPACT:
+            (delta, thrower, intended, outcome, actual, notes, tags_id, context_id, wtl), rolls, pos = \
+                read_compact_record(view, pos)
+            tick += _unzigzag(delta)
+            context, snapshot_id = contexts[context_id]
+            yield offset, build_event(
+                seed, tick, strings[thrower], strings[intended], strings[outcome], strings[actual],
+                (strings[notes], tags[tags_id], context, snapshot_id), wtl, *rolls
+            ), (tag_offsets[tags_id], context_offsets[context_id])
+        elif tag in (TAG_STRING, TAG_TAGS, TAG_CONTEXT, TAG_JSON, TAG_SIDE):
+            (n,) = LENGTH.unpack_from(view, pos)
+            pos += len_size
+            text = str(view[pos:pos + n], "utf-8")
+            pos += n
+            if tag == TAG_STRING:
+                strings.append(text)
+            elif tag == TAG_TAGS:
+                tags.append(json.loads(text))
+                tag_offsets.append(offset)
+            elif tag == TAG_CONTEXT:
+                contexts.append(decode_context(text))
+                context_offsets.append(offset)
+            elif tag == TAG_SIDE:
+                sides.append(decode_side(text))
+                side_offsets.append(offset)
+            else:
+                yield offset, (text if raw else json.loads(text)), (-1, -1)
+        elif tag == TAG_SEED:
+            (seed,) = SEED.unpack_from(view, pos)
+            pos += SEED.size
+        elif tag == TAG_EVENT:
+            rec_tick, thrower, intended, outcome, actual, wtl, r_hit, r_ric, p_hit, side = RECORD.unpack_from(view, pos)
+            pos += rec_size
+            yield offset, build_event(
+                seed, rec_tick, strings[thrower], strings[intended], strings[outcome], strings[actual],
+                sides[side], wtl, r_hit, r_ric, p_hit
+            ), (-1, side_offsets[side])
+        elif tag == TAG_RESET:
+            strings = []
+            tags = []
+            tag_offsets = []
+            contexts = []
+            context_offsets = []
+            sides = []
+            side_offsets = []
+            tick = 0
+        else:
+            raise ValueError(f"Corrupt SKLB ledger: unknown tag {tag!r} at offset {offset}")
+
+
+def decode_context(text: str) -> ContextEntry:
+    entry = json.loads(text)
+    if len(entry) == 2:
+        return entry[0], entry[1]
+    return entry[0], None
+
+
+def decode_side(text: str) -> Side:
+    entry = json.loads(text)
+    if len(entry) == 4:
+        return entry[0], entry[1], entry[2], entry[3]
+    return entry[0], entry[1], entry[2], None
+
+
+def read_blob(buf: Any, offset: int) -> Tuple[bytes, str]:
+    """Reads the tag and text of a length-prefixed item ('S', 'G', 'C', 'X', 'J') at `offset`."""
+    tag = bytes(buf[offset:offset + 1])
+    (n,) = LENGTH.unpack_from(buf, offset + 1)
+    start = offset + 1 + LENGTH.size
+    return tag, str(buf[start:start + n], "utf-8")
+
+
+def build_event(
+    seed: int, tick: int, thrower: str, intended: str, outcome: str, actual: str,
+    side: Side, wtl: int, r_hit: float, r_ric: float, p_hit: float,
+) -> Dict[str, Any]:
+    """Rebuilds the JSONL payload (same key order) from a decoded record."""
+    notes, tags, context, snapshot_id = side
+    payload = {
+        "event_type": EVENT_TYPE,
+        "seed": seed,
+        "tick": tick,
+        "thrower": thrower,
+        "intended": intended,
+        "outcome": outcome,
+        "actual": actual,
+        "notes": notes,
+        "roll_hit": r_hit,
+        "roll_ricochet": r_ric,
+        "p_hit": p_hit,
+        "tags": list(tags),
+    }
+    if context is None:
+        payload["context_ref"] = snapshot_id
+    else:
+        payload["context"] = dict(context)
+        if snapshot_id is not None:
+            payload["context_id"] = snapshot_id
+    payload["weaver_turns_left"] = wtl
+    return payload
+
+
+def read_binary_ledger(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yields every record of an SKLB ledger file as a payload dict."""
+    data = Path(path).read_bytes()
+    yield from iter_binary_records(data)
+
+
+def convert_ledger(src: Path, dst: Path, to: Optional[str] = None) -> str:
+    """
+    Converts between JSONL and SKLB. `to` is "binary" or "jsonl"; by default
+    the opposite of the source format. Returns the target format.
+    Round-tripping JSONL -> SKLB -> JSONL reproduces the original lines.
+    """
+    src, dst = Path(src), Path(dst)
+    source_binary = is_binary_ledger(src)
+    if to is None:
+        to = "jsonl" if source_binary else "binary"
+    if to not in ("binary", "jsonl"):
+        raise ValueError(f"Unknown ledger format: {to}")
+    if src.resolve() == dst.resolve():
+        raise ValueError("Source and destination ledger must differ")
+
+    dst.write_bytes(b"")
+    if to == "binary":
+        with BinaryLedgerWriter(dst) as writer:
+            for line in _iter_source_lines(src, source_binary):
+                try:
+                    payload = json.loads(line)
+                except json.JSONDecodeError:
+                    writer.write_json_line(line)
+                    continue
+                if isinstance(payload, dict) and _fits_record(payload) \
+                        and json.dumps(payload, ensure_ascii=False) == line:
+                    writer.write(payload)
+                else:
+                    writer.write_json_line(line)
+    else:
+        with dst.open("w", encoding="utf-8", newline="\n") as out:
+            for line in _iter_source_lines(src, source_binary):
+                out.write(line + "\n")
+    return to
+
+
+def _iter_source_lines(src: Path, source_binary: bool) -> Iterator[str]:
+    if source_binary:
+        for item in iter_binary_records(src.read_bytes(), raw=True):
+            yield item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
+    else:
+        with src.open("r", encoding="utf-8", newline="") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if line.strip():
+                    yield line
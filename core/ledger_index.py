@@ -0,0 +1,350 @@
+"""
+ledger_index.py
+Tick / agent sidecar index for the Skeletor Ledger.
+
+LedgerParser.parse reads the whole file even when a consumer only needs a
+tick window or one agent's throws. Writers can emit `<ledger>.idx` next to
+the ledger; IndexedLedgerReader memory-maps the ledger and uses the index to
+jump straight to the byte offsets of the records it needs.
+
+Sidecar layout (little-endian, rebuilt with build_index if stale/missing):
+
+    MAGIC (8 bytes)
+    u32 len + utf-8 JSON meta: format, ledger_size, count, names
+    arrays of `count` items each:
+      offsets  q   byte offset of the record (JSONL line start / SKLB tag)
+      ticks    q
+      thrower, intended, actual  I   ids into meta.names
+      context_defs  q   v1.5 `context_ref` records: entry that wrote the
+                        referenced context (its `context_id`), else -1
+      SKLB only: outcome I, notes I (id into meta.names), tags q, context q
+                 (offsets of the record's tags / context table entries; a
+                 first-format 'E' record keeps its side entry in context;
+                 -1 for 'J'), seed q
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .ledger_binary import (
+    RECORD, TAG_COMPACT, TAG_EVENT, build_event, decode_context, decode_side, is_binary_ledger, read_blob,
+    read_compact_record, scan_binary_records,
+)
+
+MAGIC = b"SKIX\x00\x03\r\n"
+INDEX_SUFFIX = ".idx"
+
+# Text-mode writes translate "\n" to os.linesep.
+NEWLINE_EXTRA = len(os.linesep) - 1
+
+
+def index_path(ledger_path: Path) -> Path:
+    ledger_path = Path(ledger_path)
+    return ledger_path.with_name(ledger_path.name + INDEX_SUFFIX)
+
+
+class LedgerIndex:
+    """In-memory form of the sidecar: one entry per indexed (ticked) record."""
+
+    def __init__(self, fmt: str = "jsonl"):
+        self.fmt = fmt
+        self.ledger_size = 0
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self.offsets = array("q")
+        self.ticks = array("q")
+        self.throwers = array("I")
+        self.intendeds = array("I")
+        self.actuals = array("I")
+        self.outcomes = array("I")
+        self.notes = array("I")
+        self.tag_refs = array("q")
+        self.context_refs = array("q")
+        self.seeds = array("q")
+        self.context_defs = array("q")
+        # context_id -> entry that wrote it, within the current run
+        self._context_entries: Dict[int, int] = {}
+        self._by_tick: Optional[Dict[int, List[int]]] = None
+        self._tick_keys: List[int] = []
+        self._by_agent: Optional[Dict[int, List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _name_id(self, name: Any) -> int:
+        name = name if isinstance(name, str) else ""
+        nid = self._ids.get(name)
+        if nid is None:
+            nid = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return nid
+
+    def add(self, offset: int, payload: Dict[str, Any], refs: Tuple[int, int] = (-1, -1)) -> None:
+        """Index one record (headers and other tick-less lines are skipped)."""
+        tick = payload.get("tick")
+        if payload.get("event_type") == "LEDGER_HEADER":
+            # Context ids are turn ticks and only resolve within their own run
+            self._context_entries = {}
+            return
+        if type(tick) is not int:
+            return
+        entry = len(self.offsets)
+        context_id = payload.get("context_id")
+        if type(context_id) is int:
+            self._context_entries[context_id] = entry
+        context_ref = payload.get("context_ref")
+        self.context_defs.append(
+            self._context_entries.get(context_ref, -1) if type(context_ref) is int else -1
+        )
+        self.offsets.append(offset)
+        self.ticks.append(tick)
+        self.throwers.append(self._name_id(payload.get("thrower")))
+        self.intendeds.append(self._name_id(payload.get("intended")))
+        self.actuals.append(self._name_id(payload.get("actual")))
+        if self.fmt == "binary":
+            self.outcomes.append(self._name_id(payload.get("outcome")))
+            self.notes.append(self._name_id(payload.get("notes")))
+            self.tag_refs.append(refs[0])
+            self.context_refs.append(refs[1])
+            seed = payload.get("seed")
+            self.seeds.append(seed if type(seed) is int else 0)
+        self._by_tick = self._by_agent = None
+
+    # --- Lookups ---
+
+    def entries_in_ticks(self, start_tick: int, end_tick: int) -> List[int]:
+        """Entry numbers (file order) with start_tick <= tick <= end_tick."""
+        if self._by_tick is None:
+            by_tick: Dict[int, List[int]] = {}
+            for i, tick in enumerate(self.ticks):
+                by_tick.setdefault(tick, []).append(i)
+            self._by_tick = by_tick
+            self._tick_keys = sorted(by_tick)
+        keys = self._tick_keys
+        lo = bisect_left(keys, start_tick)
+        hi = bisect_right(keys, end_tick, lo)
+        if hi - lo == 1:
+            return self._by_tick[keys[lo]]
+        hits: List[int] = []
+        for tick in keys[lo:hi]:
+            hits.extend(self._by_tick[tick])
+        # Appended runs restart their ticks, so file order is not tick order
+        return sorted(hits)
+
+    def entries_for_agent(self, name: str) -> List[int]:
+        """Entry numbers (file order) where `name` threw, was targeted, or was hit."""
+        nid = self._ids.get(name)
+        if nid is None:
+            return []
+        if self._by_agent is None:
+            by_agent: Dict[int, List[int]] = {}
+            for i in range(len(self.offsets)):
+                seen = {self.throwers[i], self.intendeds[i], self.actuals[i]}
+                for agent_id in seen:
+                    by_agent.setdefault(agent_id, []).append(i)
+            self._by_agent = by_agent
+        return self._by_agent.get(nid, [])
+
+    # --- Persistence ---
+
+    def _arrays(self) -> List[array]:
+        arrays = [self.offsets, self.ticks, self.throwers, self.intendeds, self.actuals, self.context_defs]
+        if self.fmt == "binary":
+            arrays += [self.outcomes, self.notes, self.tag_refs, self.context_refs, self.seeds]
+        return arrays
+
+    def save(self, path: Path, ledger_size: int) -> None:
+        self.ledger_size = ledger_size
+        meta = json.dumps({
+            "format": self.fmt,
+            "ledger_size": ledger_size,
+            "count": len(self.offsets),
+            "names": self.names,
+        }, ensure_ascii=False).encode("utf-8")
+        tmp = Path(str(path) + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(MAGIC)
+            f.write(len(meta).to_bytes(4, "little"))
+            f.write(meta)
+            for arr in self._arrays():
+                if sys.byteorder != "little":
+                    arr = array(arr.typecode, arr)
+                    arr.byteswap()
+                arr.tofile(f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LedgerIndex":
+        data = Path(path).read_bytes()
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a ledger index: {path}")
+        pos = len(MAGIC)
+        n = int.from_bytes(data[pos:pos + 4], "little")
+        pos += 4
+        meta = json.loads(data[pos:pos + n].decode("utf-8"))
+        pos += n
+        idx = cls(meta["format"])
+        idx.ledger_size = meta["ledger_size"]
+        idx.names = meta["names"]
+        idx._ids = {name: i for i, name in enumerate(idx.names)}
+        count = meta["count"]
+        for arr in idx._arrays():
+            size = arr.itemsize * count
+            arr.frombytes(data[pos:pos + size])
+            if sys.byteorder != "little":
+                arr.byteswap()
+            pos += size
+        return idx
+
+
+def build_index(ledger_path: Path, save: bool = True) -> LedgerIndex:
+    """Scans an existing ledger (JSONL or SKLB) and (re)writes its sidecar."""
+    ledger_path = Path(ledger_path)
+    size = ledger_path.stat().st_size
+    if is_binary_ledger(ledger_path):
+        idx = LedgerIndex("binary")
+        for offset, payload, refs in scan_binary_records(ledger_path.read_bytes()):
+            if isinstance(payload, dict):
+                idx.add(offset, payload, refs)
+    else:
+        idx = LedgerIndex("jsonl")
+        offset = 0
+        with ledger_path.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        payload = json.loads(line)
+                    except json.JSONDecodeError:
+                        payload = None
+                    if isinstance(payload, dict):
+                        idx.add(offset, payload)
+                offset += len(line)
+    if save:
+        idx.save(index_path(ledger_path), size)
+    idx.ledger_size = size
+    return idx
+
+
+def open_index_for_append(ledger_path: Path, fmt: str) -> LedgerIndex:
+    """Index state for a writer about to append to `ledger_path`."""
+    ledger_path = Path(ledger_path)
+    size = ledger_path.stat().st_size if ledger_path.exists() else 0
+    if size == 0:
+        return LedgerIndex(fmt)
+    sidecar = index_path(ledger_path)
+    if sidecar.exists():
+        try:
+            idx = LedgerIndex.load(sidecar)
+            if idx.fmt == fmt and idx.ledger_size == size:
+                return idx
+        except (ValueError, KeyError, json.JSONDecodeError):
+            pass
+    return build_index(ledger_path, save=False)
+
+
+class IndexedLedgerReader:
+    """
+    Random-access reader: memory-maps the ledger and decodes only the
+    records the sidecar points at. Builds the sidecar if it is missing or
+    does not match the ledger's current size.
+    """
+
+    def __init__(self, ledger_path: Path):
+        self.ledger_path = Path(ledger_path)
+        size = self.ledger_path.stat().st_size
+        sidecar = index_path(self.ledger_path)
+        idx = None
+        if sidecar.exists():
+            try:
+                idx = LedgerIndex.load(sidecar)
+            except (ValueError, KeyError, json.JSONDecodeError):
+                idx = None
+        if idx is None or idx.ledger_size != size:
+            idx = build_index(self.ledger_path)
+        self.index = idx
+        self._contexts: Dict[int, Any] = {} # defining entry -> context
+        self._file = self.ledger_path.open("rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "IndexedLedgerReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def read_entry(self, i: int) -> Dict[str, Any]:
+        """Decodes entry `i`; a v1.5 `context_ref` / `context_id` is resolved away."""
+        record = self._decode_entry(i)
+        if isinstance(record, dict):
+            if "context_id" in record:
+                record = dict(record)
+                del record["context_id"]
+            elif "context_ref" in record:
+                record = dict(record)
+                record["context"] = self._shared_context(i, record.pop("context_ref"))
+                record["weaver_turns_left"] = record.pop("weaver_turns_left", 0)
+        return record
+
+    def _shared_context(self, i: int, context_id: int) -> Dict[str, Any]:
+        # The sidecar records which entry wrote the snapshot this one references
+        j = self.index.context_defs[i]
+        if j < 0:
+            return {}
+        context = self._contexts.get(j)
+        if context is None:
+            record = self._decode_entry(j)
+            if isinstance(record, dict) and record.get("context_id") == context_id:
+                context = record.get("context", {})
+            else:
+                context = {}
+            self._contexts[j] = context
+        return context
+
+    def _decode_entry(self, i: int) -> Dict[str, Any]:
+        idx, mm = self.index, self._mm
+        offset = idx.offsets[i]
+        if idx.fmt == "jsonl":
+            end = mm.find(b"\n", offset)
+            return json.loads(mm[offset:end if end != -1 else len(mm)])
+        tag = mm[offset:offset + 1]
+        if tag == TAG_COMPACT:
+            fields, (r_hit, r_ric, p_hit), _ = read_compact_record(mm, offset + 1)
+            _, tags_text = read_blob(mm, idx.tag_refs[i])
+            _, context_text = read_blob(mm, idx.context_refs[i])
+            names = idx.names
+            side = (names[idx.notes[i]], json.loads(tags_text)) + decode_context(context_text)
+            return build_event(
+                idx.seeds[i], idx.ticks[i], names[idx.throwers[i]], names[idx.intendeds[i]],
+                names[idx.outcomes[i]], names[idx.actuals[i]], side, fields[8], r_hit, r_ric, p_hit,
+            )
+        if tag == TAG_EVENT:
+            tick, _, _, _, _, wtl, r_hit, r_ric, p_hit, _ = RECORD.unpack_from(mm, offset + 1)
+            names = idx.names
+            _, side_text = read_blob(mm, idx.context_refs[i])
+            return build_event(
+                idx.seeds[i], tick, names[idx.throwers[i]], names[idx.intendeds[i]],
+                names[idx.outcomes[i]], names[idx.actuals[i]], decode_side(side_text),
+                wtl, r_hit, r_ric, p_hit,
+            )
+        _, text = read_blob(mm, offset)
+        return json.loads(text)
+
+    def events_in_ticks(self, start_tick: int, end_tick: int) -> Iterator[Dict[str, Any]]:
+        for i in self.index.entries_in_ticks(start_tick, end_tick):
+            yield self.read_entry(i)
+
+    def events_for_agent(self, name: str) -> Iterator[Dict[str, Any]]:
+        for i in self.index.entries_for_agent(name):
+            yield self.read_entry(i)
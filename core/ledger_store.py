@@ -0,0 +1,292 @@
+"""
+ledger_store.py
+Segmented, rotating, compressed Skeletor Ledger storage.
+
+`snowball.py play` used to truncate one ledger file per run. A LedgerStore
+keeps every run instead: runs are appended to an active segment, and once a
+segment reaches its size or run-count cap it is closed and compressed with
+stdlib gzip or lzma. `manifest.json` lists each segment's runs (seed, mode,
+scenario, roster hash, and the run's byte span inside the uncompressed
+segment), so single runs can be streamed back without unpacking to disk.
+
+    store/
+      manifest.json
+      segment-000001.jsonl.gz     (closed)
+      segment-000002.jsonl        (active)
+"""
+
+import gzip
+import io
+import json
+import lzma
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .ledger_binary import MAGIC as SKLB_MAGIC, TAG_RESET, iter_binary_records, read_blob
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+COMPRESSORS = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+    "none": ("", open),
+}
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_SEGMENT_RUNS = 100
+
+
+def detect_compression(path: Path) -> str:
+    with Path(path).open("rb") as f:
+        head = f.read(len(XZ_MAGIC))
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(XZ_MAGIC):
+        return "lzma"
+    return "none"
+
+
+def open_ledger_stream(path: Path):
+    """Opens a ledger for binary reading, transparently decompressing gzip/xz."""
+    return COMPRESSORS[detect_compression(path)][1](path, "rb")
+
+
+def iter_ledger_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the records of one ledger file: JSONL or SKLB, plain or compressed.
+    JSONL is decoded line by line; SKLB is decoded from the (decompressed) buffer.
+    """
+    with open_ledger_stream(path) as f:
+        head = f.read(len(SKLB_MAGIC))
+        if head == SKLB_MAGIC:
+            yield from iter_binary_records(head + f.read())
+            return
+    with open_ledger_stream(path) as f:
+        for line in io.TextIOWrapper(f, encoding="utf-8"):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+
+class LedgerStore:
+    """
+    Directory of ledger segments plus a manifest.
+
+    Usage:
+        store = LedgerStore(Path("skeletor_ledger/store"))
+        with store.run() as ledger_path:
+            run_simulation(seed=..., ledger_path=ledger_path, ...)
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_segment_runs: int = DEFAULT_MAX_SEGMENT_RUNS,
+        compression: str = "gzip",
+        fmt: str = "jsonl",
+    ):
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression} (expected one of {list(COMPRESSORS)})")
+        if fmt not in ("jsonl", "binary"):
+            raise ValueError(f"Unknown ledger format: {fmt}")
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_runs = max_segment_runs
+        self.compression = compression
+        self.fmt = fmt
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+    # --- Manifest ---
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self.manifest_path.exists():
+            with self.manifest_path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"version": MANIFEST_VERSION, "segments": []}
+
+    def _save_manifest(self) -> None:
+        tmp = self.manifest_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        return self.manifest["segments"]
+
+    def _active_segment(self) -> Dict[str, Any]:
+        if self.segments and self.segments[-1]["status"] == "open":
+            return self.segments[-1]
+        seg_id = self.segments[-1]["id"] + 1 if self.segments else 1
+        suffix = ".sklb" if self.fmt == "binary" else ".jsonl"
+        segment = {
+            "id": seg_id,
+            "file": f"segment-{seg_id:06d}{suffix}",
+            "format": self.fmt,
+            "status": "open",
+            "compression": "none",
+            "bytes": 0,
+            "runs": [],
+        }
+        self.segments.append(segment)
+        self._save_manifest()
+        return segment
+
+    # --- Writing ---
+
+    @contextmanager
+    def run(self) -> Iterator[Path]:
+        """
+        Yields the active segment path to append one run to. On exit the run
+        is recorded in the manifest (from its LEDGER_HEADER) and the segment
+        is rotated if it reached a cap.
+        """
+        segment = self._active_segment()
+        if segment["format"] != self.fmt:
+            self.close_segment(segment)
+            segment = self._active_segment()
+        path = self.root / segment["file"]
+        start = path.stat().st_size if path.exists() else 0
+        try:
+            yield path
+        finally:
+            end = path.stat().st_size if path.exists() else start
+            if end > start:
+                self._record_run(segment, path, start, end)
+
+    def _record_run(self, segment: Dict[str, Any], path: Path, start: int, end: int) -> None:
+        header = self._read_header(path, start)
+        context = header.get("context", {}) if header else {}
+        segment["runs"].append({
+            "seed": context.get("seed"),
+            "mode": context.get("mode"),
+            "scenario": context.get("scenario"),
+            "turns": context.get("turns"),
+            "roster_hash": header.get("roster_hash") if header else None,
+            "timestamp": header.get("timestamp") if header else None,
+            "offset": start,
+            "length": end - start,
+        })
+        segment["bytes"] = end
+        if end >= self.max_segment_bytes or len(segment["runs"]) >= self.max_segment_runs:
+            self.close_segment(segment)
+        else:
+            self._save_manifest()
+
+    def _read_header(self, path: Path, offset: int) -> Optional[Dict[str, Any]]:
+        with path.open("rb") as f:
+            f.seek(offset)
+            if self.fmt == "binary":
+                chunk = f.read(64 * 1024)
+                pos = 0
+                if chunk[:len(SKLB_MAGIC)] == SKLB_MAGIC:
+                    pos = len(SKLB_MAGIC)
+                elif chunk[:1] == TAG_RESET:
+                    pos = 1
+                try:
+                    _, text = read_blob(chunk, pos)
+                    record = json.loads(text)
+                except (ValueError, IndexError, struct.error):
+                    return None
+            else:
+                try:
+                    record = json.loads(f.readline())
+                except json.JSONDecodeError:
+                    return None
+        if isinstance(record, dict) and record.get("event_type") == "LEDGER_HEADER":
+            return record
+        return None
+
+    def close_segment(self, segment: Optional[Dict[str, Any]] = None) -> None:
+        """Closes (and compresses) the given or active segment."""
+        if segment is None:
+            if not self.segments or self.segments[-1]["status"] != "open":
+                return
+            segment = self.segments[-1]
+        if segment["status"] != "open":
+            return
+        src = self.root / segment["file"]
+        if self.compression != "none" and src.exists():
+            suffix, opener = COMPRESSORS[self.compression]
+            dst = src.with_name(src.name + suffix)
+            with src.open("rb") as fin, opener(dst, "wb") as fout:
+                while True:
+                    block = fin.read(1024 * 1024)
+                    if not block:
+                        break
+                    fout.write(block)
+            src.unlink()
+            for sidecar in src.parent.glob(src.name + ".idx"):
+                sidecar.unlink()
+            segment["file"] = dst.name
+            segment["compression"] = self.compression
+        segment["status"] = "closed"
+        self._save_manifest()
+
+    # --- Reading ---
+
+    def last_run(self) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """(segment, run) of the most recently recorded run."""
+        for segment in reversed(self.segments):
+            if segment["runs"]:
+                return segment, segment["runs"][-1]
+        return None, None
+
+    def find_runs(self, **criteria: Any) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """(segment, run) pairs whose manifest fields match, e.g. find_runs(seed=777)."""
+        hits = []
+        for segment in self.segments:
+            for run in segment["runs"]:
+                if all(run.get(k) == v for k, v in criteria.items()):
+                    hits.append((segment, run))
+        return hits
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Streams every record of every segment, oldest first."""
+        for segment in self.segments:
+            path = self.root / segment["file"]
+            if path.exists():
+                yield from iter_ledger_file(path)
+
+    def iter_run_records(self, segment: Dict[str, Any], run: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Streams one run's records straight out of its (possibly compressed) segment."""
+        path = self.root / segment["file"]
+        with open_ledger_stream(path) as f:
+            head = f.read(len(SKLB_MAGIC))
+            f.seek(run["offset"])
+            if head == SKLB_MAGIC:
+                data = f.read(run["length"])
+                if data.startswith(TAG_RESET):
+                    data = data[1:]
+                if not data.startswith(SKLB_MAGIC):
+                    data = SKLB_MAGIC + data
+                yield from iter_binary_records(data)
+                return
+            remaining = run["length"]
+            for line in f:
+                remaining -= len(line)
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        record = None
+                    if isinstance(record, dict):
+                        yield record
+                if remaining <= 0:
+                    break
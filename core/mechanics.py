@@ -1,5 +1,7 @@
 import random
-from typing import List, Tuple, Dict
+from bisect import bisect_left, insort
+from itertools import accumulate
+from typing import List, Tuple, Dict, Optional
 from .models import Agent, Event
 
 def clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
@@ -153,3 +155,165 @@ def apply_turn_decay(roster: Dict[str, Agent]) -> None:
     if "Ace" in roster:
         ace = roster["Ace"]
         ace.spite_meter = clamp(ace.spite_meter - ace.spite_decay_per_turn)
+
+# --- Id-based variants (core/roster_table.py) ---
+# Same rules and the same RNG draws as the Agent versions above, with the
+# special roles already resolved to ids.
+
+def effective_dodge_ids(table: "RosterTable", i: int) -> float:
+    if i == table.kryssie:
+        kryssie = table.agents[i]
+        if kryssie.holding_beer:
+            return clamp(table.dodge[i] + kryssie.beer_dodge_bonus)
+    return table.dodge[i]
+
+def thrower_accuracy_ids(table: "RosterTable", thrower: int) -> float:
+    """Accuracy x mod (x Ace spite): the thrower's half of compute_p_hit."""
+    acc = table.accuracy[thrower] * table.accuracy_mod[thrower]
+    if thrower == table.ace:
+        acc *= ace_multiplier(table.agents[thrower])
+    return acc
+
+def target_dodge_ids(table: "RosterTable", target: int) -> float:
+    """Effective dodge x mod, before the Weaver debuff: the target's half."""
+    return effective_dodge_ids(table, target) * table.dodge_mod[target]
+
+def p_hit_from_parts(acc: float, dod: float, weaver_active: bool = False, weaver_intensity: float = 1.0, resonance_debuff: float = 0.0) -> float:
+    if weaver_active:
+        debuff = resonance_debuff * weaver_intensity
+        dod = clamp(dod - debuff, 0.0, 0.92)
+
+    p = acc * (1.0 - dod)
+    return clamp(p)
+
+def compute_p_hit_ids(table: "RosterTable", thrower: int, target: int, weaver_active: bool = False, weaver_intensity: float = 1.0, resonance_debuff: float = 0.0) -> float:
+    return p_hit_from_parts(
+        thrower_accuracy_ids(table, thrower),
+        target_dodge_ids(table, target),
+        weaver_active, weaver_intensity, resonance_debuff
+    )
+
+def janus_untouchable_gate_ids(table: "RosterTable", target: int) -> Tuple[bool, str]:
+    if target != table.janus:
+        return False, ""
+    return janus_untouchable_gate(table.agents[target], table.agents[target])
+
+def pick_index_excluding(rng: random.Random, n: int, skip: int) -> int:
+    """
+    rng.choice over range(n) without `skip`, without building that list:
+    draws an index among n - 1 and steps over `skip`. Same draw as
+    `rng.choice([i for i in range(n) if i != skip])`.
+    """
+    if n < 2:
+        raise IndexError("Cannot choose from an empty sequence")
+    j = rng.randrange(n - 1)
+    return j + 1 if j >= skip else j
+
+def pick_target_ids(rng: random.Random, table: "RosterTable", thrower: int) -> int:
+    """pick_target over ids: anyone but the thrower, in O(1)."""
+    return pick_index_excluding(rng, len(table), thrower)
+
+def _ricochet_cumulative(table: "RosterTable", skip: List[int], quinn_cap: float) -> Optional[Tuple[float, List[float]]]:
+    """
+    (total, cumulative weights) of one ricochet pick from the ids not in
+    `skip` (sorted: the thrower, then earlier net picks), built with the same
+    float operations as _scan_ricochet_pick and cached on the table. Every
+    weight is 1.0 except Quinn's, so only the pool size, Quinn's position in
+    it and stray_magnet change the list. None when a weight is not positive.
+    """
+    size = len(table) - len(skip)
+    quinn = table.quinn
+    if quinn is None or quinn in skip:
+        q_idx = None
+        key = (size, None, 0.0, quinn_cap)
+    else:
+        q_idx = quinn - bisect_left(skip, quinn)
+        key = (size, q_idx, table.agents[quinn].stray_magnet, quinn_cap)
+
+    if key in table.ricochet_cache:
+        return table.ricochet_cache[key]
+
+    weights = [1.0] * size
+    result = None
+    if weights:
+        if q_idx is not None:
+            weights[q_idx] += key[2]
+        total = sum(weights)
+        if total > 0:
+            if q_idx is not None:
+                q_prob = weights[q_idx] / total
+                if q_prob > quinn_cap:
+                    wq = weights[q_idx]
+                    other = total - wq
+                    new_wq = (quinn_cap * other) / (1.0 - quinn_cap) if (1.0 - quinn_cap) > 0 else wq
+                    weights[q_idx] = max(0.01, new_wq)
+            if q_idx is None or weights[q_idx] >= 0:
+                result = (sum(weights), list(accumulate(weights)))
+    table.ricochet_cache[key] = result
+    return result
+
+def _scan_ricochet_pick(rng: random.Random, table: "RosterTable", skip: List[int], quinn_cap: float) -> int:
+    """One pick over the explicit pool (used when a weight is not positive)."""
+    quinn = table.quinn
+    pool = [i for i in range(len(table)) if i not in skip]
+
+    weights = [1.0] * len(pool)
+    q_idx = pool.index(quinn) if quinn in pool else None
+    if q_idx is not None:
+        weights[q_idx] += table.agents[quinn].stray_magnet
+    total = sum(weights)
+    if total <= 0:
+        return rng.choice(pool)
+
+    # cap Quinn
+    if q_idx is not None:
+        q_prob = weights[q_idx] / total
+        if q_prob > quinn_cap:
+            wq = weights[q_idx]
+            other = total - wq
+            new_wq = (quinn_cap * other) / (1.0 - quinn_cap) if (1.0 - quinn_cap) > 0 else wq
+            weights[q_idx] = max(0.01, new_wq)
+
+    total = sum(weights)
+    r = rng.random() * total
+    acc = 0.0
+    chosen = pool[-1]
+    for i, w in zip(pool, weights):
+        acc += w
+        if r <= acc:
+            chosen = i
+            break
+    return chosen
+
+def pick_ricochet_targets_ids(
+    rng: random.Random,
+    table: "RosterTable",
+    exclude: int,
+    quinn_cap: float = 0.45,
+    count: int = 1,
+) -> List[int]:
+    """
+    pick_ricochet_targets over ids, excluding the thrower `exclude`.
+    Each pick (single ricochets and every snow-net pick alike) is a binary
+    search in cached cumulative weights of its pool; the pool's ids are
+    found by skipping the thrower and earlier picks, so a pick costs
+    O(log n) once the few pool shapes are cached.
+    """
+    skip = [exclude]
+    picked: List[int] = []
+    for _ in range(count):
+        if len(skip) >= len(table):
+            break
+        cumulative = _ricochet_cumulative(table, skip, quinn_cap)
+        if cumulative is None:
+            chosen = _scan_ricochet_pick(rng, table, skip, quinn_cap)
+        else:
+            total, acc = cumulative
+            r = rng.random() * total
+            chosen = min(bisect_left(acc, r), len(acc) - 1)
+            for taken in skip:  # pool position -> id
+                if taken <= chosen:
+                    chosen += 1
+        picked.append(chosen)
+        insort(skip, chosen)
+    return picked
@@ -1,8 +1,19 @@
 from __future__ import annotations
+import copy
+import sys
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 
-@dataclass
+
+_ATOMIC = (str, int, float, bool, type(None))
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Agent:
     name: str
     accuracy: float = 0.55
@@ -48,10 +59,90 @@ class Agent:
         # Safety: Filter data keys to match class fields only
         valid_keys = cls.__dataclass_fields__.keys()
         filtered_data = {k: v for k, v in data.items() if k in valid_keys}
+        if "name" in filtered_data:
+            filtered_data["name"] = _intern(filtered_data["name"])
         return cls(**filtered_data)
 
-@dataclass
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Agent:
+        # Field by field (the generic slots path is slow on large rosters).
+        # Reads the raw slots, so traced agents log nothing; copies are plain Agents.
+        clone = Agent.__new__(Agent)
+        memo[id(self)] = clone
+        for name, value in agent_values(self).items():
+            if type(value) not in _ATOMIC:
+                value = copy.deepcopy(value, memo)
+            setattr(clone, name, value)
+        return clone
+
+# Agent is slotted: no __dict__, so vars() does not work on it
+AGENT_FIELDS = tuple(Agent.__dataclass_fields__)
+
+
+def agent_values(agent: Agent) -> Dict[str, Any]:
+    """
+    Field values read straight from the Agent slots, bypassing subclass
+    overrides (RosterTable views, traced agents).
+    """
+    return {name: Agent.__dict__[name].__get__(agent) for name in AGENT_FIELDS}
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a dict for `.get`, iteration and json.dumps."""
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable; use dict(ctx) for a mutable copy")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+# Shared by every Event without tags / context (no per-event list and dict)
+EMPTY_TAGS: Sequence[str] = ()
+EMPTY_CONTEXT: Dict[str, Any] = FrozenDict()
+
+
+def _empty_context() -> Dict[str, Any]:
+    return EMPTY_CONTEXT
+
+
+class TurnContext(FrozenDict):
+    """
+    Immutable snapshot of the turn state (spite, weaver, beer, budget).
+    Built at the start of a turn (reused while the state is unchanged) and
+    shared by every event instead of being copied per event. A JSONL ledger
+    writes it with the first event that uses it (`context_id`); later events
+    only carry a `context_ref`.
+    Still a dict, so `.get`, iteration and json.dumps work unchanged.
+    """
+    __slots__ = ("context_id",)
+
+    def __init__(self, context_id: int, values: Dict[str, Any]):
+        dict.__init__(self, values)
+        self.context_id = context_id
+
+    def __reduce__(self):
+        return (TurnContext, (self.context_id, dict(self)))
+
+@dataclass(slots=True)
 class Event:
+    """
+    One ledger line. Slotted: million-event runs keep every Event in memory.
+    Omitted tags / context are the shared EMPTY_TAGS / EMPTY_CONTEXT; names
+    and outcomes are interned, so repeated strings are stored once.
+
+    `tags` / `context` stay mutable for plugins: reading a shared read-only
+    value (the empty defaults, a turn's TurnContext) through them gives the
+    Event its own list / dict first (copy-on-write). Core code that only
+    reads uses `raw_tags` / `raw_context`, which never copy.
+    """
     tick: int
     thrower: str
     intended: str
@@ -61,10 +152,161 @@ class Event:
     roll_hit: float
     roll_ricochet: float
     p_hit: float
-    tags: List[str] = field(default_factory=list)
-    context: Dict[str, Any] = field(default_factory=dict)
+    tags: Optional[Sequence[str]] = None
+    context: Dict[str, Any] = field(default_factory=_empty_context)
 
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+    def __init__(
+        self, tick: int, thrower: str, intended: str, outcome: str, actual: str, notes: str,
+        roll_hit: float, roll_ricochet: float, p_hit: float,
+        tags: Optional[Sequence[str]] = None, context: Optional[Dict[str, Any]] = None,
+    ):
+        # Written straight into the slots (the tags / context attributes copy on read)
+        self.tick = tick
+        self.thrower = _intern(thrower)
+        self.intended = _intern(intended)
+        self.outcome = _intern(outcome)
+        self.actual = _intern(actual)
+        self.notes = notes
+        self.roll_hit = roll_hit
+        self.roll_ricochet = roll_ricochet
+        self.p_hit = p_hit
+        _TAGS_SLOT.__set__(self, EMPTY_TAGS if tags is None else tags)
+        _CONTEXT_SLOT.__set__(self, EMPTY_CONTEXT if context is None else context)
 
+    @property
+    def raw_tags(self) -> Sequence[str]:
+        """Stored tags, possibly the shared EMPTY_TAGS (do not mutate)."""
+        return _TAGS_SLOT.__get__(self, Event)
+
+    @property
+    def raw_context(self) -> Dict[str, Any]:
+        """Stored context, possibly shared and read-only (do not mutate)."""
+        return _CONTEXT_SLOT.__get__(self, Event)
+
+    def add_tag(self, tag: str) -> None:
+        """Appends a tag (copying the shared default first)."""
+        self.tags.append(tag)
+
+    def set_context(self, key: str, value: Any) -> None:
+        """Sets one context value (copying a shared or read-only context first)."""
+        self.context[key] = value
+
+    # Compare, show, pickle and copy the stored values: none of them copies a shared context
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not Event:
+            return NotImplemented
+        mine, theirs = self.__getstate__(), other.__getstate__()
+        return mine[:_TAGS_INDEX] == theirs[:_TAGS_INDEX] \
+            and tuple(mine[_TAGS_INDEX]) == tuple(theirs[_TAGS_INDEX]) \
+            and mine[_TAGS_INDEX + 1:] == theirs[_TAGS_INDEX + 1:]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in zip(Event.__slots__, self.__getstate__()))
+        return f"Event({values})"
+
+    def __getstate__(self):
+        return tuple(slot.__get__(self, Event) for slot in _EVENT_SLOTS)
+
+    def __setstate__(self, state):
+        for slot, value in zip(_EVENT_SLOTS, state):
+            slot.__set__(self, value)
+
+
+class _CopyOnWrite:
+    """
+    Event.tags / Event.context: wraps the slot so that reading a shared,
+    read-only value stores and returns a private mutable copy instead.
+    """
+
+    def __init__(self, slot: Any, shared: tuple, own: Any):
+        self.slot = slot
+        self.shared = shared
+        self.own = own
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if isinstance(value, self.shared):
+            value = self.own(value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+
+
+_EVENT_SLOTS = tuple(getattr(Event, name) for name in Event.__slots__)
+_TAGS_INDEX = Event.__slots__.index("tags")
+_TAGS_SLOT = Event.tags
+_CONTEXT_SLOT = Event.context
+Event.tags = _CopyOnWrite(_TAGS_SLOT, (tuple,), list)
+Event.context = _CopyOnWrite(_CONTEXT_SLOT, (FrozenDict,), dict)
+
+
+class EventWindow(deque):
+    """
+    Event history bounded to the last `maxlen` events (`event_window=N`).
+    A deque, so appends drop the oldest event in O(1); indexing and slicing
+    work as on the list a run without a window hands to hooks
+    (`ctx.events[-3:]` is a list).
+    """
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(self)[key]
+        return deque.__getitem__(self, key)
+
+
+@dataclass
+class SimulationStats:
+    """
+    Compact result of `run_simulation(..., stats_only=True)`: final counters
+    instead of the events list. Same RNG stream as a full run of the seed.
+    """
+    seed: int
+    turns: int
+    landed: Dict[str, int] = field(default_factory=dict)
+    taken: Dict[str, int] = field(default_factory=dict)
+    outcomes: Dict[str, Dict[str, int]] = field(default_factory=dict)  # thrower -> outcome -> count
+
+    def count(self, thrower: str, outcome: str) -> None:
+        per_thrower = self.outcomes.get(thrower)
+        if per_thrower is None:
+            per_thrower = self.outcomes[thrower] = {}
+        per_thrower[outcome] = per_thrower.get(outcome, 0) + 1
+
+    def collect(self, roster: Dict[str, "Agent"]) -> None:
+        self.landed = {name: a.landed for name, a in roster.items()}
+        self.taken = {name: a.taken for name, a in roster.items()}
+
+@dataclass
+class SimulationSummary:
+    """Last item yielded by iter_simulation: the final roster (and stats in stats mode)."""
+    seed: int
+    turns: int
+    roster: Dict[str, "Agent"]
+    stats: Optional[SimulationStats] = None
+
+@dataclass
+class SimulationCheckpoint:
+    """
+    Complete run state at a turn boundary, yielded by
+    `iter_simulation(..., checkpoint_at=[t])` before turn `turn` is played.
+    Pass it back as `resume=` to play the remaining turns, as often as needed
+    and with different options (what-if branches). Plain picklable data, so
+    branches can run in worker processes (core/branching.py).
+    """
+    seed: int
+    turn: int  # next turn to play
+    options: Dict[str, Any]  # settings of the run it was taken from
+    roster: Dict[str, "Agent"]
+    rng_state: Any
+    weaver_turns_left: int
+    bankai_state: Any  # BankaiState
+    dyad_states: List[Any]  # (class name, attributes) per active dyad
+    last_anomaly: Optional[Event] = None
+    history: List[Event] = field(default_factory=list)
+    current_context: Optional[TurnContext] = None
+    stats: Optional[SimulationStats] = None
+    component_rng_state: Dict[str, Any] = field(default_factory=dict)  # dyad / narrator streams (ctx.rng_for)
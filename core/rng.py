@@ -0,0 +1,174 @@
+"""
+rng.py
+Pluggable random number backends for the simulation.
+
+Everything that rolls dice (the turn loop, core/mechanics.py, dyads via
+ctx.rng) takes a random.Random, so that is the interface: a backend is a
+random.Random subclass built from the run seed. make_rng(seed, backend)
+picks one:
+
+    "mt"     random.Random (Mersenne Twister). The default; replays
+             every existing seed and ledger.
+    "numpy"  BlockRandom: doubles generated in blocks by a NumPy PCG64
+             Generator and handed out one at a time, with integer picks
+             (choice, randrange, randint) scaled from the same doubles.
+
+A backend is deterministic per seed, the same in stats-only and full
+runs, and round-trips through getstate()/setstate() (checkpoints,
+pickling). Different backends give different runs for the same seed.
+
+Components that roll their own dice (dyads, narrators) get a stream of
+their own, seeded from the run seed plus the component name
+(component_rng / ComponentStreams, reached through ctx.rng_for(name) in
+dyad hooks). Their draws neither shift the run's stream nor depend on the
+global `random`, so a seed replays the same run in any process.
+
+NumPy is optional: only the "numpy" backend needs it.
+"""
+
+import hashlib
+import itertools
+import random
+from typing import Any, Dict, Iterator, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_BACKEND = "mt"
+DEFAULT_BLOCK_SIZE = 4096
+FIRST_BLOCK_SIZE = 256  # short runs should not pay for a full block
+
+_BITS = 53
+_SCALE = float(1 << _BITS)
+_LIMIT = 1 << _BITS
+
+
+class BlockRandom(random.Random):
+    """
+    random.Random over a NumPy PCG64 stream, refilled in blocks of doubles
+    (256 first, doubling up to `block_size`). `random` is bound to a C-level
+    iterator over the block, so a roll costs no Python frame; integer picks
+    are floor(random() * n).
+    """
+
+    def __init__(self, seed: Any = None, block_size: int = DEFAULT_BLOCK_SIZE):
+        if np is None:
+            raise ImportError("The numpy RNG backend requires NumPy (pip install numpy)")
+        self.block_size = block_size
+        super().__init__(seed)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        # random.Random.__init__ calls this too
+        if a is not None and not isinstance(a, int):
+            a = int.from_bytes(hashlib.sha512(str(a).encode("utf-8")).digest(), "big")
+        if a is not None and a < 0:
+            # PCG64 takes non-negative entropy: a spawn key keeps -n apart from n
+            a = np.random.SeedSequence(-a, spawn_key=(1,))
+        self._bits = np.random.PCG64(a)
+        self._generator = np.random.Generator(self._bits)
+        self._restart()
+
+    def _new_block(self, size: int) -> Iterator[float]:
+        self._block_state = self._bits.state  # regenerates this block on setstate
+        self._block_size = size
+        self._block = iter(self._generator.random(size).tolist())
+        return self._block
+
+    def _more_blocks(self, size: int) -> Iterator[Iterator[float]]:
+        while True:
+            size = min(size * 2, self.block_size)
+            yield self._new_block(size)
+
+    def _restart(self, size: int = FIRST_BLOCK_SIZE) -> None:
+        size = min(size, self.block_size)
+        first = self._new_block(size)
+        self.random = itertools.chain(first, itertools.chain.from_iterable(self._more_blocks(size))).__next__
+
+    def random(self) -> float:  # replaced per instance by _restart
+        return self.random()
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits = 0
+        for shift in range(0, k, _BITS):
+            bits |= int(self.random() * _SCALE) << shift
+        return bits & ((1 << k) - 1)
+
+    def _randbelow(self, n: int) -> int:
+        if n <= _LIMIT:
+            r = int(self.random() * n)
+            return r if r < n else n - 1
+        # Beyond a double's resolution: rejection on whole bits
+        k = n.bit_length()
+        r = self.getrandbits(k)
+        while r >= n:
+            r = self.getrandbits(k)
+        return r
+
+    def getstate(self) -> Tuple[Dict[str, Any], int, int, int]:
+        used = self._block_size - self._block.__length_hint__()
+        return (self._block_state, self._block_size, used, self.block_size)
+
+    def setstate(self, state: Tuple[Dict[str, Any], int, int, int]) -> None:
+        bit_state, size, used, self.block_size = state
+        self._bits.state = bit_state
+        self._restart(size)
+        for _ in range(used):
+            self.random()
+
+
+BACKENDS = {
+    "mt": random.Random,
+    "numpy": BlockRandom,
+}
+
+
+def make_rng(seed: Any, backend: str = DEFAULT_BACKEND) -> random.Random:
+    """The run's random.Random for `backend` (see BACKENDS)."""
+    cls = BACKENDS.get(backend)
+    if cls is None:
+        raise ValueError(f"Unknown rng_backend {backend!r} (expected one of: {', '.join(BACKENDS)})")
+    return cls(seed)
+
+
+def component_rng(seed: Any, component: str, backend: str = DEFAULT_BACKEND) -> random.Random:
+    """Stream of one component of a run, seeded from (seed, component name)."""
+    return make_rng(f"{seed}:{component}", backend)
+
+
+class ComponentStreams:
+    """A run's per-component streams, created on first use."""
+
+    def __init__(self, seed: Any, backend: str = DEFAULT_BACKEND):
+        self.seed = seed
+        self.backend = backend
+        self.streams: Dict[str, random.Random] = {}
+
+    def __getitem__(self, component: str) -> random.Random:
+        stream = self.streams.get(component)
+        if stream is None:
+            stream = self.streams[component] = component_rng(self.seed, component, self.backend)
+        return stream
+
+    def getstate(self) -> Dict[str, Any]:
+        return {component: stream.getstate() for component, stream in self.streams.items()}
+
+    def setstate(self, state: Dict[str, Any]) -> None:
+        for component, stream_state in state.items():
+            self[component].setstate(stream_state)
+
+
+def uses_global_random(cls: type) -> bool:
+    """True if the module that defined `cls` holds the `random` module or one of its global functions."""
+    namespace = next(
+        (f.__globals__ for f in (getattr(v, "__func__", v) for v in vars(cls).values()) if hasattr(f, "__globals__")),
+        {},
+    )
+    shared = getattr(random, "_inst", None)  # the instance behind random.random, random.choice, ...
+    for value in namespace.values():
+        if value is random or (shared is not None and getattr(value, "__self__", None) is shared):
+            return True
+    return False
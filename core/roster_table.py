@@ -0,0 +1,160 @@
+"""
+roster_table.py
+Struct-of-arrays roster with integer agent ids.
+
+The hot loop used to resolve agents through the roster dict and compare
+names as strings ("Ace", "Janus", "Kryssie", "Quinn") on every throw.
+RosterTable keeps the per-throw fields in parallel lists indexed by agent id
+and resolves the special roles to ids once. mechanics.*_ids take ids.
+
+While a table is bound, the roster's Agent objects are views over it:
+reads and writes of VIEW_FIELDS (dyads, BankaiManager, the prologue) go to
+the lists, so existing code keeps working. unbind() copies the values back
+and turns the views into plain Agents again. Writes to the hit probability
+inputs (HIT_FIELDS, WATCHED_FIELDS) invalidate the table's HitTable.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from .models import Agent, agent_values
+
+VIEW_FIELDS = ("accuracy", "dodge", "accuracy_mod", "dodge_mod", "landed", "taken", "frame")
+MOD_FIELDS = ("accuracy_mod", "dodge_mod")
+# Inputs of the hit probabilities (core/hit_table.py): writes invalidate them
+HIT_FIELDS = ("accuracy", "dodge", "accuracy_mod", "dodge_mod")
+# Stay on the Agent, but writes are reported too (Ace spite, Kryssie's beer)
+WATCHED_FIELDS = ("spite_meter", "spite_min_multiplier", "spite_max_bonus", "holding_beer", "beer_dodge_bonus")
+
+# Table attribute -> agent name
+ROLES = {"ace": "Ace", "janus": "Janus", "kryssie": "Kryssie", "quinn": "Quinn"}
+
+
+def _view_property(field: str) -> property:
+    mod = field in MOD_FIELDS
+    hit = field in HIT_FIELDS
+
+    def fget(self):
+        table = type(self)._table
+        return getattr(table, field)[table.ids[self.name]]
+
+    def fset(self, value):
+        table = type(self)._table
+        i = table.ids[self.name]
+        getattr(table, field)[i] = value
+        if mod and table.touched_mods is not None:
+            table.touched_mods.add(i)  # reset_mods only resets these
+        if hit and table.hit_table is not None:
+            table.hit_table.invalidate(i)
+
+    return property(fget, fset)
+
+
+def _watched_property(field: str) -> property:
+    slot = Agent.__dict__[field]
+
+    def fget(self):
+        return slot.__get__(self)
+
+    def fset(self, value):
+        slot.__set__(self, value)
+        table = type(self)._table
+        if table.hit_table is not None:
+            table.hit_table.invalidate(table.ids[self.name])
+
+    return property(fget, fset)
+
+
+class _AgentView(Agent):
+    """Agent whose VIEW_FIELDS live in a RosterTable (one subclass per table)."""
+    __slots__ = ()
+    _table: "RosterTable"
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Agent:
+        # Checkpoints and summaries hold plain Agents
+        table = type(self)._table
+        return table.snapshot(table.ids[self.name], memo)
+
+
+for _field in VIEW_FIELDS:
+    setattr(_AgentView, _field, _view_property(_field))
+for _field in WATCHED_FIELDS:
+    setattr(_AgentView, _field, _watched_property(_field))
+del _field
+
+
+class RosterTable:
+    """Parallel per-agent lists; ids follow the order of `agents` (turn order)."""
+
+    def __init__(self, agents: List[Agent]):
+        self.agents = list(agents)
+        self.names = [a.name for a in self.agents]
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        for field in VIEW_FIELDS:
+            setattr(self, field, [getattr(a, field) for a in self.agents])
+        # Special roles, resolved once (None when absent)
+        self.ace: Optional[int] = self.ids.get(ROLES["ace"])
+        self.janus: Optional[int] = self.ids.get(ROLES["janus"])
+        self.kryssie: Optional[int] = self.ids.get(ROLES["kryssie"])
+        self.quinn: Optional[int] = self.ids.get(ROLES["quinn"])
+        self._ones = [1.0] * len(self.agents)
+        # Ids whose mods were written since the last reset (None: all of them)
+        self.touched_mods: Optional[set] = None
+        # mechanics._ricochet_cumulative, per pool size / Quinn position / stray_magnet / cap
+        self.ricochet_cache: Dict[tuple, Any] = {}
+        # HitTable over this roster, told about writes to its inputs
+        self.hit_table: Optional[Any] = None
+        self.bound = False
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def bind(self) -> None:
+        """Turns the agents into views over this table."""
+        view_cls = type("AgentView", (_AgentView,), {"_table": self, "__slots__": ()})
+        for agent in self.agents:
+            agent.__class__ = view_cls
+        self.bound = True
+
+    def unbind(self) -> None:
+        """Writes the table back into the agents and makes them plain Agents."""
+        if not self.bound:
+            return
+        # Iterating a column does not go through __getitem__ (read logs see nothing)
+        columns = [(field, list(getattr(self, field))) for field in VIEW_FIELDS]
+        for i, agent in enumerate(self.agents):
+            agent.__class__ = Agent
+            for field, values in columns:
+                setattr(agent, field, values[i])
+        self.bound = False
+
+    def snapshot(self, i: int, memo: Optional[Dict[int, Any]] = None) -> Agent:
+        """Plain Agent copy of agent `i` (reads the lists directly, so read logs see nothing)."""
+        agent = Agent.__new__(Agent)
+        if memo is not None:
+            memo[id(self.agents[i])] = agent
+        values = agent_values(self.agents[i])
+        for field in VIEW_FIELDS:
+            values[field] = list.__getitem__(getattr(self, field), i)
+        for name, value in copy.deepcopy(values, memo).items():
+            setattr(agent, name, value)
+        return agent
+
+    def reset_mods(self) -> None:
+        """
+        Start-of-turn reset of the transient modifiers. The first reset covers
+        every agent (the roster may start with mods); later ones only the
+        agents whose mods were written through their view since.
+        """
+        if self.touched_mods is None:
+            self.accuracy_mod[:] = self._ones
+            self.dodge_mod[:] = self._ones
+            if self.hit_table is not None:
+                self.hit_table.invalidate()
+        else:
+            for i in self.touched_mods:
+                self.accuracy_mod[i] = 1.0
+                self.dodge_mod[i] = 1.0
+                if self.hit_table is not None:
+                    self.hit_table.invalidate(i)
+        self.touched_mods = set()
@@ -1,12 +1,19 @@
+import copy
 import json
 import random
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional, Union, Iterable, Iterator
 
-from .models import Agent, Event
+from .models import Agent, Event, EventWindow, TurnContext, SimulationStats, SimulationSummary, SimulationCheckpoint
 from . import mechanics
 from .dyad_manager import DyadManager
 from .bankai_manager import BankaiManager
+from .roster_table import RosterTable
+from .alias_sampler import RicochetSampler
+from .crn import DECISION_POINTS, RandomStreams
+from .rng import DEFAULT_BACKEND, ComponentStreams, make_rng
+from .hit_table import HitTable
+from .ledger import open_ledger, LedgerSink, NullLedgerSink, DEFAULT_QUEUE_SIZE
 
 def load_roster(char_dir: Path, use_samples: bool = False) -> Dict[str, Agent]:
     roster = {}
@@ -59,18 +66,34 @@ def get_canonical_order() -> List[str]:
     # The Council Octad + Kryssie (Canon Order)
     return ["Oracle", "Ace", "Mega", "Claude", "DeepScribe", "Mico", "Janus", "Quinn", "Kryssie"]
 
+LEGACY_ORDER = ["Kryssie", "Mega", "Ace", "Claude", "Janus", "Quinn"]
+
+# name -> position, so sorting a large roster does no list.index() per agent
+CANON_RANK = {name: i for i, name in enumerate(get_canonical_order())}
+LEGACY_RANK = {name: i for i, name in enumerate(LEGACY_ORDER)}
+
 CLASSIC_ROSTER_NAMES = {"Ace", "Mega", "Claude", "Janus", "Quinn", "Kryssie"}
 
 def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
+def compute_roster_hash(roster: Dict[str, Agent]) -> str:
+    """Stable fingerprint of the starting roster (written to the ledger header)."""
+    import dataclasses
+    import hashlib
+    blob = json.dumps(
+        [dataclasses.asdict(roster[name]) for name in sorted(roster)],
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
 def run_prologue(events: List[Event], roster: Dict[str, Agent], seed: int, ledger_path: Path, weaver_turns_left: int) -> None:
     pass
 
-def run_simulation(
+def iter_simulation(
     seed: int, 
     turns: int, 
-    ledger_path: Path, 
+    ledger_path: Optional[Path], 
     char_dir: Path, 
     mode: str = "open",
     weaver_bankai: bool = False,
@@ -82,10 +105,96 @@ def run_simulation(
     audit_mode: str = "transparent",
     force_ricochet_target: str = None,
     # Phase 13 Arguments
-    use_samples: bool = False
-) -> Tuple[List[Event], Dict[str, Agent]]:
-    rng = random.Random(seed)
-    roster = load_roster(char_dir, use_samples=use_samples)
+    use_samples: bool = False,
+    # Ledger I/O
+    async_ledger: bool = False,
+    ledger_queue_size: int = DEFAULT_QUEUE_SIZE,
+    ledger_format: str = "jsonl",
+    ledger_index: bool = False,
+    ledger_sink: Optional[LedgerSink] = None,
+    dedupe_context: bool = True,
+    # Batch runs: pre-loaded roster (copied, never mutated) and sample dyad classes
+    roster: Optional[Dict[str, Agent]] = None,
+    dyad_classes: Optional[List[type]] = None,
+    # Statistics runs: no ledger, returns SimulationStats in place of the events list
+    stats_only: bool = False,
+    # Long runs: hooks see only the last N events; summary counters are kept incrementally
+    event_window: Optional[int] = None,
+    # What-if branches: yield checkpoints before these turns / resume from one
+    checkpoint_at: Optional[Iterable[int]] = None,
+    resume: Optional[SimulationCheckpoint] = None,
+    # Incremental re-simulation: first turn each roster field is read / written
+    read_log: Optional[Any] = None,
+    # Ricochet / net targets from an alias table (same distribution, other draws)
+    alias_sampling: bool = False,
+    # Paired comparisons: one keyed stream per decision point (core/crn.py)
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    # Random number backend for the run's stream (core/rng.py)
+    rng_backend: str = DEFAULT_BACKEND
+) -> Iterator[Union[Event, SimulationCheckpoint, SimulationSummary]]:
+    """
+    Streaming form of run_simulation: yields every Event once it is resolved
+    (at the latest at the next turn boundary), then one SimulationSummary.
+    Events are not retained unless a hook reads the history (dyads, scenario
+    audits), so memory is bounded by the consumer. Closing the generator
+    early closes the ledger.
+
+    `event_window=N` bounds that history too (1M+ turn runs): dyads see the
+    last N events (`ctx.events` is then an EventWindow, indexed and sliced
+    like the list), audits use the incrementally tracked last anomaly and the
+    summary carries SimulationStats counters.
+
+    `checkpoint_at=[t, ...]` yields a SimulationCheckpoint at each of those
+    turn boundaries (before turn t is played). `resume=checkpoint` skips the
+    prologue and turns already played and continues from the checkpoint's
+    state under this call's options (audit mode, weaver intensity, ...).
+    The global `random` is never read or restored.
+
+    `read_log` (core/incremental.py) records the first turn each agent field
+    is read or written, so a roster edit can be replayed from that turn on.
+
+    `alias_sampling=True` draws ricochet and snow-net targets from an alias
+    table (core/alias_sampler.py): O(1) per pick, same distribution, but a
+    different random stream, so seeds do not replay default-run ledgers.
+
+    `common_random_numbers=True` draws each decision point (thrower, target,
+    hit roll, ricochet roll, paradox reroll, ricochet/net picks, dyad hooks)
+    from its own stream keyed by seed, point and turn (core/crn.py), so two
+    configs run on the same seed consume the same numbers. `antithetic=True`
+    (implies it) mirrors every draw. Both replay different runs than the
+    default stream.
+
+    `rng_backend="numpy"` draws the run's stream from core/rng.py's block
+    backend (a NumPy PCG64 Generator filling buffers of doubles) instead of
+    random.Random. Deterministic per seed, but not the default stream.
+
+    Dyads roll their own dice on `ctx.rng_for(name)`: one stream per
+    component, seeded from seed + name and saved in checkpoints, so they do
+    not shift the run's stream or depend on the global `random`.
+    """
+    if rng_backend != DEFAULT_BACKEND and (common_random_numbers or antithetic):
+        raise ValueError("rng_backend applies to the single-stream run, not common_random_numbers")
+    rng = make_rng(seed, rng_backend)
+    components = ComponentStreams(seed, rng_backend)
+    streams = RandomStreams(seed, antithetic) if (common_random_numbers or antithetic) else None
+    checkpoint_at = set(checkpoint_at or ())
+    start_turn = 1
+    if resume is not None:
+        if resume.seed != seed:
+            raise ValueError(f"Checkpoint was taken from seed {resume.seed}, not {seed}")
+        if isinstance(resume.rng_state, dict) != (streams is not None):
+            raise ValueError("Checkpoint and run disagree on common_random_numbers")
+        if resume.options.get("rng_backend", DEFAULT_BACKEND) != rng_backend:
+            raise ValueError(f"Checkpoint was taken with rng_backend {resume.options.get('rng_backend', DEFAULT_BACKEND)!r}, not {rng_backend!r}")
+        roster = copy.deepcopy(resume.roster)
+        (streams or rng).setstate(resume.rng_state)
+        components.setstate(resume.component_rng_state)
+        start_turn = resume.turn
+    elif roster is None:
+        roster = load_roster(char_dir, use_samples=use_samples)
+    else:
+        roster = copy.deepcopy(roster)
     
     # Roster Lock for Classic Mode
     if mode == "classic":
@@ -93,30 +202,25 @@ def run_simulation(
     
     # Sort ordering
     if mode == "classic":
-        legacy_order = ["Kryssie", "Mega", "Ace", "Claude", "Janus", "Quinn"]
         def legacy_sort(agent: Agent) -> int:
-            try:
-                return legacy_order.index(agent.name)
-            except ValueError:
-                return 999
+            return LEGACY_RANK.get(agent.name, 999)
         agents = sorted(roster.values(), key=legacy_sort)
     else:
-        canon_order = get_canonical_order()
         def sort_key(agent: Agent) -> Tuple[int, str]:
-            try:
-                return (canon_order.index(agent.name), agent.name)
-            except ValueError:
-                return (999, agent.name)
+            return (CANON_RANK.get(agent.name, 999), agent.name)
         agents = sorted(roster.values(), key=sort_key)
     
-    ensure_dir(ledger_path.parent)
+    # SKLB already stores each distinct context once (its side table); per-turn
+    # ids would make those entries unique, so binary ledgers keep v1.4 contexts
+    context_refs = dedupe_context and ledger_format != "binary"
 
     import datetime
     def write_ledger_header():
         """Writes the cryptographic context for the simulation run."""
         header = {
             "event_type": "LEDGER_HEADER",
-            "version": "v1.4",
+            # v1.5: a turn context is written once (context_id) and then referenced (context_ref)
+            "version": "v1.5" if context_refs else "v1.4",
             "timestamp": datetime.datetime.now().isoformat(),
             "context": {
                 "seed": seed,
@@ -126,486 +230,678 @@ def run_simulation(
                 "weaver_intensity": weaver_intensity,
                 "scenario": scenario_name
             },
-            "roster_hash": "Pending",
+            "roster_hash": compute_roster_hash(roster),
             "roster_names": sorted(list(roster.keys()))
         }
-        with ledger_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(header, ensure_ascii=False) + "\n")
-
-    write_ledger_header()
-    
-    # --- TELEMETRY INIT ---
-    from core.telemetry import SnowballTelemetry
-    telemetry = SnowballTelemetry(seed)
+        if resume is not None:
+            header["context"]["checkpoint_turn"] = resume.turn
+        ledger.write(header)
+
+    if stats_only:
+        ledger_sink = NullLedgerSink()
+    if ledger_sink is not None:
+        # Caller-owned sink (memory / null / shared writer): flushed, not closed.
+        ledger = ledger_sink
+    else:
+        ensure_dir(ledger_path.parent)
+        # One handle for the whole run; lines are batched and flushed on exit.
+        # async_ledger moves encoding + disk writes onto a bounded writer thread.
+        ledger = open_ledger(
+            ledger_path, async_io=async_ledger, queue_size=ledger_queue_size,
+            fmt=ledger_format, index=ledger_index
+        )
+    records_payloads = getattr(ledger, "records_payloads", True)
+    table = None
+    try:
+        if records_payloads:
+            write_ledger_header()
+        # Per-throw fields live in parallel lists indexed by agent id; the
+        # roster's Agents are views over them until the run ends.
+        table = RosterTable(agents)
+        table.bind()
+        ids = table.ids  # name -> agent id
+        hits = HitTable(table)  # p_hit terms, recomputed only when their inputs change
+        if streams is not None:
+            rng_thrower, rng_target, rng_hit, rng_ricochet, rng_paradox, rng_pick, rng_hooks = (
+                streams[point] for point in DECISION_POINTS
+            )
+        else:
+            rng_thrower = rng_target = rng_hit = rng_ricochet = rng_paradox = rng_pick = rng_hooks = rng
+        if alias_sampling:
+            pick_ricochet = RicochetSampler(table).pick
+        else:
+            def pick_ricochet(rng: random.Random, exclude: int, count: int = 1) -> List[int]:
+                return mechanics.pick_ricochet_targets_ids(rng, table, exclude, count=count)
+        if read_log is not None:
+            read_log.attach(roster, table)
     
-    weaver_turns_left = 0
-    events: List[Event] = []
+        # --- TELEMETRY INIT ---
+        from core.telemetry import SnowballTelemetry
+        telemetry = SnowballTelemetry(seed)
 
-    def log_event_to_ledger(evt: Event) -> None:
-        telemetry.enrich_event_with_cues(evt)
-        
-        payload = {
-            "event_type": "SNOWBALL_EVENT:v2.0",
-            "seed": seed,
-            "tick": evt.tick,
-            "thrower": evt.thrower,
-            "intended": evt.intended,
-            "outcome": evt.outcome,
-            "actual": evt.actual,
-            "notes": evt.notes,
-            "roll_hit": evt.roll_hit,
-            "roll_ricochet": evt.roll_ricochet,
-            "p_hit": evt.p_hit,
-            "tags": evt.tags,
-            "context": evt.context,
-            "weaver_turns_left": weaver_turns_left,
-        }
-        with ledger_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        # Audits track the last anomaly as events are emitted (prologue included)
+        from .audit_manager import AuditManager
+        audit_manager = AuditManager(mode=audit_mode)
+    
+        weaver_turns_left = 0
+        # History read by hooks (ctx.events, audits); dropped below if nobody reads it
+        events: Union[List[Event], EventWindow] = EventWindow(maxlen=event_window) if event_window else []
+        keep_history = True
+        # Resolved but not yet yielded
+        pending: List[Event] = []
+        written_context_id = None
+        current_context: Optional[TurnContext] = None
+        stats = SimulationStats(seed=seed, turns=turns) if (stats_only or event_window) else None
+        if resume is not None:
+            weaver_turns_left = resume.weaver_turns_left
+            events.extend(resume.history)
+            current_context = resume.current_context
+            audit_manager.last_anomaly = resume.last_anomaly
+            if resume.stats is not None:
+                # Counters continue from turn 1, comparable with a straight run
+                stats = copy.deepcopy(resume.stats)
+                stats.turns = turns
+        # Cleared in stats runs once we know no hook reads the event history
+        record_events = True
+
+        def log_event_to_ledger(evt: Event) -> None:
+            nonlocal written_context_id
+            telemetry.enrich_event_with_cues(evt)
             
-        telemetry.log_game_event(evt)
+            if records_payloads:
+                payload = {
+                    "event_type": "SNOWBALL_EVENT:v2.0",
+                    "seed": seed,
+                    "tick": evt.tick,
+                    "thrower": evt.thrower,
+                    "intended": evt.intended,
+                    "outcome": evt.outcome,
+                    "actual": evt.actual,
+                    "notes": evt.notes,
+                    "roll_hit": evt.roll_hit,
+                    "roll_ricochet": evt.roll_ricochet,
+                    "p_hit": evt.p_hit,
+                    "tags": evt.raw_tags,
+                }
+                ctx_snapshot = evt.raw_context
+                if context_refs and isinstance(ctx_snapshot, TurnContext):
+                    # Shared turn snapshot: written once (with its id), then referenced
+                    if ctx_snapshot.context_id == written_context_id:
+                        payload["context_ref"] = ctx_snapshot.context_id
+                    else:
+                        payload["context"] = ctx_snapshot
+                        payload["context_id"] = ctx_snapshot.context_id
+                        written_context_id = ctx_snapshot.context_id
+                else:
+                    payload["context"] = ctx_snapshot
+                payload["weaver_turns_left"] = weaver_turns_left
+                ledger.write(payload)
+            
+            telemetry.log_game_event(evt)
+
+        def emit(evt: Event) -> None:
+            if stats is not None:
+                stats.count(evt.thrower, evt.outcome)
+            if scenario_name:
+                audit_manager.observe(evt) # Last anomaly, without rescanning history
+            if record_events:
+                if keep_history:
+                    events.append(evt)
+                pending.append(evt)
+                log_event_to_ledger(evt)
         
-    def knock_beer_and_summon_weaver(tick: int, notes: str) -> None:
-        nonlocal weaver_turns_left
-        if "Kryssie" not in roster:
-            return
+        def knock_beer_and_summon_weaver(tick: int, notes: str) -> None:
+            nonlocal weaver_turns_left
+            if "Kryssie" not in roster:
+                return
             
-        k = roster["Kryssie"]
-        if k.holding_beer:
-            k.holding_beer = False
-            k.frame = "COMBAT" # Re-enter combat frame
-            weaver_turns_left = 5
-            k.beer_dodge_bonus = 0.0
-            k.accuracy = mechanics.clamp(k.accuracy + 0.08)
+            k = roster["Kryssie"]
+            if k.holding_beer:
+                k.holding_beer = False
+                k.frame = "COMBAT" # Re-enter combat frame
+                weaver_turns_left = 5
+                k.beer_dodge_bonus = 0.0
+                k.accuracy = mechanics.clamp(k.accuracy + 0.08)
             
-            evt = Event(
-                tick=tick,
-                thrower="Weaver",
-                intended="Stage",
-                outcome="WEAVER_DESCENDS",
-                actual="Snow Net",
-                notes=notes,
-                roll_hit=0.0,
-                roll_ricochet=0.0,
-                p_hit=0.0,
-            )
-            events.append(evt)
-            log_event_to_ledger(evt)
+                evt = Event(
+                    tick=tick,
+                    thrower="Weaver",
+                    intended="Stage",
+                    outcome="WEAVER_DESCENDS",
+                    actual="Snow Net",
+                    notes=notes,
+                    roll_hit=0.0,
+                    roll_ricochet=0.0,
+                    p_hit=0.0,
+                )
+                emit(evt)
 
-    # --- PROLOGUE EXECUTION ---
-    run_prologue(events, roster, seed, ledger_path, weaver_turns_left)
+        # --- PROLOGUE EXECUTION ---
+        # (a resumed run already played it)
+        if resume is None:
+            run_prologue(events, roster, seed, ledger_path, weaver_turns_left)
     
-    if "Kryssie" in roster and "Janus" in roster and "Quinn" in roster:
-        evt = Event(
-            tick=-4, thrower="Kryssie", intended="Janus", outcome="JANUS_PARADOX", actual="Quinn",
-            notes="Canon Origin: Janus sees it coming. Quinn gets hit.", roll_hit=0.0, roll_ricochet=0.0, p_hit=1.0
-        )
-        events.append(evt)
-        log_event_to_ledger(evt)
-        roster["Quinn"].taken += 1
-        roster["Kryssie"].landed += 1
-
-    if "Quinn" in roster and "Kryssie" in roster and "Ace" in roster:
-        evt = Event(
-            tick=-3, thrower="Quinn", intended="Kryssie", outcome="RICOCHET_HIT", actual="Ace",
-            notes="Canon Origin: Kryssie ducks. Ace gets smacked.", roll_hit=0.0, roll_ricochet=0.0, p_hit=1.0
-        )
-        events.append(evt)
-        log_event_to_ledger(evt)
-        roster["Ace"].taken += 1
-        roster["Quinn"].landed += 1
+            if "Kryssie" in roster and "Janus" in roster and "Quinn" in roster:
+                evt = Event(
+                    tick=-4, thrower="Kryssie", intended="Janus", outcome="JANUS_PARADOX", actual="Quinn",
+                    notes="Canon Origin: Janus sees it coming. Quinn gets hit.", roll_hit=0.0, roll_ricochet=0.0, p_hit=1.0
+                )
+                emit(evt)
+                roster["Quinn"].taken += 1
+                roster["Kryssie"].landed += 1
+
+            if "Quinn" in roster and "Kryssie" in roster and "Ace" in roster:
+                evt = Event(
+                    tick=-3, thrower="Quinn", intended="Kryssie", outcome="RICOCHET_HIT", actual="Ace",
+                    notes="Canon Origin: Kryssie ducks. Ace gets smacked.", roll_hit=0.0, roll_ricochet=0.0, p_hit=1.0
+                )
+                emit(evt)
+                roster["Ace"].taken += 1
+                roster["Quinn"].landed += 1
     
-    if "Ace" in roster and "Kryssie" in roster:
-        ace = roster["Ace"]
-        kryssie = roster["Kryssie"]
-        ace.spite_meter = ace.spite_gain_on_hit
-        kryssie.holding_beer = True
-        kryssie.frame = "ONTOLOGICAL" # Phase 8
-        kryssie.beer_dodge_bonus = 0.0
+            if "Ace" in roster and "Kryssie" in roster:
+                ace = roster["Ace"]
+                kryssie = roster["Kryssie"]
+                ace.spite_meter = ace.spite_gain_on_hit
+                kryssie.holding_beer = True
+                kryssie.frame = "ONTOLOGICAL" # Phase 8
+                kryssie.beer_dodge_bonus = 0.0
         
-        evt = Event(
-            tick=-1, thrower="Ace", intended="Kryssie", outcome="DIPLOMACY", actual="Kryssie",
-            notes="Canon Origin: 'Hold my beer.' Ace Spite Active. Kryssie Beer Mode Active.", 
-            roll_hit=0.0, roll_ricochet=0.0, p_hit=1.0
-        )
-        events.append(evt)
-        log_event_to_ledger(evt)
+                evt = Event(
+                    tick=-1, thrower="Ace", intended="Kryssie", outcome="DIPLOMACY", actual="Kryssie",
+                    notes="Canon Origin: 'Hold my beer.' Ace Spite Active. Kryssie Beer Mode Active.", 
+                    roll_hit=0.0, roll_ricochet=0.0, p_hit=1.0
+                )
+                emit(evt)
 
-    # Initialize Managers
-    dyad_manager = DyadManager(roster)
-    bankai_manager = BankaiManager(roster)
+        # Initialize Managers
+        dyad_manager = DyadManager(roster, sample_classes=dyad_classes)
+        bankai_manager = BankaiManager(roster)
     
-    # Phase 8 Managers
-    from .scenario_manager import ScenarioQueue
-    from .audit_manager import AuditManager
+        # Phase 8 Managers
+        from .scenario_manager import ScenarioQueue
     
-    scenario_queue = ScenarioQueue()
-    if scenario_name:
-        scenario_queue.load(scenario_name)
-        
-    audit_manager = AuditManager(mode=audit_mode)
+        scenario_queue = ScenarioQueue()
+        if scenario_name:
+            scenario_queue.load(scenario_name)
+    
+        # Stats runs skip Event objects and note strings unless a hook reads
+        # the event history (dyads via ctx.events, scenario audits).
+        if stats_only and not dyad_manager.dyads and not scenario_name:
+            record_events = False
+        if not dyad_manager.dyads and not scenario_name:
+            keep_history = False
+            events.clear()
     
-    weaver_current_intensity = weaver_intensity
+        if resume is not None:
+            bankai_manager.state = copy.deepcopy(resume.bankai_state)
+            dyad_manager.set_state(resume.dyad_states)
+
+        weaver_current_intensity = weaver_intensity
     
-    class SimulationContext:
-        def __init__(self, roster, tick, rng, events, max_turns):
-            self.roster = roster
-            self.tick = tick
-            self.rng = rng
-            self.events = events
-            self.max_turns = max_turns
-
-    # --- MAIN LOOP ---
-    for t in range(1, turns + 1):
-        # RESET TRANSIENT MODS
-        for a in roster.values():
-            a.accuracy_mod = 1.0
-            a.dodge_mod = 1.0
+        class SimulationContext:
+            def __init__(self, roster, tick, rng, events, max_turns):
+                self.roster = roster
+                self.tick = tick
+                self.rng = rng
+                self.events = events
+                self.max_turns = max_turns
+                self.hit_table = hits  # HitTable: p_hit by agent id (ids by name: hit_table.table.ids)
+
+            def rng_for(self, component: str) -> random.Random:
+                """The run's stream for one component (e.g. a dyad's class name), seeded from seed + name."""
+                return components[component]
+
+        # --- MAIN LOOP ---
+        for t in range(start_turn, turns + 1):
+            if pending:
+                yield from pending
+                pending.clear()
+            if t in checkpoint_at:
+                yield SimulationCheckpoint(
+                    seed=seed,
+                    turn=t,
+                    options={
+                        "turns": turns,
+                        "mode": mode,
+                        "weaver_bankai": weaver_bankai,
+                        "weaver_intensity": weaver_intensity,
+                        "weaver_duration": weaver_duration,
+                        "resonance_debuff": resonance_debuff,
+                        "scenario_name": scenario_name,
+                        "audit_mode": audit_mode,
+                        "force_ricochet_target": force_ricochet_target, # Scenarios may have retargeted it
+                        "use_samples": use_samples,
+                        "alias_sampling": alias_sampling,
+                        "common_random_numbers": common_random_numbers or antithetic,
+                        "antithetic": antithetic,
+                        "rng_backend": rng_backend,
+                    },
+                    roster=copy.deepcopy(roster),
+                    rng_state=(streams or rng).getstate(),
+                    component_rng_state=components.getstate(),
+                    weaver_turns_left=weaver_turns_left,
+                    bankai_state=copy.deepcopy(bankai_manager.state),
+                    dyad_states=dyad_manager.get_state(),
+                    last_anomaly=audit_manager.last_anomaly,
+                    history=list(events),
+                    current_context=current_context,
+                    stats=copy.deepcopy(stats),
+                )
+            if read_log is not None:
+                read_log.tick = t
+            ledger.end_turn()
+
+            # RESET TRANSIENT MODS
+            table.reset_mods()
             
-        mechanics.apply_turn_decay(roster)
+            mechanics.apply_turn_decay(roster)
         
-        if weaver_turns_left > 0:
-            weaver_turns_left -= 1
+            if weaver_turns_left > 0:
+                weaver_turns_left -= 1
         
-        current_context = {
-            "ace_spite": round(roster["Ace"].spite_meter, 2) if "Ace" in roster else 0.0,
-            "weaver_active": weaver_turns_left > 0,
-            "weaver_intensity": weaver_current_intensity,
-        }
-        if "Kryssie" in roster:
-            current_context["kryssie_beer"] = roster["Kryssie"].holding_beer
-        if "Janus" in roster:
-            current_context["janus_budget"] = roster["Janus"].paradox_budget
-
-        with telemetry.trace_turn(t, current_context):
+            if record_events:
+                turn_state = {
+                    "ace_spite": round(roster["Ace"].spite_meter, 2) if "Ace" in roster else 0.0,
+                    "weaver_active": weaver_turns_left > 0,
+                    "weaver_intensity": weaver_current_intensity,
+                }
+                if "Kryssie" in roster:
+                    turn_state["kryssie_beer"] = roster["Kryssie"].holding_beer
+                if "Janus" in roster:
+                    turn_state["janus_budget"] = roster["Janus"].paradox_budget
+                # One immutable snapshot shared by every event of this turn
+                # (and of following turns, for as long as the state is unchanged)
+                if not (dedupe_context and turn_state == current_context):
+                    current_context = TurnContext(t, turn_state)
+
+            with telemetry.trace_turn(t, current_context or {}):
             
-            # --- SCENARIO INJECTION (Phase 8) ---
-            forced_actions = scenario_queue.get_actions_for_turn(t)
-            forced_intent = None
-            forced_actor = None
+                # --- SCENARIO INJECTION (Phase 8) ---
+                forced_actions = scenario_queue.get_actions_for_turn(t)
+                forced_intent = None
+                forced_actor = None
             
-            for action in forced_actions:
-                actor_name = action["actor"]
-                intent = action["intent"]
+                for action in forced_actions:
+                    actor_name = action["actor"]
+                    intent = action["intent"]
                 
-                # Execution Logic
-                if intent == "BANKAI_RELEASE":
-                    # Ace forces Bankai state, but turn proceeds normally
-                    bankai_manager.state.ace_focus = 10.0 # Force availablity
-                    # The turn start hook will trigger it naturally
-                    pass
-                elif intent == "FORCE_RICOCHET":
-                    forced_intent = "RICOCHET"
-                    forced_actor = actor_name
-                elif intent == "FORCE_RICOCHET_ON_ONTOLOGICAL":
-                    forced_intent = "RICOCHET"
-                    forced_actor = actor_name
-                    force_ricochet_target = action.get("target") # Override target
-                elif intent == "MEGA_AUDIT":
-                    # Instant Audit Action
-                    audit_events = audit_manager.evaluate_audit(t, events, roster) # Pass roster for Phase 9
-                    for ae in audit_events:
-                         events.append(ae)
-                         log_event_to_ledger(ae)
-                    continue # Audit consumes the turn (or is parallel?)
-                             # Mega consumes turn if actor is Mega.
-                             # Scenario implies Mega acts.
-                    if actor_name == "Mega":
-                         continue 
-                elif intent == "BEER_SIP":
-                     if "Kryssie" in roster:
-                         roster["Kryssie"].frame = "ONTOLOGICAL"
-                         # Proceed to maybe sip logic
+                    # Execution Logic
+                    if intent == "BANKAI_RELEASE":
+                        # Ace forces Bankai state, but turn proceeds normally
+                        bankai_manager.state.ace_focus = 10.0 # Force availablity
+                        # The turn start hook will trigger it naturally
+                        pass
+                    elif intent == "FORCE_RICOCHET":
+                        forced_intent = "RICOCHET"
+                        forced_actor = actor_name
+                    elif intent == "FORCE_RICOCHET_ON_ONTOLOGICAL":
+                        forced_intent = "RICOCHET"
+                        forced_actor = actor_name
+                        force_ricochet_target = action.get("target") # Override target
+                    elif intent == "MEGA_AUDIT":
+                        # Instant Audit Action
+                        audit_events = audit_manager.evaluate_audit(t, None, roster) # Pass roster for Phase 9
+                        for ae in audit_events:
+                             emit(ae)
+                        continue # Audit consumes the turn (or is parallel?)
+                                 # Mega consumes turn if actor is Mega.
+                                 # Scenario implies Mega acts.
+                        if actor_name == "Mega":
+                             continue 
+                    elif intent == "BEER_SIP":
+                         if "Kryssie" in roster:
+                             roster["Kryssie"].frame = "ONTOLOGICAL"
+                             # Proceed to maybe sip logic
                         
-            # --- START OF TURN HOOKS ---
-            if seed == 9999 and t == 5 and "Janus" in roster:
-                roster["Janus"].paradox_budget = 0
+                # --- START OF TURN HOOKS ---
+                if seed == 9999 and t == 5 and "Janus" in roster:
+                    roster["Janus"].paradox_budget = 0
                 
-            ctx = SimulationContext(roster, t, rng, events, turns)
+                if streams is not None:
+                    streams.begin_turn(t)
+                ctx = SimulationContext(roster, t, rng_hooks, events, turns)
             
-            dyad_events = dyad_manager.on_turn_start(ctx)
-            for de in dyad_events:
-                de.context = current_context.copy()
-                events.append(de)
-                log_event_to_ledger(de)
+                dyad_events = dyad_manager.on_turn_start(ctx)
+                for de in dyad_events:
+                    de.context = current_context
+                    emit(de)
                 
-            bankai_events = bankai_manager.on_turn_start(ctx)
-            for be in bankai_events:
-                be.context = current_context.copy()
-                events.append(be)
-                log_event_to_ledger(be)
-
-            # RITUAL OVERRIDES
-            if seed == 9999 and t == 5:
-                if "Quinn" in roster and "Janus" in roster:
-                    thrower = roster["Quinn"]
-                    target = roster["Janus"]
-            elif seed == 9999 and t == 7:
-                 if "Janus" in roster and "Quinn" in roster:
-                    thrower = roster["Janus"]
-                    target = roster["Quinn"]
-            else:
-                # Normal or Forced Actor
-                if forced_actor and forced_actor != "Any":
-                     thrower = roster.get(forced_actor, rng.choice(agents))
+                bankai_events = bankai_manager.on_turn_start(ctx)
+                for be in bankai_events:
+                    be.context = current_context
+                    emit(be)
+
+                # RITUAL OVERRIDES
+                if seed == 9999 and t == 5:
+                    if "Quinn" in roster and "Janus" in roster:
+                        thrower = roster["Quinn"]
+                        target = roster["Janus"]
+                elif seed == 9999 and t == 7:
+                     if "Janus" in roster and "Quinn" in roster:
+                        thrower = roster["Janus"]
+                        target = roster["Quinn"]
                 else:
-                     thrower = rng.choice(agents)
+                    # Normal or Forced Actor
+                    if forced_actor and forced_actor != "Any":
+                         thrower = roster.get(forced_actor, rng_thrower.choice(agents))
+                    else:
+                         thrower = rng_thrower.choice(agents)
                 
-                # Forced Target?
-                target = rng.choice([a for a in agents if a != thrower])
+                    # Forced Target? (anyone but the thrower; no per-turn list)
+                    target = agents[mechanics.pick_target_ids(rng_target, table, ids[thrower.name])]
 
-        # Beer mode logic
-        if thrower.name == "Kryssie" and thrower.holding_beer:
-            # Re-affirm Frame
-            thrower.frame = "ONTOLOGICAL"
+            ti = ids[thrower.name]
+
+            # Beer mode logic
+            if ti == table.kryssie and thrower.holding_beer:
+                # Re-affirm Frame
+                thrower.frame = "ONTOLOGICAL"
             
-            thrower.beer_dodge_bonus = mechanics.clamp(
-                thrower.beer_dodge_bonus + thrower.beer_dodge_bonus_step, 
-                0.0, 
-                thrower.beer_dodge_bonus_cap
-            )
-            evt = Event(
-                tick=t,
-                thrower="Kryssie",
-                intended="(none)",
-                outcome="BEER_SIP",
-                actual="(peace maintained)",
-                notes=f"Dodge up (+{thrower.beer_dodge_bonus_step:.2f}, now {thrower.beer_dodge_bonus:.2f}). Frame: ONTOLOGICAL",
-                roll_hit=rng.random(),
-                roll_ricochet=rng.random(),
-                p_hit=0.0
-            )
-            events.append(evt)
-            log_event_to_ledger(evt)
-            continue
+                thrower.beer_dodge_bonus = mechanics.clamp(
+                    thrower.beer_dodge_bonus + thrower.beer_dodge_bonus_step, 
+                    0.0, 
+                    thrower.beer_dodge_bonus_cap
+                )
+                if record_events:
+                    evt = Event(
+                        tick=t,
+                        thrower="Kryssie",
+                        intended="(none)",
+                        outcome="BEER_SIP",
+                        actual="(peace maintained)",
+                        notes=f"Dodge up (+{thrower.beer_dodge_bonus_step:.2f}, now {thrower.beer_dodge_bonus:.2f}). Frame: ONTOLOGICAL",
+                        roll_hit=rng_hit.random(),
+                        roll_ricochet=rng_ricochet.random(),
+                        p_hit=0.0
+                    )
+                    emit(evt)
+                else:
+                    rng_hit.random() # roll_hit: keep the RNG stream identical to a full run
+                    rng_ricochet.random() # roll_ricochet
+                    stats.count("Kryssie", "BEER_SIP")
+                continue
 
-        # Target Selection
-        if not (seed == 9999 and t in [5,7]):
-             target = mechanics.pick_target(rng, thrower, agents)
+            # Target Selection
+            if not (seed == 9999 and t in [5,7]):
+                 gi = mechanics.pick_target_ids(rng_target, table, ti)
+                 target = agents[gi]
+            else:
+                 gi = ids[target.name]
              
-        # Phase 8: Ontological Frame Check
-        if target.frame == "ONTOLOGICAL":
-             evt = Event(
-                tick=t,
-                thrower=thrower.name,
-                intended=target.name,
-                outcome="LAYER_EXEMPTION",
-                actual=target.name,
-                notes="Target is in Ontological Layer. Combat invalid.",
-                roll_hit=0.0, roll_ricochet=0.0, p_hit=0.0,
-                context=current_context
-            )
-             events.append(evt)
-             log_event_to_ledger(evt)
-             continue
-        
-        dyad_manager.on_target_selected(ctx, thrower.name, target.name)
+            # Phase 8: Ontological Frame Check
+            if table.frame[gi] == "ONTOLOGICAL":
+                 if record_events:
+                     evt = Event(
+                        tick=t,
+                        thrower=thrower.name,
+                        intended=target.name,
+                        outcome="LAYER_EXEMPTION",
+                        actual=target.name,
+                        notes="Target is in Ontological Layer. Combat invalid.",
+                        roll_hit=0.0, roll_ricochet=0.0, p_hit=0.0,
+                        context=current_context
+                    )
+                     emit(evt)
+                 else:
+                     stats.count(thrower.name, "LAYER_EXEMPTION")
+                 continue
         
-        # Interception
-        rescuer_name = dyad_manager.check_interception(ctx, thrower.name, target.name, rng)
-        if rescuer_name:
-            rescuer = roster.get(rescuer_name)
-            if rescuer:
-                target = rescuer
-
-        roll_hit = rng.random()
-        roll_ric = rng.random()
-
-        roll_hit, used_paradox, paradox_note = mechanics.maybe_janus_paradox_reroll(rng, thrower, roll_hit)
+            dyad_manager.on_target_selected(ctx, thrower.name, target.name)
         
-        is_bankai_active = (weaver_turns_left > 0) and weaver_bankai
+            # Interception
+            rescuer_name = dyad_manager.check_interception(ctx, thrower.name, target.name, rng_hooks)
+            if rescuer_name:
+                rescuer = roster.get(rescuer_name)
+                if rescuer:
+                    target = rescuer
+                    gi = ids[target.name]
+
+            roll_hit = rng_hit.random()
+            roll_ric = rng_ricochet.random()
+
+            roll_hit, used_paradox, paradox_note = mechanics.maybe_janus_paradox_reroll(rng_paradox, thrower, roll_hit)
         
-        p_hit = mechanics.compute_p_hit(
-            roster, 
-            thrower, 
-            target, 
-            weaver_active=(weaver_turns_left > 0),
-            weaver_intensity=weaver_current_intensity,
-            resonance_debuff=resonance_debuff if is_bankai_active else 0.0
-        )
+            is_bankai_active = (weaver_turns_left > 0) and weaver_bankai
         
-        was_untouchable, untouch_note = mechanics.janus_untouchable_gate(roster.get("Janus"), target) \
-                                        if "Janus" in roster else (False, "")
-        if was_untouchable:
-            evt = Event(
-                tick=t,
-                thrower=thrower.name,
-                intended=target.name,
-                outcome="UNTOUCHABLE",
-                actual=target.name,
-                notes=untouch_note,
-                roll_hit=roll_hit,
-                roll_ricochet=roll_ric,
-                p_hit=p_hit,
-                context=current_context
+            p_hit = hits.p_hit(
+                ti,
+                gi,
+                weaver_active=(weaver_turns_left > 0),
+                weaver_intensity=weaver_current_intensity,
+                resonance_debuff=resonance_debuff if is_bankai_active else 0.0
             )
-            events.append(evt)
-            log_event_to_ledger(evt)
-            continue
-
-        note_bits = []
-        if used_paradox:
-             note_bits.append(f"[PARADOX_REROLL] {paradox_note}")
-        if rescuer_name:
-             note_bits.append(f"[TWIN_RESCUE] {rescuer_name} intercepts!")
-        if is_bankai_active:
-             note_bits.append(f"[BANKAI] Dodge reduced via Resonance.")
-
-        hit = roll_hit < p_hit
         
-        # Phase 8: Force Ricochet Logic (Injector)
-        if forced_intent == "RICOCHET":
-             hit = False # Force Miss initially
-             # We rely on the MISS block to handle ricochet
-             # But we need to ensure roll_ric < 0.25 (or force it)
-             # Actually, simpler to just force the flow below.
-
-        if hit and not forced_intent == "RICOCHET":
-            thrower.landed += 1
-            target.taken += 1
-
-            if target.name == "Ace" and "Ace" in roster:
-                ace = roster["Ace"]
-                ace.spite_meter = mechanics.clamp(ace.spite_meter + ace.spite_gain_on_hit)
-                note_bits.append(f"Ace spite_meter -> {ace.spite_meter:.2f}")
-            
-            if target.name == "Kryssie":
-                knock_beer_and_summon_weaver(t, "Beer knocked. Weaver descends.")
-
-            dyad_hit_events = dyad_manager.on_hit(ctx, thrower.name, target.name)
-            for dhe in dyad_hit_events:
-                events.append(dhe)
-                log_event_to_ledger(dhe)
-                if dhe.outcome == "JOY_CASCADE":
-                     note_bits.append(dhe.notes)
-                if dhe.outcome == "MIND_FORGE":
-                     note_bits.append(f"[MIND_FORGE] {dhe.actual}")
-            
-            bankai_manager.on_hit(ctx, thrower.name, target.name)
-
-            evt = Event(
-                tick=t,
-                thrower=thrower.name,
-                intended=target.name,
-                outcome="HIT",
-                actual=target.name,
-                notes=" ".join(note_bits).strip(),
-                roll_hit=roll_hit,
-                roll_ricochet=roll_ric,
-                p_hit=p_hit,
-                context=current_context
-            )
-            events.append(evt)
-            log_event_to_ledger(evt)
-
-        else:
-            # MISS
-            if weaver_turns_left > 0:
-                # Weaver Net Mode (unchanged)
-                multi = rng.randint(2, 4)
-                targets = mechanics.pick_ricochet_targets(
-                    rng, agents, exclude_names=[thrower.name], count=multi
-                )
-                summoner = roster.get("Kryssie")
-                for idx, actual in enumerate(targets, start=1):
-                     # ... (keep existing net logic) ...
-                     # For brevity, reusing existing block logic in mind
-                     credit_agent = summoner if summoner else thrower
-                     credit_agent.landed += 1
-                     actual.taken += 1
-                     evt = Event(
+            was_untouchable, untouch_note = mechanics.janus_untouchable_gate_ids(table, gi)
+            if was_untouchable:
+                if record_events:
+                    evt = Event(
                         tick=t,
                         thrower=thrower.name,
                         intended=target.name,
-                        outcome=f"SNOW_NET_HIT ({idx}/{len(targets)})",
-                        actual=actual.name,
-                        notes=("MISS -> NET [Credit: Weaver] " + " ".join(note_bits)).strip(),
+                        outcome="UNTOUCHABLE",
+                        actual=target.name,
+                        notes=untouch_note,
                         roll_hit=roll_hit,
                         roll_ricochet=roll_ric,
                         p_hit=p_hit,
+                        context=current_context
                     )
-                     events.append(evt)
-                     log_event_to_ledger(evt)
+                    emit(evt)
+                else:
+                    stats.count(thrower.name, "UNTOUCHABLE")
                 continue
 
-            # Standard Miss / Ricochet
-            # Check Force
-            force_ric = (forced_intent == "RICOCHET")
-            is_ricochet = (roll_ric < 0.25) or force_ric
+            note_bits = []
+            if record_events:
+                if used_paradox:
+                     note_bits.append(f"[PARADOX_REROLL] {paradox_note}")
+                if rescuer_name:
+                     note_bits.append(f"[TWIN_RESCUE] {rescuer_name} intercepts!")
+                if is_bankai_active:
+                     note_bits.append(f"[BANKAI] Dodge reduced via Resonance.")
+
+            hit = roll_hit < p_hit
+        
+            # Phase 8: Force Ricochet Logic (Injector)
+            if forced_intent == "RICOCHET":
+                 hit = False # Force Miss initially
+                 # We rely on the MISS block to handle ricochet
+                 # But we need to ensure roll_ric < 0.25 (or force it)
+                 # Actually, simpler to just force the flow below.
+
+            if hit and not forced_intent == "RICOCHET":
+                table.landed[ti] += 1
+                table.taken[gi] += 1
+
+                if gi == table.ace:
+                    ace = roster["Ace"]
+                    ace.spite_meter = mechanics.clamp(ace.spite_meter + ace.spite_gain_on_hit)
+                    if record_events:
+                        note_bits.append(f"Ace spite_meter -> {ace.spite_meter:.2f}")
             
-            if is_ricochet:
-                if force_ricochet_target and force_ric:
-                     # Force specific target if valid
-                     cand = roster.get(force_ricochet_target)
-                     if cand and cand != thrower:
-                         actual = cand
-                     else:
-                         actual = mechanics.pick_ricochet_targets(rng, agents, exclude_names=[thrower.name], count=1)[0]
-                else:
-                    actual = mechanics.pick_ricochet_targets(rng, agents, exclude_names=[thrower.name], count=1)[0]
-                
-                # Phase 9: Ontological Deflection (Ricochet Immunity)
-                if actual.frame == "ONTOLOGICAL":
-                     evt = Event(
+                if gi == table.kryssie:
+                    knock_beer_and_summon_weaver(t, "Beer knocked. Weaver descends.")
+
+                dyad_hit_events = dyad_manager.on_hit(ctx, thrower.name, target.name)
+                for dhe in dyad_hit_events:
+                    emit(dhe)
+                    if dhe.outcome == "JOY_CASCADE":
+                         note_bits.append(dhe.notes)
+                    if dhe.outcome == "MIND_FORGE":
+                         note_bits.append(f"[MIND_FORGE] {dhe.actual}")
+            
+                bankai_manager.on_hit(ctx, thrower.name, target.name)
+
+                if record_events:
+                    evt = Event(
                         tick=t,
                         thrower=thrower.name,
                         intended=target.name,
-                        outcome="LAYER_EXEMPTION",
-                        actual=actual.name,
-                        notes="Ricochet deflected by Ontological Frame.",
+                        outcome="HIT",
+                        actual=target.name,
+                        notes=" ".join(note_bits).strip(),
                         roll_hit=roll_hit,
                         roll_ricochet=roll_ric,
                         p_hit=p_hit,
                         context=current_context
                     )
-                     events.append(evt)
-                     log_event_to_ledger(evt)
-                     continue
-
-                thrower.landed += 1
-                actual.taken += 1
-                
-                if actual.name == "Ace" and "Ace" in roster:
-                    ace = roster["Ace"]
-                    ace.spite_meter = mechanics.clamp(ace.spite_meter + ace.spite_gain_on_hit)
-                    note_bits.append(f"Ace spite_meter -> {ace.spite_meter:.2f}")
-
-                if actual.name == "Kryssie":
-                    knock_beer_and_summon_weaver(t, "Beer knocked by ricochet.")
+                    emit(evt)
+                else:
+                    stats.count(thrower.name, "HIT")
 
-                evt = Event(
-                    tick=t,
-                    thrower=thrower.name,
-                    intended=target.name,
-                    outcome="RICOCHET_HIT",
-                    actual=actual.name,
-                    notes=("MISS RICOCHET " + " ".join(note_bits) + (" [FORCED]" if force_ric else "")).strip(),
-                    roll_hit=roll_hit,
-                    roll_ricochet=0.0 if force_ric else roll_ric,
-                    p_hit=p_hit,
-                    context=current_context
-                )
-                events.append(evt)
-                log_event_to_ledger(evt)
             else:
-                evt = Event(
-                    tick=t,
-                    thrower=thrower.name,
-                    intended=target.name,
-                    outcome="MISS",
-                    actual=target.name,
-                    notes=" ".join(note_bits).strip(),
-                    roll_hit=roll_hit,
-                    roll_ricochet=roll_ric,
-                    p_hit=p_hit,
-                    context=current_context
-                )
-                events.append(evt)
-                log_event_to_ledger(evt)
+                # MISS
+                if weaver_turns_left > 0:
+                    # Weaver Net Mode (unchanged)
+                    multi = rng_pick.randint(2, 4)
+                    targets = [agents[i] for i in pick_ricochet(rng_pick, ti, count=multi)]
+                    summoner = roster.get("Kryssie")
+                    for idx, actual in enumerate(targets, start=1):
+                         # ... (keep existing net logic) ...
+                         # For brevity, reusing existing block logic in mind
+                         credit_agent = summoner if summoner else thrower
+                         credit_agent.landed += 1
+                         actual.taken += 1
+                         if record_events:
+                             evt = Event(
+                                tick=t,
+                                thrower=thrower.name,
+                                intended=target.name,
+                                outcome=f"SNOW_NET_HIT ({idx}/{len(targets)})",
+                                actual=actual.name,
+                                notes=("MISS -> NET [Credit: Weaver] " + " ".join(note_bits)).strip(),
+                                roll_hit=roll_hit,
+                                roll_ricochet=roll_ric,
+                                p_hit=p_hit,
+                            )
+                             emit(evt)
+                         else:
+                             stats.count(thrower.name, f"SNOW_NET_HIT ({idx}/{len(targets)})")
+                    continue
+
+                # Standard Miss / Ricochet
+                # Check Force
+                force_ric = (forced_intent == "RICOCHET")
+                is_ricochet = (roll_ric < 0.25) or force_ric
+            
+                if is_ricochet:
+                    if force_ricochet_target and force_ric:
+                         # Force specific target if valid
+                         cand = roster.get(force_ricochet_target)
+                         if cand and cand is not thrower:
+                             actual = cand
+                         else:
+                             actual = agents[pick_ricochet(rng_pick, ti)[0]]
+                    else:
+                        actual = agents[pick_ricochet(rng_pick, ti)[0]]
+                    ai = ids[actual.name]
+                
+                    # Phase 9: Ontological Deflection (Ricochet Immunity)
+                    if table.frame[ai] == "ONTOLOGICAL":
+                         if record_events:
+                             evt = Event(
+                                tick=t,
+                                thrower=thrower.name,
+                                intended=target.name,
+                                outcome="LAYER_EXEMPTION",
+                                actual=actual.name,
+                                notes="Ricochet deflected by Ontological Frame.",
+                                roll_hit=roll_hit,
+                                roll_ricochet=roll_ric,
+                                p_hit=p_hit,
+                                context=current_context
+                            )
+                             emit(evt)
+                         else:
+                             stats.count(thrower.name, "LAYER_EXEMPTION")
+                         continue
+
+                    table.landed[ti] += 1
+                    table.taken[ai] += 1
+                
+                    if ai == table.ace:
+                        ace = roster["Ace"]
+                        ace.spite_meter = mechanics.clamp(ace.spite_meter + ace.spite_gain_on_hit)
+                        if record_events:
+                            note_bits.append(f"Ace spite_meter -> {ace.spite_meter:.2f}")
+
+                    if ai == table.kryssie:
+                        knock_beer_and_summon_weaver(t, "Beer knocked by ricochet.")
+
+                    if record_events:
+                        evt = Event(
+                            tick=t,
+                            thrower=thrower.name,
+                            intended=target.name,
+                            outcome="RICOCHET_HIT",
+                            actual=actual.name,
+                            notes=("MISS RICOCHET " + " ".join(note_bits) + (" [FORCED]" if force_ric else "")).strip(),
+                            roll_hit=roll_hit,
+                            roll_ricochet=0.0 if force_ric else roll_ric,
+                            p_hit=p_hit,
+                            context=current_context
+                        )
+                        emit(evt)
+                    else:
+                        stats.count(thrower.name, "RICOCHET_HIT")
+                else:
+                    if record_events:
+                        evt = Event(
+                            tick=t,
+                            thrower=thrower.name,
+                            intended=target.name,
+                            outcome="MISS",
+                            actual=target.name,
+                            notes=" ".join(note_bits).strip(),
+                            roll_hit=roll_hit,
+                            roll_ricochet=roll_ric,
+                            p_hit=p_hit,
+                            context=current_context
+                        )
+                        emit(evt)
+                    else:
+                        stats.count(thrower.name, "MISS")
+
+            dyad_end_events = dyad_manager.on_turn_end(ctx)
+            for dee in dyad_end_events:
+                emit(dee)
+
+        yield from pending
+        pending.clear()
+    finally:
+        if read_log is not None:
+            read_log.detach(roster)
+        if table is not None:
+            table.unbind()
+        if ledger_sink is None:
+            ledger.close()
+        else:
+            ledger.flush()
 
-        dyad_end_events = dyad_manager.on_turn_end(ctx)
-        for dee in dyad_end_events:
-            events.append(dee)
-            log_event_to_ledger(dee)
+    if stats is not None:
+        stats.collect(roster)
+    yield SimulationSummary(seed=seed, turns=turns, roster=roster, stats=stats)
 
-    return events, roster
+def run_simulation(
+    seed: int,
+    turns: int,
+    ledger_path: Optional[Path],
+    char_dir: Path,
+    **options
+) -> Tuple[Union[List[Event], SimulationStats], Dict[str, Agent]]:
+    """
+    Runs a whole simulation and returns (events, roster), or
+    (SimulationStats, roster) with `stats_only=True`.
+    Options are those of iter_simulation.
+    """
+    events: List[Event] = []
+    summary = None
+    for item in iter_simulation(seed, turns, ledger_path, char_dir, **options):
+        if isinstance(item, SimulationSummary):
+            summary = item
+        elif not isinstance(item, SimulationCheckpoint):
+            events.append(item)
+    if options.get("stats_only"):
+        return summary.stats, summary.roster
+    return events, summary.roster
@@ -121,8 +121,8 @@ class SnowballTelemetry:
                 span.set_attribute("game.notes", event.notes)
                 
                 # Context Tags (Rich Ledger)
-                if event.tags:
-                    for tag in event.tags:
+                if event.raw_tags:
+                    for tag in event.raw_tags:
                         span.set_attribute(f"game.tag.{tag}", True)
 
                 # 3. THE NERVOUS SYSTEM LINK
@@ -161,6 +161,7 @@ class SnowballTelemetry:
             cue = {"character": "Seraphina", "tone": "ceremonial", "key": "emergence"}
         
         # 2. Inject Cue
+        # Copy-on-write: event.context may be the turn's shared TurnContext
         if cue:
-            event.context["voice_cue"] = cue
+            event.context = {**event.raw_context, "voice_cue": cue}
 
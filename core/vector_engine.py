@@ -0,0 +1,215 @@
+"""
+vector_engine.py
+NumPy lockstep engine for plain-roster parameter studies.
+
+Without canon agents, dyads or scenarios a turn of run_simulation reduces to:
+pick a thrower, pick a target, compare `roll_hit` with `compute_p_hit`, and on
+a miss check for a ricochet (Quinn-capped weighted pick). run_arenas plays
+that turn for thousands of independent arenas at once, with accuracy, dodge
+and the transient mods held as `arenas x agents` arrays.
+
+The per-agent landed/taken distributions match core/mechanics.py; individual
+arenas do not replay the random.Random stream of a given run_simulation seed.
+
+NumPy is optional: the rest of the simulator never imports this module.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .models import Agent
+
+# Agents whose rules live outside the plain turn (spite, Bankai, paradox, beer/Weaver)
+SPECIAL_AGENTS = {
+    "Ace": "spite meter and Bankai focus",
+    "Mega": "Bankai audit",
+    "Janus": "paradox rerolls and untouchable budget",
+    "Kryssie": "beer mode and the Weaver",
+}
+
+RICOCHET_CHANCE = 0.25  # run_simulation: roll_ric < 0.25
+QUINN_NAME = "Quinn"
+QUINN_CAP = 0.45  # mechanics.pick_ricochet_targets default
+
+OUTCOMES = ("HIT", "RICOCHET_HIT", "MISS", "LAYER_EXEMPTION")
+
+
+class UnsupportedRosterError(ValueError):
+    """The roster needs rules the vector engine does not model."""
+
+
+def check_plain_roster(roster: Dict[str, Agent], dyad_classes: Optional[List[type]] = None) -> None:
+    """Raises UnsupportedRosterError unless every turn of this roster is a plain throw."""
+    problems = [f"{name} ({why})" for name, why in SPECIAL_AGENTS.items() if name in roster]
+    if len(roster) < 2:
+        problems.append("needs at least two agents")
+
+    from .dyad_manager import DyadManager
+    dyads = DyadManager(roster, sample_classes=dyad_classes).dyads
+    problems.extend(f"dyad {type(d).__name__}" for d in dyads)
+
+    if problems:
+        raise UnsupportedRosterError("Roster is not plain: " + ", ".join(problems))
+
+
+@dataclass
+class ArenaResult:
+    names: List[str]
+    landed: Any  # int64[arenas, agents]
+    taken: Any   # int64[arenas, agents]
+    outcomes: Dict[str, Any]  # outcome -> int64[agents], counted per thrower
+    turns: int
+
+    @property
+    def arenas(self) -> int:
+        return self.landed.shape[0]
+
+    @property
+    def throws(self) -> int:
+        return self.arenas * self.turns
+
+    def to_batch_result(self):
+        """Folds the arenas into the same aggregate `snowball.py batch` reports."""
+        from .batch import AgentStats, BatchResult
+        result = BatchResult(runs=self.arenas)
+        mvp = np.bincount(self.landed.argmax(axis=1), minlength=len(self.names))  # first max, like max()
+        for i, name in enumerate(self.names):
+            landed = self.landed[:, i]
+            taken = self.taken[:, i]
+            stats = result.agents[name] = AgentStats(
+                name,
+                runs=self.arenas,
+                landed_sum=int(landed.sum()),
+                landed_sq=int((landed * landed).sum()),
+                taken_sum=int(taken.sum()),
+                taken_sq=int((taken * taken).sum()),
+                mvp_count=int(mvp[i]),
+            )
+            for outcome in OUTCOMES:
+                count = int(self.outcomes[outcome][i])
+                if count:
+                    stats.outcomes[outcome] = count
+                    result.outcomes[outcome] += count
+        return result
+
+
+def run_arenas(
+    roster: Dict[str, Agent],
+    arenas: int,
+    turns: int,
+    seed: Optional[int] = None,
+    accuracy: Any = None,
+    dodge: Any = None,
+    accuracy_mod: Any = None,
+    dodge_mod: Any = None,
+    dyad_classes: Optional[List[type]] = None,
+) -> ArenaResult:
+    """
+    Plays `turns` turns in `arenas` independent arenas of the same roster.
+
+    `accuracy`, `dodge` and the mods default to the roster's values and may be
+    given as anything broadcastable to (arenas, agents) for parameter sweeps.
+    Agent order (columns) is the roster's order.
+    """
+    if np is None:
+        raise ImportError("The vector engine requires NumPy (pip install numpy)")
+    check_plain_roster(roster, dyad_classes)
+
+    agents = list(roster.values())
+    names = [a.name for a in agents]
+    n = len(agents)
+    shape = (arenas, n)
+
+    def table(values: Any, default: List[float]) -> Any:
+        return np.broadcast_to(np.asarray(default if values is None else values, dtype=np.float64), shape)
+
+    acc = table(accuracy, [a.accuracy for a in agents])
+    dod = table(dodge, [a.dodge for a in agents])
+    acc_mod = table(accuracy_mod, [1.0] * n)
+    dod_mod = table(dodge_mod, [1.0] * n)
+    ontological = np.array([a.frame == "ONTOLOGICAL" for a in agents])
+
+    # Ricochet weights (mechanics.pick_ricochet_targets): 1.0, Quinn +stray_magnet, capped
+    base_weights = np.array([1.0 + (a.stray_magnet if a.name == QUINN_NAME else 0.0) for a in agents])
+    quinn = names.index(QUINN_NAME) if QUINN_NAME in names else None
+
+    rng = np.random.default_rng(seed)
+    landed = np.zeros(shape, dtype=np.int64)
+    taken = np.zeros(shape, dtype=np.int64)
+    outcomes = {o: np.zeros(n, dtype=np.int64) for o in OUTCOMES}
+    rows = np.arange(arenas)
+
+    for _ in range(turns):
+        # Thrower, then a target among the others (mechanics.pick_target)
+        thrower = rng.integers(0, n, arenas)
+        target = rng.integers(0, n - 1, arenas)
+        target += target >= thrower
+        roll_hit = rng.random(arenas)
+        roll_ric = rng.random(arenas)
+
+        # Layer exemption: ontological targets cannot be engaged
+        exempt = ontological[target]
+
+        # mechanics.compute_p_hit without Ace spite / beer / Weaver
+        p_hit = acc[rows, thrower] * acc_mod[rows, thrower] * (1.0 - dod[rows, target] * dod_mod[rows, target])
+        np.clip(p_hit, 0.0, 1.0, out=p_hit)
+
+        hit = ~exempt & (roll_hit < p_hit)
+        missed = ~exempt & ~hit
+        ricochet = missed & (roll_ric < RICOCHET_CHANCE)
+
+        landed[rows[hit], thrower[hit]] += 1
+        taken[rows[hit], target[hit]] += 1
+
+        ric_rows = rows[ricochet]
+        ric_hit = np.zeros(arenas, dtype=bool)
+        ric_exempt = np.zeros(arenas, dtype=bool)
+        if ric_rows.size:
+            ric_thrower = thrower[ric_rows]
+            actual = _pick_ricochet(rng, base_weights, quinn, ric_thrower)
+            deflected = ontological[actual]
+            ric_exempt[ric_rows[deflected]] = True
+            ric_hit[ric_rows[~deflected]] = True
+            ok = ~deflected
+            landed[ric_rows[ok], ric_thrower[ok]] += 1
+            taken[ric_rows[ok], actual[ok]] += 1
+
+        outcomes["HIT"] += np.bincount(thrower[hit], minlength=n)
+        outcomes["RICOCHET_HIT"] += np.bincount(thrower[ric_hit], minlength=n)
+        outcomes["MISS"] += np.bincount(thrower[missed & ~ricochet], minlength=n)
+        outcomes["LAYER_EXEMPTION"] += np.bincount(thrower[exempt | ric_exempt], minlength=n)
+
+    return ArenaResult(names=names, landed=landed, taken=taken, outcomes=outcomes, turns=turns)
+
+
+def _pick_ricochet(rng: Any, base_weights: Any, quinn: Optional[int], thrower: Any) -> Any:
+    """Vectorized mechanics.pick_ricochet_targets(count=1), excluding each row's thrower."""
+    k = thrower.size
+    weights = np.tile(base_weights, (k, 1))
+    weights[np.arange(k), thrower] = 0.0
+    total = weights.sum(axis=1)
+
+    if quinn is not None:
+        wq = weights[:, quinn]
+        other = total - wq
+        over = (wq / total) > QUINN_CAP
+        if over.any():
+            capped = np.maximum(0.01, QUINN_CAP * other / (1.0 - QUINN_CAP))
+            weights[over, quinn] = capped[over]
+            total = weights.sum(axis=1)
+
+    r = rng.random(k) * total
+    cumulative = np.cumsum(weights, axis=1)
+    chosen = (cumulative >= r[:, None]) & (weights > 0.0)
+    actual = chosen.argmax(axis=1)
+    # Rounding fallback (r past the last bucket): last candidate, like the scalar loop
+    none = ~chosen.any(axis=1)
+    if none.any():
+        last = weights.shape[1] - 1 - (weights[:, ::-1] > 0.0).argmax(axis=1)
+        actual[none] = last[none]
+    return actual
@@ -5,6 +5,15 @@ class Dyad(Protocol):
     """
     Protocol for a Dyad interaction module.
     Each method receives a context object (ctx) providing access to the roster/sim state.
+
+    Optional class attributes narrow dispatch (DyadManager): `hooks`, the
+    hook names to call, and `watch_throwers` / `watch_targets`, the agents
+    whose throws reach the throw hooks (on_target_selected, on_hit,
+    check_interception).
+
+    `ctx.events` is the run's event history: a list, or with
+    `event_window=N` a core.models.EventWindow holding the last N events.
+    Both support len, iteration, indexing and slicing (`ctx.events[-3:]`).
     """
     def on_turn_start(self, ctx: Any) -> List[Event]:
         """Called at the start of a turn, after stats reset."""
@@ -7,6 +7,13 @@ class CustomDyadTemplate:
     Rename this class and implement the logic below.
     """
 
+    # Optional dispatch filters (DyadManager calls a dyad only where it listens):
+    # hooks: the hook methods to call (default: all of them)
+    # watch_throwers / watch_targets: throw hooks (on_target_selected, on_hit,
+    # check_interception) only fire for throws by / at these agents
+    # hooks = ("on_turn_start", "on_hit")
+    # watch_targets = {"Robin"}
+
     @staticmethod
     def check_requirements(roster: Dict[str, Agent]) -> bool:
         """
@@ -37,6 +44,8 @@ class CustomDyadTemplate:
         """
         Called when a hit occurs.
         Return a list of Events to log special effects.
+        Roll dice on ctx.rng_for("CustomDyadTemplate"), never the global
+        `random`, so the same seed replays the same run.
         """
         # Example:
         # if thrower_id == "Batman" and target_id == "Joker":
@@ -1,6 +1,5 @@
 from typing import Any, List, Dict
 from core.models import Event, Agent
-import random
 
 class ChaosContainmentDyad:
     """
@@ -9,6 +8,10 @@ class ChaosContainmentDyad:
     If Wildcard causes too much chaos (hits someone), Sentinel cleans it up (restores stamina/order).
     """
 
+    # Dispatch: only called on Wildcard's hits
+    hooks = ("on_hit",)
+    watch_throwers = {"Wildcard-04"}
+
     @staticmethod
     def check_requirements(roster: Dict[str, Agent]) -> bool:
         return "Sentinel-02" in roster and "Wildcard-04" in roster
@@ -25,7 +28,7 @@ class ChaosContainmentDyad:
         # If Wildcard lands a hit...
         if thrower_id == "Wildcard-04":
             # Sentinel has 50% chance to stabilize
-            if random.random() < 0.5:
+            if ctx.rng_for("ChaosContainmentDyad").random() < 0.5:
                 sentinel = ctx.roster.get("Sentinel-02")
                 wildcard = ctx.roster.get("Wildcard-04")
                 
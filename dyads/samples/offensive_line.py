@@ -8,6 +8,10 @@ class OffensiveLineDyad:
     If Vanguard (the tank) gets hit, Striker (the DPS) gains an accuracy buff.
     """
 
+    # Dispatch: only called on turn start and on throws at Vanguard
+    hooks = ("on_turn_start", "on_hit")
+    watch_targets = {"Vanguard-01"}
+
     @staticmethod
     def check_requirements(roster: Dict[str, Agent]) -> bool:
         return "Vanguard-01" in roster and "Striker-03" in roster
@@ -3,6 +3,7 @@ import argparse
 import sys
 import shutil
 from pathlib import Path
+from typing import Optional
 
 # Ensure core imports work
 current_dir = Path(__file__).resolve().parent
@@ -35,11 +36,45 @@ def print_scoreboard(roster: dict) -> None:
             extra = f" | beer={a.holding_beer} | beer_dodge_bonus={a.beer_dodge_bonus:.2f}"
         print(f"{a.name:7s}  landed: {a.landed:2d} | taken: {a.taken:2d}{extra}")
 
+def open_ledger_store(args):
+    """Returns a LedgerStore if --ledger-store was given, else None."""
+    store_dir = getattr(args, 'ledger_store', None)
+    if not store_dir:
+        return None
+    from core.ledger_store import LedgerStore
+    return LedgerStore(
+        Path(store_dir),
+        compression=getattr(args, 'store_compression', 'gzip'),
+        fmt=getattr(args, 'ledger_format', 'jsonl')
+    )
+
 def run_session(args, ledger_path: Path):
-    char_dir = current_dir / "characters"
+    store = open_ledger_store(args)
     
-    # Clear ledger
-    ledger_path.write_text("", encoding="utf-8")
+    if store is not None:
+        # Segmented store: append this run to the active segment (no truncation)
+        with store.run() as segment_path:
+            events, roster = simulate_session(args, segment_path)
+        segment, run = store.last_run()
+        ledger_path = segment_path
+        read_run = lambda: store.iter_run_records(segment, run)
+    elif getattr(args, 'no_ledger', False):
+        # Headless: keep the ledger in memory only if the story needs it
+        from core.ledger import MemoryLedgerSink, NullLedgerSink
+        sink = MemoryLedgerSink() if getattr(args, 'generate_story', False) else NullLedgerSink()
+        events, roster = simulate_session(args, None, ledger_sink=sink)
+        ledger_path = sink
+        read_run = None
+    else:
+        # Clear ledger
+        ledger_path.write_text("", encoding="utf-8")
+        events, roster = simulate_session(args, ledger_path)
+        read_run = None
+
+    report_session(args, events, roster, ledger_path, read_run)
+
+def simulate_session(args, ledger_path: Optional[Path], ledger_sink=None):
+    char_dir = current_dir / "characters"
 
     print(f"❄️  Snowball Session: Mode={args.mode}, Seed={args.seed}, Turns={args.turns}")
     
@@ -47,8 +82,10 @@ def run_session(args, ledger_path: Path):
     audit_mode = getattr(args, 'audit_mode', 'transparent')
     force_target = getattr(args, 'force_ricochet_target', None)
     use_samples = getattr(args, 'samples', False)
+    ledger_format = getattr(args, 'ledger_format', 'jsonl')
+    ledger_index = getattr(args, 'ledger_index', False)
     
-    events, roster = run_simulation(
+    return run_simulation(
         seed=args.seed, 
         turns=args.turns, 
         ledger_path=ledger_path, 
@@ -59,13 +96,22 @@ def run_session(args, ledger_path: Path):
         scenario_name=scenario,
         audit_mode=audit_mode,
         force_ricochet_target=force_target,
-        use_samples=use_samples
+        use_samples=use_samples,
+        ledger_format=ledger_format,
+        ledger_index=ledger_index,
+        ledger_sink=ledger_sink
     )
 
+def report_session(args, events, roster, ledger_path, read_run=None):
+    use_samples = getattr(args, 'samples', False)
+    
     if getattr(args, 'generate_story', False):
         print("\n💜 invoking Narrative Engine...")
         parser_engine = LedgerParser(ledger_path)
-        evts, chars = parser_engine.parse()
+        if read_run is not None:
+            evts, chars = parser_engine.parse_records(read_run())
+        else:
+            evts, chars = parser_engine.parse()
         detector = PatternDetector(evts, chars)
         patterns = detector.detect()
         generator = StoryGenerator(evts, chars, patterns, args.seed)
@@ -113,9 +159,213 @@ def run_session(args, ledger_path: Path):
 
 def command_play(args):
     """Standard Play Mode"""
-    ledger = Path("skeletor_ledger/snowball_events.jsonl")
+    suffix = ".sklb" if args.ledger_format == "binary" else ".jsonl"
+    ledger = Path("skeletor_ledger/snowball_events").with_suffix(suffix)
     run_session(args, ledger)
 
+def command_convert(args):
+    """Ledger Format Conversion (JSONL <-> SKLB)"""
+    from core.ledger_binary import convert_ledger
+    src, dst = Path(args.source), Path(args.dest)
+    if not src.exists():
+        print(f"❌ Error: Ledger file not found: {src}")
+        return
+    fmt = convert_ledger(src, dst, to=args.to)
+    print(f"🔁 Converted {src} ({src.stat().st_size} bytes) -> {dst} [{fmt}] ({dst.stat().st_size} bytes)")
+    if args.index:
+        from core.ledger_index import build_index, index_path
+        idx = build_index(dst)
+        print(f"🗂️  Indexed {len(idx)} events -> {index_path(dst)}")
+
+def command_batch(args):
+    """Monte Carlo Batch Mode (process pool)"""
+    import json
+    from core.batch import run_batch, parse_seed_range
+    try:
+        seeds = parse_seed_range(args.seeds)
+    except ValueError as e:
+        print(f"❌ Error: Invalid --seeds: {e}")
+        return
+    
+    if args.engine == "exact":
+        run_exact_batch(args)
+        return
+    if args.engine == "vector":
+        result = run_vector_batch(args, seeds)
+        if result is None:
+            return
+    elif args.cache:
+        result = run_incremental_batch(args, seeds)
+    else:
+        print(f"🎲 Snowball Batch: {len(seeds)} seeds, Mode={args.mode}, Turns={args.turns}, Workers={args.workers or 'auto'}, RNG={args.rng}")
+        try:
+            result = run_batch(
+                seeds,
+                turns=args.turns,
+                char_dir=current_dir / "characters",
+                mode=args.mode,
+                scenario_name=args.scenario,
+                audit_mode=args.audit_mode,
+                use_samples=args.samples,
+                rng_backend=args.rng,
+                workers=args.workers,
+            )
+        except ImportError as e:
+            print(f"❌ Error: {e}")
+            return
+    
+    if args.summary == 'json':
+        print(json.dumps(result.to_dict(), indent=2))
+        return
+    
+    print(f"\n--- BATCH ({result.runs} runs) ---")
+    rows = sorted(result.agents.values(), key=lambda s: (s.landed_mean, -s.taken_mean), reverse=True)
+    for s in rows:
+        mvp_rate = s.mvp_count / result.runs if result.runs else 0.0
+        top = ", ".join(f"{k}={v}" for k, v in s.outcomes.most_common(3))
+        print(f"{s.name:10s}  landed: {s.landed_mean:5.2f} (var {s.landed_var:5.2f}) | "
+              f"taken: {s.taken_mean:5.2f} (var {s.taken_var:5.2f}) | MVP: {mvp_rate:6.1%} | {top}")
+    print("\nOutcomes: " + ", ".join(f"{k}={v}" for k, v in result.outcomes.most_common()))
+
+def run_vector_batch(args, seeds):
+    """NumPy lockstep arenas: one arena per seed, seeded from the first seed."""
+    import time
+    from core.simulation import load_roster
+    from core.vector_engine import run_arenas, UnsupportedRosterError
+    if args.scenario or args.mode == "classic":
+        print("❌ Error: The vector engine only runs plain open-mode rosters (no --scenario / classic).")
+        return None
+    
+    roster = load_roster(current_dir / "characters", use_samples=args.samples)
+    print(f"🧮 Vector Batch: {len(seeds)} arenas, Turns={args.turns}, Seed={seeds[0]}")
+    started = time.perf_counter()
+    try:
+        arenas = run_arenas(roster, len(seeds), args.turns, seed=seeds[0])
+    except (UnsupportedRosterError, ImportError) as e:
+        print(f"❌ Error: {e}")
+        return None
+    elapsed = time.perf_counter() - started
+    print(f"⚡ {arenas.throws} throws in {elapsed:.2f}s ({arenas.throws / max(elapsed, 1e-9):,.0f}/s)")
+    return arenas.to_batch_result()
+
+def run_exact_batch(args):
+    """Exact expectations by dynamic programming (seed-independent, dyad-free rosters)."""
+    import json
+    import time
+    from core.simulation import load_roster
+    from core.exact_engine import solve_exact, EXACT_TURNS_WARN
+    from core.vector_engine import UnsupportedRosterError
+    if args.scenario:
+        print("❌ Error: The exact engine does not run scenarios.")
+        return
+
+    roster = load_roster(current_dir / "characters", use_samples=args.samples)
+    print(f"📐 Exact Batch: Mode={args.mode}, Turns={args.turns}, Prune={args.prune:g} (--seeds ignored)")
+    if args.turns > EXACT_TURNS_WARN and not args.prune:
+        print(f"⚠️ Exact solves past {EXACT_TURNS_WARN} turns can take minutes on rosters with spite, paradox budget or Bankai. "
+              "Pass --prune 1e-10 to drop negligible states (the error bound is reported).")
+    started = time.perf_counter()
+    try:
+        result = solve_exact(roster, args.turns, mode=args.mode, prune=args.prune)
+    except UnsupportedRosterError as e:
+        print(f"❌ Error: {e}")
+        return
+    elapsed = time.perf_counter() - started
+
+    if args.summary == 'json':
+        print(json.dumps(result.to_dict(), indent=2))
+        return
+
+    print(f"⚡ {result.states} states in {elapsed:.2f}s")
+    if result.dropped_mass:
+        print(f"✂️  Pruned mass {result.dropped_mass:.2e}: means low by at most {result.mean_error_bound:.2e}")
+    print(f"\n--- EXACT ({result.turns} turns) ---")
+    for name in sorted(result.names, key=lambda n: (result.landed_mean[n], -result.taken_mean[n]), reverse=True):
+        print(f"{name:10s}  landed: {result.landed_mean[name]:5.2f} (var {result.landed_var[name]:5.2f}) | "
+              f"taken: {result.taken_mean[name]:5.2f} (var {result.taken_var[name]:5.2f})")
+    outcomes = result.to_dict()["outcomes"]
+    print("\nOutcomes: " + ", ".join(f"{k}={v:.2f}" for k, v in outcomes.items()))
+
+def run_incremental_batch(args, seeds):
+    """Keyframe cache: after a roster edit, seeds replay from the first turn that read it."""
+    from core.incremental import IncrementalRunner
+    print(f"♻️  Incremental Batch: {len(seeds)} seeds, Mode={args.mode}, Turns={args.turns}, Cache={args.cache}")
+    runner = IncrementalRunner(
+        char_dir=current_dir / "characters",
+        turns=args.turns,
+        cache_dir=Path(args.cache),
+        mode=args.mode,
+        scenario_name=args.scenario,
+        audit_mode=args.audit_mode,
+        use_samples=args.samples,
+    )
+    result = runner.run(seeds)
+    starts = [t for t in runner.replayed.values() if t is not None]
+    reused = len(runner.replayed) - len(starts)
+    replayed_turns = sum(args.turns - t + 1 for t in starts)
+    print(f"   {reused} seeds reused, {len(starts)} re-simulated "
+          f"({replayed_turns} of {len(seeds) * args.turns} turns)")
+    return result
+
+def parse_overrides(pairs):
+    """['audit_mode=stabilize', 'weaver_intensity=1.5'] -> option dict (JSON values, else strings)."""
+    import json
+    options = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Expected key=value, got {pair!r}")
+        try:
+            options[key.strip().replace("-", "_")] = json.loads(value)
+        except ValueError:
+            options[key.strip().replace("-", "_")] = value
+    return options
+
+def command_compare(args):
+    """Paired comparison of two configs on common random numbers"""
+    import json
+    from core.batch import run_paired_batch, parse_seed_range
+    try:
+        seeds = parse_seed_range(args.seeds)
+        a, b = parse_overrides(args.a), parse_overrides(args.b)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return
+
+    label = lambda options: ", ".join(f"{k}={v}" for k, v in options.items()) or "defaults"
+    print(f"⚖️  Paired Compare: {len(seeds)} seeds{' x2 (antithetic)' if args.antithetic else ''}, Turns={args.turns}")
+    print(f"   A: {label(a)}\n   B: {label(b)}")
+    try:
+        result = run_paired_batch(
+            seeds,
+            turns=args.turns,
+            char_dir=current_dir / "characters",
+            a=a,
+            b=b,
+            antithetic=args.antithetic,
+            mode=args.mode,
+            scenario_name=args.scenario,
+            audit_mode=args.audit_mode,
+            use_samples=args.samples,
+            workers=args.workers,
+        )
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return
+
+    if args.summary == 'json':
+        print(json.dumps(result.to_dict(), indent=2))
+        return
+
+    print(f"\n--- B - A ({result.runs} paired runs) ---")
+    for name, stats in sorted(result.agents.items()):
+        cells = []
+        for counter in ("landed", "taken"):
+            s = stats[counter]
+            cells.append(f"{counter}: {s.diff_mean:+6.3f} ± {1.96 * s.diff_se:5.3f} (x{s.variance_reduction:.0f})")
+        print(f"{name:10s}  " + " | ".join(cells))
+    print("\n± is the 95% interval; xN is the variance reduction over independent batches.")
+
 def command_verify(args):
     """Verification Suite"""
     ledger = Path("skeletor_ledger/snowball_events.jsonl")
@@ -226,8 +476,44 @@ def main():
     play_parser.add_argument("--timeline", type=int, default=0)
     play_parser.add_argument("--samples", action="store_true", help="Force use of sample roster")
     play_parser.add_argument("--summary", choices=['json'], help="Print summary JSON")
+    play_parser.add_argument("--ledger-format", choices=["jsonl", "binary"], default="jsonl", help="Skeletor Ledger encoding")
+    play_parser.add_argument("--ledger-index", action="store_true", help="Write the tick/agent sidecar index (<ledger>.idx)")
+    play_parser.add_argument("--ledger-store", default=None, help="Append runs to a segmented, compressed ledger store dir instead of overwriting the ledger")
+    play_parser.add_argument("--store-compression", choices=["gzip", "lzma", "none"], default="gzip", help="Compression for closed store segments")
+    play_parser.add_argument("--no-ledger", action="store_true", help="Skip disk I/O: keep the ledger in memory (for --generate-story) or discard it")
     play_parser.set_defaults(func=command_play)
 
+    # BATCH
+    batch_parser = subparsers.add_parser("batch", help="Run many seeds in parallel and aggregate balance stats")
+    batch_parser.add_argument("--seeds", default="1-100", help="Seed range, e.g. 1-1000 or 1,5,10-12")
+    batch_parser.add_argument("--turns", type=int, default=20)
+    batch_parser.add_argument("--mode", default="open")
+    batch_parser.add_argument("--scenario", default=None)
+    batch_parser.add_argument("--audit-mode", default="transparent")
+    batch_parser.add_argument("--samples", action="store_true", help="Force use of sample roster")
+    batch_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count, 1 = in-process)")
+    batch_parser.add_argument("--summary", choices=['json'], help="Print aggregated stats as JSON")
+    batch_parser.add_argument("--engine", choices=["process", "vector", "exact"], default="process", help="process: full run_simulation per seed; vector: NumPy arenas for plain rosters; exact: dynamic programming for dyad-free rosters")
+    batch_parser.add_argument("--rng", choices=["mt", "numpy"], default="mt", help="Random stream of the process engine: mt (random.Random, replays existing seeds) or numpy (PCG64 block buffers)")
+    batch_parser.add_argument("--prune", type=float, default=0.0, help="Exact engine: drop states below this probability (0 = exact)")
+    batch_parser.add_argument("--cache", default=None, help="Keyframe cache dir: after a roster edit, only re-simulate from the first turn that read the edited values (in-process)")
+    batch_parser.set_defaults(func=command_batch)
+
+    # COMPARE
+    compare_parser = subparsers.add_parser("compare", help="Compare two configs seed by seed on common random numbers")
+    compare_parser.add_argument("--a", nargs="*", default=[], metavar="KEY=VALUE", help="Config A overrides, e.g. audit_mode=transparent")
+    compare_parser.add_argument("--b", nargs="*", default=[], metavar="KEY=VALUE", help="Config B overrides, e.g. audit_mode=stabilize")
+    compare_parser.add_argument("--antithetic", action="store_true", help="Also run every seed mirrored and average the pair")
+    compare_parser.add_argument("--seeds", default="1-100", help="Seed range, e.g. 1-1000 or 1,5,10-12")
+    compare_parser.add_argument("--turns", type=int, default=20)
+    compare_parser.add_argument("--mode", default="open")
+    compare_parser.add_argument("--scenario", default=None)
+    compare_parser.add_argument("--audit-mode", default="transparent")
+    compare_parser.add_argument("--samples", action="store_true", help="Force use of sample roster")
+    compare_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count, 1 = in-process)")
+    compare_parser.add_argument("--summary", choices=['json'], help="Print the comparison as JSON")
+    compare_parser.set_defaults(func=command_compare)
+
     # VERIFY
     verify_parser = subparsers.add_parser("verify", help="Run verification suites")
     verify_parser.add_argument("target", choices=["chaos", "lock", "audit", "hierarchy", "all"], default="all", nargs="?")
@@ -240,6 +526,14 @@ def main():
     chronicle_parser.add_argument("--mode", default="open")
     chronicle_parser.set_defaults(func=command_chronicle)
 
+    # CONVERT
+    convert_parser = subparsers.add_parser("convert", help="Convert a ledger between JSONL and binary (SKLB)")
+    convert_parser.add_argument("source")
+    convert_parser.add_argument("dest")
+    convert_parser.add_argument("--to", choices=["jsonl", "binary"], default=None, help="Target format (default: the other one)")
+    convert_parser.add_argument("--index", action="store_true", help="Also build the sidecar index for the output")
+    convert_parser.set_defaults(func=command_convert)
+
     args = parser.parse_args()
     
     if hasattr(args, "func"):
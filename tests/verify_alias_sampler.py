@@ -0,0 +1,91 @@
+import sys
+import os
+import math
+import random
+from collections import Counter
+from itertools import permutations
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import mechanics
+from core.alias_sampler import AliasTable, RicochetSampler
+from core.models import Agent
+from core.roster_table import RosterTable
+
+DRAWS = 60000
+QUINN_CAP = 0.45
+
+def pick_probability(sequence, exclude, size, quinn, stray):
+    """Exact probability of an ordered pick: weight 1 each, Quinn 1 + stray capped at QUINN_CAP of the pool."""
+    taken = {exclude}
+    p = 1.0
+    for i in sequence:
+        pool = [j for j in range(size) if j not in taken]
+        weights = {j: 1.0 for j in pool}
+        if quinn in weights:
+            wq = 1.0 + stray
+            other = len(pool) - 1
+            if wq / (other + wq) > QUINN_CAP:
+                weights[quinn] = max(0.01, QUINN_CAP * other / (1.0 - QUINN_CAP))
+            else:
+                weights[quinn] = wq
+        p *= weights[i] / sum(weights.values())
+        taken.add(i)
+    return p
+
+def worst_z(counts, expected, n):
+    """Largest |z| of the observed counts against exact probabilities."""
+    worst = 0.0
+    for outcome, p in expected.items():
+        if p > 0:
+            worst = max(worst, abs(counts.get(outcome, 0) - n * p) / math.sqrt(n * p * (1 - p)))
+        elif counts.get(outcome, 0):
+            return math.inf
+    return worst
+
+def verify_alias_sampler():
+    print(f"🧪 Verifying alias-table sampling ({DRAWS} draws per case)...")
+    rng = random.Random(18)
+
+    weights = [1.0, 2.0, 3.0, 0.0, 4.0]
+    table = AliasTable(weights)
+    counts = Counter(table.draw(rng) for _ in range(DRAWS))
+    z = worst_z(counts, {i: w / sum(weights) for i, w in enumerate(weights)}, DRAWS)
+    if z > 5.0:
+        print(f"❌ FAILED: AliasTable draws do not follow the weights (worst |z| = {z:.2f}).")
+        return
+    print(f"✅ AliasTable follows its weights, zero weight never drawn (worst |z| = {z:.2f}).")
+
+    size, quinn, stray = 7, 3, 5.0  # Quinn above the cap in every pool
+    agents = [Agent(name=f"Agent-{i:02d}") for i in range(size)]
+    agents[quinn] = Agent(name="Quinn", stray_magnet=stray)
+    roster_table = RosterTable(agents)
+    sampler = RicochetSampler(roster_table, quinn_cap=QUINN_CAP)
+    for exclude in (0, quinn):
+        for count in (1, 3):
+            others = [i for i in range(size) if i != exclude]
+            expected = {seq: pick_probability(seq, exclude, size, quinn, stray) for seq in permutations(others, count)}
+            scan = Counter(tuple(mechanics.pick_ricochet_targets_ids(rng, roster_table, exclude, QUINN_CAP, count))
+                           for _ in range(DRAWS))
+            alias = Counter(tuple(sampler.pick(rng, exclude, count)) for _ in range(DRAWS))
+            z_scan, z_alias = worst_z(scan, expected, DRAWS), worst_z(alias, expected, DRAWS)
+            if max(z_scan, z_alias) > 5.0:
+                print(f"❌ FAILED: thrower {exclude}, {count} pick(s): not the capped distribution "
+                      f"(worst |z| scan {z_scan:.2f}, alias {z_alias:.2f}).")
+                return
+            print(f"✅ Thrower {exclude}, {count} pick(s): {len(expected)} outcomes, scan and alias table agree "
+                  f"(worst |z| {z_scan:.2f} / {z_alias:.2f}).")
+
+    # stray_magnet edits rebuild the table
+    agents[quinn].stray_magnet = 0.0
+    counts = Counter(sampler.pick(rng, 0)[0] for _ in range(DRAWS))
+    z = worst_z(counts, {i: 1 / (size - 1) for i in range(1, size)}, DRAWS)
+    if z > 5.0:
+        print(f"❌ FAILED: the sampler kept the old stray_magnet (worst |z| = {z:.2f}).")
+        return
+    print(f"✅ A stray_magnet edit rebuilds the table (worst |z| = {z:.2f}).")
+    print("✨ SUCCESS: alias sampling matches the scan's distribution.")
+
+if __name__ == "__main__":
+    verify_alias_sampler()
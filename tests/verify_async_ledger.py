@@ -0,0 +1,56 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.ledger import AsyncLedgerWriter
+from core.models import Agent
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+
+def plain_roster():
+    return {
+        "Vanguard-01": Agent(name="Vanguard-01", accuracy=0.6, dodge=0.2),
+        "Striker-03": Agent(name="Striker-03", accuracy=0.7, dodge=0.3),
+        "Sentinel-02": Agent(name="Sentinel-02", accuracy=0.5, dodge=0.4),
+        "Wildcard-04": Agent(name="Wildcard-04", accuracy=0.5, dodge=0.5),
+    }
+
+def body(path):
+    """Ledger lines without the header (it carries a timestamp)."""
+    return path.read_text(encoding="utf-8").splitlines()[1:]
+
+def verify_async_ledger():
+    print("🧪 Verifying AsyncLedgerWriter as a caller-owned ledger_sink...")
+    tmp = Path(tempfile.mkdtemp())
+    sync_path, async_path = tmp / "sync.jsonl", tmp / "async.jsonl"
+
+    run_simulation(seed=777, turns=40, ledger_path=sync_path, char_dir=CHAR_DIR,
+                   roster=plain_roster(), dyad_classes=[])
+
+    sink = AsyncLedgerWriter(async_path, queue_size=8, flush_turns=0)
+    try:
+        run_simulation(seed=777, turns=40, ledger_path=None, char_dir=CHAR_DIR,
+                       roster=plain_roster(), dyad_classes=[], ledger_sink=sink)
+    except AttributeError as e:
+        print(f"❌ FAILED: the run could not flush the sink: {e}")
+        return
+
+    # The run flushed (not closed) the sink: the queue must already be on disk
+    if sink.closed or body(async_path) != body(sync_path):
+        print("❌ FAILED: flush() returned before the queue was written.")
+        return
+    print(f"✅ flush() drained the queue: {len(body(async_path))} lines on disk before close.")
+
+    sink.close()
+    if body(async_path) != body(sync_path):
+        print("❌ FAILED: async ledger differs from the synchronous one.")
+        return
+    print("✨ SUCCESS: async and synchronous ledgers match line for line.")
+
+if __name__ == "__main__":
+    verify_async_ledger()
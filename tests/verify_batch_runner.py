@@ -0,0 +1,65 @@
+import sys
+import os
+import json
+import random
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch import run_batch
+from core.simulation import run_simulation
+
+SEEDS = range(1, 41)
+TURNS = 25
+
+# No canon or sample dyad pair: the batch loads its roster from char_dir
+AGENTS = [
+    {"name": "Ace", "accuracy": 0.7, "dodge": 0.25, "spite_gain_on_hit": 0.35,
+     "spite_decay_per_turn": 0.05, "spite_max_bonus": 0.5, "spite_min_multiplier": 1.0},
+    {"name": "Janus", "accuracy": 0.6, "dodge": 0.35, "paradox_chance": 0.35,
+     "paradox_budget": 3, "untouchable_while_budget": True},
+    {"name": "Kryssie", "accuracy": 0.7, "dodge": 0.4, "beer_dodge_bonus_step": 0.05,
+     "beer_dodge_bonus_cap": 0.3},
+    {"name": "Oracle", "accuracy": 0.6, "dodge": 0.3},
+    {"name": "Claude", "accuracy": 0.55, "dodge": 0.3},
+]
+
+def write_roster():
+    char_dir = Path(tempfile.mkdtemp())
+    for agent in AGENTS:
+        (char_dir / f"{agent['name'].lower()}.json").write_text(json.dumps(agent), encoding="utf-8")
+    return char_dir
+
+def verify_batch_runner():
+    print(f"🧪 Verifying run_batch over {len(SEEDS)} seeds ({TURNS} turns)...")
+    char_dir = write_roster()
+    random.seed(12345)
+    before = random.getstate()
+
+    serial = run_batch(SEEDS, TURNS, char_dir, workers=1).to_dict()
+    pooled = run_batch(SEEDS, TURNS, char_dir, workers=2, chunksize=3).to_dict()
+    if serial != pooled:
+        print("❌ FAILED: workers=1 and workers=2 aggregate different results.")
+        return
+    print(f"✅ Worker count independent: {serial['runs']} runs, identical aggregates.")
+
+    # Each batch run is the headless replay of the seed's full run
+    for seed in (SEEDS[0], SEEDS[-1]):
+        _, roster = run_simulation(seed=seed, turns=TURNS, ledger_path=char_dir / f"seed-{seed}.jsonl",
+                                   char_dir=char_dir)
+        single = run_batch([seed], TURNS, char_dir, workers=1).to_dict()["agents"]
+        landed = {name: stats["landed"]["mean"] for name, stats in single.items()}
+        if landed != {name: float(a.landed) for name, a in roster.items()}:
+            print(f"❌ FAILED: seed {seed} replays differently in the batch runner.")
+            return
+    print("✅ Batch runs replay the full runs of their seeds.")
+
+    if random.getstate() != before:
+        print("❌ FAILED: the batch touched the global random.")
+        return
+    print("✨ SUCCESS: batch runner verified.")
+
+if __name__ == "__main__":
+    verify_batch_runner()
@@ -0,0 +1,115 @@
+import sys
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core/dyads
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.branching import capture_checkpoint, fork_branches
+from core.models import Agent, SimulationCheckpoint, SimulationSummary, agent_values
+from core.simulation import iter_simulation, run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEED = 777
+TURNS = 90
+FORK = 40
+
+class DiceDyad:
+    """Rolls its own stream and keeps a counter, both of which a checkpoint must carry."""
+    hooks = ("on_turn_end",)
+    rolls = []
+
+    def __init__(self):
+        self.turns_seen = 0
+
+    @staticmethod
+    def check_requirements(roster):
+        return True
+
+    def on_turn_end(self, ctx):
+        self.turns_seen += 1
+        DiceDyad.rolls.append((ctx.tick, self.turns_seen, ctx.rng_for("DiceDyad").random()))
+        return []
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def play(run):
+    """(events, summary, checkpoints) of an iter_simulation generator."""
+    events, checkpoints, summary = [], [], None
+    for item in run:
+        if isinstance(item, SimulationSummary):
+            summary = item
+        elif isinstance(item, SimulationCheckpoint):
+            checkpoints.append(item)
+        else:
+            events.append(item)
+    return events, summary, checkpoints
+
+def values(roster):
+    return {n: agent_values(a) for n, a in roster.items()}
+
+def verify_checkpoints():
+    import random  # Not at module level: DyadManager would flag DiceDyad for the global random
+    print(f"🧪 Verifying checkpoint/resume at turn {FORK} of {TURNS} (seed {SEED})...")
+    tmp = Path(tempfile.mkdtemp())
+    options = dict(char_dir=CHAR_DIR, dyad_classes=[DiceDyad], scenario_name="ricochet_audit")
+
+    DiceDyad.rolls = []
+    events, summary, (checkpoint,) = play(iter_simulation(
+        SEED, TURNS, tmp / "full.jsonl", roster=canon_roster(), checkpoint_at=[FORK], **options))
+    full_rolls = [r for r in DiceDyad.rolls if r[0] >= FORK]
+
+    # Through pickle, as fork_branches ships it to workers; a stray global seed must not matter
+    checkpoint = pickle.loads(pickle.dumps(checkpoint))
+    random.seed(99)
+    before = random.getstate()
+    DiceDyad.rolls = []
+    resumed, resumed_summary, _ = play(iter_simulation(
+        SEED, TURNS, tmp / "resumed.jsonl", resume=checkpoint, **options))
+
+    if resumed != [e for e in events if e.tick >= FORK]:
+        print("❌ FAILED: the resumed run's events differ from the straight run's.")
+        return
+    if values(resumed_summary.roster) != values(summary.roster):
+        print("❌ FAILED: the resumed run ends with a different roster.")
+        return
+    if DiceDyad.rolls != full_rolls:
+        print("❌ FAILED: dyad state or its ctx.rng_for stream was not restored.")
+        return
+    if random.getstate() != before:
+        print("❌ FAILED: resuming touched the global random.")
+        return
+    print(f"✅ Resume replays turns {FORK}..{TURNS}: {len(resumed)} events, dyad state and stream included.")
+
+    # Branches: an unchanged branch is the straight run; pool and in-process agree
+    cp = capture_checkpoint(SEED, TURNS, FORK, CHAR_DIR, roster=canon_roster(), scenario_name="ricochet_audit")
+    straight, _ = run_simulation(SEED, TURNS, None, CHAR_DIR, roster=canon_roster(),
+                                 scenario_name="ricochet_audit", stats_only=True)
+    branches = [{}, {"audit_mode": "stabilize"}, {"weaver_intensity": 1.5}]
+    serial = fork_branches(cp, branches, CHAR_DIR, workers=1)
+    pooled = fork_branches(cp, branches, CHAR_DIR, workers=2)
+
+    if (serial[0].stats.landed, serial[0].stats.outcomes) != (straight.landed, straight.outcomes):
+        print("❌ FAILED: the unchanged branch differs from the straight run.")
+        return
+    if [(b.stats.landed, b.stats.outcomes, values(b.roster)) for b in serial] != \
+            [(b.stats.landed, b.stats.outcomes, values(b.roster)) for b in pooled]:
+        print("❌ FAILED: workers=2 branches differ from in-process branches.")
+        return
+    print(f"✅ {len(branches)} branches: the unchanged one replays the straight run, workers=1 == workers=2.")
+    print("✨ SUCCESS: checkpoints resume the run they were taken from.")
+
+if __name__ == "__main__":
+    verify_checkpoints()
@@ -0,0 +1,92 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core/dyads
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.auto_narrative_generator import LedgerParser, PatternDetector, StoryGenerator
+from core.models import Agent
+from core.rng import component_rng
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEED = 1002
+TURNS = 60
+
+class Roller:
+    """Rolls its own dice on every hook; emits nothing, so only its stream can move."""
+    draws = []
+
+    @staticmethod
+    def check_requirements(roster):
+        return True
+
+    def on_turn_start(self, ctx):
+        Roller.draws.append(ctx.rng_for("Roller").random())
+        return []
+
+    def on_hit(self, ctx, thrower_id, target_id):
+        Roller.draws.append(ctx.rng_for("Roller").randrange(100))
+        return []
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def body(path):
+    """Ledger lines without the header (it carries a timestamp)."""
+    return path.read_text(encoding="utf-8").splitlines()[1:]
+
+def story(ledger, seed):
+    events, characters = LedgerParser(ledger).parse()
+    return StoryGenerator(events, characters, PatternDetector(events, characters).detect(), seed).generate()
+
+def verify_component_streams():
+    import random  # Not at module level: DyadManager would flag Roller for the global random
+    print(f"🧪 Verifying per-component RNG streams (seed {SEED}, {TURNS} turns)...")
+    tmp = Path(tempfile.mkdtemp())
+    options = dict(char_dir=CHAR_DIR, scenario_name="ricochet_audit")
+
+    run_simulation(SEED, TURNS, tmp / "plain.jsonl", roster=canon_roster(), dyad_classes=[], **options)
+    runs = []
+    for global_seed in (1, 2):
+        random.seed(global_seed)  # Must not matter
+        Roller.draws = []
+        ledger = tmp / f"roller-{global_seed}.jsonl"
+        run_simulation(SEED, TURNS, ledger, roster=canon_roster(), dyad_classes=[Roller], **options)
+        runs.append((body(ledger), Roller.draws))
+
+    if runs[0][0] != body(tmp / "plain.jsonl"):
+        print("❌ FAILED: a dyad's ctx.rng_for draws shifted the run's stream.")
+        return
+    print(f"✅ {len(runs[0][1])} dyad draws leave the run's ledger unchanged.")
+    if runs[0] != runs[1]:
+        print("❌ FAILED: the run or the dyad's draws depend on the global random.")
+        return
+    print("✅ Run and dyad draws do not depend on the global random.")
+    expected = component_rng(SEED, "Roller")
+    if runs[0][1][0] != expected.random() or component_rng(SEED, "Other").random() == component_rng(SEED, "Roller").random():
+        print("❌ FAILED: ctx.rng_for is not the (seed, component) stream.")
+        return
+    print("✅ ctx.rng_for(name) is component_rng(seed, name), distinct per component.")
+
+    random.seed(1)
+    first = story(tmp / "plain.jsonl", SEED)
+    random.seed(2)
+    if story(tmp / "plain.jsonl", SEED) != first:
+        print("❌ FAILED: the same seed told a different story.")
+        return
+    print(f"✅ Same seed, same story ({len(first)} characters), whatever the global random.")
+    print("✨ SUCCESS: components roll on their own seeded streams.")
+
+if __name__ == "__main__":
+    verify_component_streams()
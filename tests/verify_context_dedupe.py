@@ -0,0 +1,52 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.auto_narrative_generator import LedgerParser
+from core.models import Agent
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEEDS = (7, 777)
+TURNS = 120
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def verify_context_dedupe():
+    print(f"🧪 Verifying default ledgers against full-context (v1.4) ones, {TURNS}-turn runs...")
+    tmp = Path(tempfile.mkdtemp())
+    for fmt in ("jsonl", "binary"):
+        full, default = tmp / f"full.{fmt}", tmp / f"default.{fmt}"
+        for seed in SEEDS:  # Two runs per ledger: context refs must not leak across runs
+            for path, options in ((full, {"dedupe_context": False}), (default, {})):
+                run_simulation(seed, TURNS, path, CHAR_DIR, roster=canon_roster(), dyad_classes=[],
+                               scenario_name="ricochet_audit", ledger_format=fmt, **options)
+        events_full, chars_full = LedgerParser(full).parse()
+        events_default, chars_default = LedgerParser(default).parse()
+        if (events_default, chars_default) != (events_full, chars_full):
+            print(f"❌ FAILED: {fmt}: the default ledger parses differently from the v1.4 one.")
+            return
+        # SKLB interns contexts itself: per-turn refs would only make its side entries unique
+        if default.stat().st_size > full.stat().st_size:
+            print(f"❌ FAILED: {fmt}: the default ledger is larger than the v1.4 one.")
+            return
+        saved = 1 - default.stat().st_size / full.stat().st_size
+        print(f"✅ {fmt}: same {len(events_full)} events, {saved:.0%} smaller than v1.4.")
+    print("✨ SUCCESS: shared turn contexts rehydrate to the full ledger, at no size cost.")
+
+if __name__ == "__main__":
+    verify_context_dedupe()
@@ -0,0 +1,84 @@
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch import run_paired_batch
+
+SEEDS = range(1, 201)
+TURNS = 30
+
+# No canon or sample dyad pair: the batch loads its roster from char_dir
+AGENTS = [
+    {"name": "Ace", "accuracy": 0.7, "dodge": 0.25, "spite_gain_on_hit": 0.35,
+     "spite_decay_per_turn": 0.05, "spite_max_bonus": 0.5, "spite_min_multiplier": 1.0},
+    {"name": "Janus", "accuracy": 0.6, "dodge": 0.35, "paradox_chance": 0.35,
+     "paradox_budget": 3, "untouchable_while_budget": True},
+    {"name": "Kryssie", "accuracy": 0.7, "dodge": 0.4, "beer_dodge_bonus_step": 0.05,
+     "beer_dodge_bonus_cap": 0.3},
+    {"name": "Quinn", "accuracy": 0.5, "dodge": 0.15, "stray_magnet": 1.5},
+    {"name": "Oracle", "accuracy": 0.6, "dodge": 0.3},
+]
+
+def write_roster():
+    char_dir = Path(tempfile.mkdtemp())
+    for agent in AGENTS:
+        (char_dir / f"{agent['name'].lower()}.json").write_text(json.dumps(agent), encoding="utf-8")
+    return char_dir
+
+def counters(result):
+    return [(name, counter, s) for name, stats in sorted(result.agents.items()) for counter, s in sorted(stats.items())]
+
+def verify_crn():
+    print(f"🧪 Verifying common-random-number pairing over {len(SEEDS)} seeds...")
+    char_dir = write_roster()
+
+    same = run_paired_batch(SEEDS, TURNS, char_dir, {}, {}, workers=1)
+    if any(s.diff_sum != 0 or s.diff_sq != 0 for _, _, s in counters(same)):
+        print("❌ FAILED: identical configs gave a non-zero paired difference.")
+        return
+    print("✅ Identical configs: every per-seed difference is exactly 0.")
+
+    # Alias-table picks: same distribution, other draws, so a paired difference near 0
+    a, b = {}, {"alias_sampling": True}
+    paired = run_paired_batch(SEEDS, TURNS, char_dir, a, b, workers=1)
+    pooled = run_paired_batch(SEEDS, TURNS, char_dir, a, b, workers=2)
+    if paired.to_dict() != pooled.to_dict():
+        print("❌ FAILED: workers=2 paired results differ from workers=1.")
+        return
+    print("✅ Paired results are independent of the worker count.")
+
+    for name, counter, s in counters(paired):
+        if s.diff_se == 0:
+            continue
+        z = s.diff_mean / s.diff_se
+        if abs(z) > 4.0 or not s.variance_reduction > 1.0:
+            print(f"❌ FAILED: {name} {counter}: diff {s.diff_mean:+.3f} ± {s.diff_se:.3f}, "
+                  f"{s.variance_reduction:.1f}x variance reduction.")
+            return
+        print(f"   {name:8s} {counter:6s} diff {s.diff_mean:+.3f} ± {s.diff_se:.3f} | "
+              f"{s.variance_reduction:6.1f}x variance reduction")
+    print("✅ Alias vs scan picks: no significant difference, pairing beats independent batches.")
+
+    mirrored = run_paired_batch(SEEDS, TURNS, char_dir, {}, {}, antithetic=True, workers=1)
+    if any(s.diff_sum != 0 for _, _, s in counters(mirrored)) or mirrored.to_dict() == same.to_dict():
+        print("❌ FAILED: antithetic pairs are not mirrored runs of identical configs.")
+        return
+    print("✅ Antithetic pairs: zero difference, averaged over mirrored runs.")
+
+    for variant in ({"antithetic": True}, {"common_random_numbers": False}):
+        try:
+            run_paired_batch(SEEDS, TURNS, char_dir, {}, variant, antithetic=True, workers=1)
+        except ValueError as e:
+            print(f"✅ A variant overriding the pairing is rejected: {e}")
+        else:
+            print(f"❌ FAILED: variant {variant} was accepted.")
+            return
+    print("✨ SUCCESS: common random numbers pair the configs.")
+
+if __name__ == "__main__":
+    verify_crn()
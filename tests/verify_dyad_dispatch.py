@@ -0,0 +1,112 @@
+import sys
+import os
+
+# Add root to path so we can import core/dyads
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.dyad_manager import DyadManager
+
+CALLS = []
+
+class Recorder:
+    """Logs every hook call as (class name, hook, thrower, target)."""
+    @staticmethod
+    def check_requirements(roster):
+        return True
+
+    def on_turn_start(self, ctx):
+        CALLS.append((type(self).__name__, "on_turn_start"))
+        return []
+
+    def on_target_selected(self, ctx, thrower_id, target_id):
+        CALLS.append((type(self).__name__, "on_target_selected", thrower_id, target_id))
+
+    def on_hit(self, ctx, thrower_id, target_id):
+        CALLS.append((type(self).__name__, "on_hit", thrower_id, target_id))
+        return []
+
+    def on_turn_end(self, ctx):
+        CALLS.append((type(self).__name__, "on_turn_end"))
+        return []
+
+    def check_interception(self, ctx, thrower_id, target_id, rng):
+        CALLS.append((type(self).__name__, "check_interception", thrower_id, target_id))
+        return None
+
+class Everything(Recorder):
+    pass  # No declarations: every hook, every throw
+
+class HitsOnly(Recorder):
+    hooks = ("on_hit",)
+
+class WatchesVanguard(Recorder):
+    hooks = ("on_hit", "on_turn_start")
+    watch_targets = {"Vanguard-01"}
+
+class WatchesWildcard(Recorder):
+    watch_throwers = {"Wildcard-04"}
+
+class Interceptor(Recorder):
+    hooks = ("check_interception",)
+    watch_throwers = {"Wildcard-04"}
+
+    def check_interception(self, ctx, thrower_id, target_id, rng):
+        super().check_interception(ctx, thrower_id, target_id, rng)
+        return "Sentinel-02"
+
+class LateEverything(Recorder):
+    pass  # Loaded after the interceptor: never polled once it intercepts
+
+ORDER = [Everything, HitsOnly, WatchesVanguard, WatchesWildcard, Interceptor, LateEverything]
+
+def called(hook):
+    return [c[0] for c in CALLS if c[1] == hook]
+
+def check(label, got, expected):
+    if got != expected:
+        print(f"❌ FAILED: {label}: {got} != {expected}")
+        return False
+    print(f"✅ {label}: {got}")
+    return True
+
+def verify_dyad_dispatch():
+    print("🧪 Verifying subscription-based dyad dispatch...")
+    manager = DyadManager({}, sample_classes=ORDER)
+
+    CALLS.clear()
+    manager.on_turn_start(None)
+    manager.on_turn_end(None)
+    ok = check("on_turn_start honours `hooks`", called("on_turn_start"),
+               ["Everything", "WatchesVanguard", "WatchesWildcard", "LateEverything"])
+    ok = ok and check("on_turn_end honours `hooks`", called("on_turn_end"),
+                      ["Everything", "WatchesWildcard", "LateEverything"])
+
+    CALLS.clear()
+    manager.on_hit(None, "Striker-03", "Sentinel-02")
+    ok = ok and check("on_hit, unwatched throw", called("on_hit"), ["Everything", "HitsOnly", "LateEverything"])
+
+    CALLS.clear()
+    manager.on_hit(None, "Wildcard-04", "Vanguard-01")
+    ok = ok and check("on_hit, watched thrower and target (load order)", called("on_hit"),
+                      ["Everything", "HitsOnly", "WatchesVanguard", "WatchesWildcard", "LateEverything"])
+
+    CALLS.clear()
+    manager.on_target_selected(None, "Striker-03", "Vanguard-01")
+    ok = ok and check("on_target_selected: watch_targets only with the hook subscribed", called("on_target_selected"),
+                      ["Everything", "LateEverything"])
+
+    CALLS.clear()
+    rescuer = manager.check_interception(None, "Wildcard-04", "Vanguard-01", None)
+    ok = ok and check("check_interception stops at the first interceptor", called("check_interception"),
+                      ["Everything", "WatchesWildcard", "Interceptor"])
+    ok = ok and check("interception target", rescuer, "Sentinel-02")
+
+    CALLS.clear()
+    rescuer = manager.check_interception(None, "Striker-03", "Vanguard-01", None)
+    ok = ok and check("check_interception skips unwatched interceptors", (called("check_interception"), rescuer),
+                      (["Everything", "LateEverything"], None))
+    if ok:
+        print("✨ SUCCESS: dispatch follows the declared subscriptions.")
+
+if __name__ == "__main__":
+    verify_dyad_dispatch()
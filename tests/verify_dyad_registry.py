@@ -0,0 +1,99 @@
+import sys
+import os
+import io
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add root to path so we can import core/dyads
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.dyad_manager import DyadManager, load_sample_dyad_classes, clear_sample_registry
+
+PLUGIN = '''
+class {name}:
+    @staticmethod
+    def check_requirements(roster):
+        return True
+
+    def on_turn_start(self, ctx):
+        return []
+'''
+
+PICKY_PLUGIN = '''
+class PickyDyad:
+    @staticmethod
+    def check_requirements(roster):
+        return "Rook" in roster
+
+    def on_turn_start(self, ctx):
+        return []
+'''
+
+def captured(fn, *args):
+    out = io.StringIO()
+    with redirect_stdout(out):
+        result = fn(*args)
+    return result, out.getvalue()
+
+def write_plugin(path, name, bump_mtime=True):
+    path.write_text(PLUGIN.format(name=name), encoding="utf-8")
+    if bump_mtime:
+        # Coarse filesystem clocks: make sure the edit is visible as a new mtime
+        stamp = time.time() + 2
+        os.utime(path, (stamp, stamp))
+
+def verify_registry():
+    print("🧪 Verifying the cached sample dyad registry...")
+    clear_sample_registry()
+    samples = Path(tempfile.mkdtemp())
+    plugin = samples / "watcher.py"
+    write_plugin(plugin, "WatcherDyad", bump_mtime=False)
+
+    first = load_sample_dyad_classes(samples)
+    second = load_sample_dyad_classes(samples)
+    if [c.__name__ for c in first] != ["WatcherDyad"] or first[0] is not second[0]:
+        print("❌ FAILED: the second load did not reuse the cached class.")
+        return
+    print("✅ Unchanged file: the cached class object is reused (no re-import).")
+
+    stat = plugin.stat()
+    os.utime(plugin, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    touched = load_sample_dyad_classes(samples)
+    if touched[0] is not first[0]:
+        print("❌ FAILED: a touch without an edit re-imported the plugin.")
+        return
+    print("✅ New mtime, same hash: still the cached class.")
+
+    write_plugin(plugin, "EditedDyad")
+    edited = load_sample_dyad_classes(samples)
+    if [c.__name__ for c in edited] != ["EditedDyad"]:
+        print(f"❌ FAILED: an edited plugin was not re-imported: {[c.__name__ for c in edited]}")
+        return
+    print("✅ Edited file: the entry is invalidated and re-imported.")
+
+    plugin.unlink()
+    if load_sample_dyad_classes(samples):
+        print("❌ FAILED: a removed plugin is still returned.")
+        return
+    print("✅ Removed file: dropped from the registry.")
+
+    # "Loaded" is reported when a roster actually instantiates the dyad, once per class
+    picky = samples / "picky.py"
+    picky.write_text(PICKY_PLUGIN, encoding="utf-8")
+    classes, imported = captured(load_sample_dyad_classes, samples)
+    _, unmatched = captured(DyadManager, {"Bishop": None}, classes)
+    matched, first_report = captured(DyadManager, {"Rook": None}, classes)
+    _, second_report = captured(DyadManager, {"Rook": None}, classes)
+    if imported or unmatched:
+        print(f"❌ FAILED: reported without an active dyad: {(imported + unmatched)!r}")
+        return
+    if len(matched.dyads) != 1 or first_report.strip() != "✨ Custom Dyad Loaded: PickyDyad" or second_report:
+        print(f"❌ FAILED: expected one report on first use, got {first_report!r} then {second_report!r}")
+        return
+    print("✅ Loaded is reported once, only when a roster instantiates the dyad.")
+    print("✨ SUCCESS: registry caches and invalidates as expected.")
+
+if __name__ == "__main__":
+    verify_registry()
@@ -0,0 +1,85 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core/dyads
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent
+from core.simulation import iter_simulation, run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEED = 2024
+TURNS = 300
+WINDOW = 16
+
+class HistoryProbe:
+    """Reads the event history every turn (so the run keeps it): its length and its last events."""
+    hooks = ("on_turn_start",)
+    longest = 0
+    tails = []
+
+    @staticmethod
+    def check_requirements(roster):
+        return True
+
+    def on_turn_start(self, ctx):
+        HistoryProbe.longest = max(HistoryProbe.longest, len(ctx.events))
+        # List-style access: negative indices and slices
+        tail = ctx.events[-3:]
+        last = ctx.events[-1].outcome if ctx.events else None
+        HistoryProbe.tails.append((type(tail), [(e.tick, e.outcome) for e in tail], last))
+        return []
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def body(path):
+    """Ledger lines without the header (it carries a timestamp)."""
+    return path.read_text(encoding="utf-8").splitlines()[1:]
+
+def verify_event_window():
+    print(f"🧪 Verifying event_window={WINDOW} against an unbounded run ({TURNS} turns)...")
+    tmp = Path(tempfile.mkdtemp())
+    options = dict(char_dir=CHAR_DIR, dyad_classes=[HistoryProbe], scenario_name="ricochet_audit")
+
+    run_simulation(SEED, TURNS, tmp / "full.jsonl", roster=canon_roster(), **options)
+    unbounded, HistoryProbe.longest = HistoryProbe.longest, 0
+    unbounded_tails, HistoryProbe.tails = HistoryProbe.tails, []
+    for item in iter_simulation(SEED, TURNS, tmp / "window.jsonl", roster=canon_roster(), event_window=WINDOW, **options):
+        pass
+    stats = item.stats  # The summary carries counters in place of the history
+
+    if HistoryProbe.longest > WINDOW:
+        print(f"❌ FAILED: hooks saw {HistoryProbe.longest} events with a window of {WINDOW}.")
+        return
+    print(f"✅ Hooks see at most {HistoryProbe.longest} events ({unbounded} without a window).")
+
+    if HistoryProbe.tails != unbounded_tails:
+        print("❌ FAILED: ctx.events[-3:] / ctx.events[-1] differ from the unbounded history.")
+        return
+    print("✅ ctx.events[-3:] and ctx.events[-1] read the same events (as a list) with the window.")
+
+    if body(tmp / "window.jsonl") != body(tmp / "full.jsonl"):
+        print("❌ FAILED: the windowed run wrote a different ledger.")
+        return
+    print(f"✅ Same ledger ({len(body(tmp / 'full.jsonl'))} events), audits included.")
+
+    expected, _ = run_simulation(SEED, TURNS, None, roster=canon_roster(), stats_only=True, **options)
+    if (stats.landed, stats.taken, stats.outcomes) != (expected.landed, expected.taken, expected.outcomes):
+        print("❌ FAILED: windowed counters differ from the stats_only run.")
+        return
+    print("✨ SUCCESS: a bounded history replays the unbounded run.")
+
+if __name__ == "__main__":
+    verify_event_window()
@@ -0,0 +1,70 @@
+import sys
+import os
+import math
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent
+from core.simulation import run_simulation
+from core.exact_engine import solve_exact
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+TURNS = 15
+SEEDS = range(1, 3001)
+
+def stateful_roster():
+    """Plain agents plus Ace's spite and Janus' paradox budget (multi-state chain)."""
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.6, dodge=0.2, spite_gain_on_hit=0.1,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.2),
+        "Janus": Agent(name="Janus", accuracy=0.5, dodge=0.35, paradox_chance=0.3,
+                       paradox_budget=2, untouchable_while_budget=True),
+        "Vanguard-01": Agent(name="Vanguard-01", accuracy=0.6, dodge=0.2),
+        "Wildcard-04": Agent(name="Wildcard-04", accuracy=0.5, dodge=0.5),
+    }
+
+def monte_carlo():
+    """Per-agent landed/taken sums and squared sums over fixed seeds."""
+    sums = {}
+    for seed in SEEDS:
+        stats, _ = run_simulation(seed=seed, turns=TURNS, ledger_path=None, char_dir=CHAR_DIR,
+                                  roster=stateful_roster(), dyad_classes=[], stats_only=True)
+        for counter in ("landed", "taken"):
+            for name, value in getattr(stats, counter).items():
+                s = sums.setdefault((name, counter), [0.0, 0.0])
+                s[0] += value
+                s[1] += value * value
+    return sums
+
+def verify_exact_engine():
+    print(f"🧪 Verifying the exact engine against {len(SEEDS)} Monte Carlo seeds ({TURNS} turns)...")
+    exact = solve_exact(stateful_roster(), TURNS, dyad_classes=[])
+    print(f"   {exact.states} states at peak")
+
+    n = len(SEEDS)
+    worst = 0.0
+    for (name, counter), (s1, s2) in sorted(monte_carlo().items()):
+        mc_mean = s1 / n
+        mc_var = max(s2 / n - mc_mean * mc_mean, 1e-12)
+        ex_mean = getattr(exact, f"{counter}_mean")[name]
+        z = (mc_mean - ex_mean) / math.sqrt(mc_var / n)
+        worst = max(worst, abs(z))
+        print(f"   {name:12s} {counter:6s} exact {ex_mean:6.3f} | mc {mc_mean:6.3f} | z {z:+.2f}")
+    if worst > 4.0:
+        print(f"❌ FAILED: exact means disagree with Monte Carlo (worst |z| = {worst:.2f}).")
+        return
+    print(f"✅ Exact means match Monte Carlo (worst |z| = {worst:.2f}).")
+
+    pruned = solve_exact(stateful_roster(), TURNS, dyad_classes=[], prune=1e-8)
+    gaps = [exact.landed_mean[k] - pruned.landed_mean[k] for k in exact.names]
+    if pruned.dropped_mass <= 0 or not all(-1e-12 <= g <= pruned.mean_error_bound for g in gaps):
+        print("❌ FAILED: pruned means fall outside the reported error bound.")
+        return
+    print(f"✅ Pruning: {pruned.states} states, mass {pruned.dropped_mass:.1e} dropped, "
+          f"means within the {pruned.mean_error_bound:.1e} bound.")
+    print("✨ SUCCESS: exact engine verified.")
+
+if __name__ == "__main__":
+    verify_exact_engine()
@@ -0,0 +1,55 @@
+import sys
+import os
+import random
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import mechanics
+from core.models import Agent
+from core.roster_table import RosterTable
+
+DRAWS = 300
+
+def roster(size, quinn_at, stray_magnet):
+    agents = [Agent(name=f"Agent-{i:02d}") for i in range(size)]
+    if quinn_at is not None:
+        agents[quinn_at] = Agent(name="Quinn", stray_magnet=stray_magnet)
+    return agents
+
+def verify_exclusion_sampling():
+    print("🧪 Verifying id-based target and ricochet picks against the list-based originals...")
+    cases = 0
+    for size in (2, 3, 5, 12, 40):
+        for quinn_at in (None, 0, size // 2, size - 1):
+            for stray_magnet in (1.5, 0.37, 0.0, -1.0, -1.2, -3.0):
+                agents = roster(size, quinn_at, stray_magnet)
+                table = RosterTable(agents)
+                for seed in range(3):
+                    by_list, by_id = random.Random(seed), random.Random(seed)
+                    for n in range(DRAWS):
+                        thrower = n % size
+                        target = mechanics.pick_target(by_list, agents[thrower], agents)
+                        if mechanics.pick_target_ids(by_id, table, thrower) != table.ids[target.name]:
+                            print(f"❌ FAILED: target pick differs (size {size}, Quinn at {quinn_at}, seed {seed}).")
+                            return
+                        for count in (1, 3, 4):
+                            picked = mechanics.pick_ricochet_targets(by_list, agents, [agents[thrower].name], count=count)
+                            picked_ids = mechanics.pick_ricochet_targets_ids(by_id, table, thrower, count=count)
+                            if picked_ids != [table.ids[a.name] for a in picked]:
+                                print(f"❌ FAILED: ricochet pick differs (size {size}, Quinn at {quinn_at}, "
+                                      f"stray_magnet {stray_magnet}, count {count}, seed {seed}).")
+                                return
+                    if by_list.getstate() != by_id.getstate():
+                        print(f"❌ FAILED: the id-based picks consumed a different number of draws (size {size}).")
+                        return
+                # Net picks reuse a few cached pool shapes (pool size x Quinn position), not one per throw
+                if len(table.ricochet_cache) > 4 * 5:
+                    print(f"❌ FAILED: {len(table.ricochet_cache)} cached ricochet pools for size {size}.")
+                    return
+                cases += 1
+    print(f"✅ {cases} roster layouts: same picks (single and net), same random stream consumed.")
+    print("✨ SUCCESS: id-based sampling replays the original draws.")
+
+if __name__ == "__main__":
+    verify_exclusion_sampling()
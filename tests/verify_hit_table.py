@@ -0,0 +1,70 @@
+import sys
+import os
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core import mechanics
+from core.hit_table import HitTable, hit_probability_table
+from core.models import Agent
+from core.roster_table import RosterTable
+
+WEAVER = {"weaver_active": True, "weaver_intensity": 1.5, "resonance_debuff": 0.06}
+
+def roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_meter=0.4, spite_max_bonus=0.5),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, holding_beer=True, beer_dodge_bonus=0.15),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, dodge_mod=0.8),
+        "Oracle": Agent(name="Oracle", accuracy=0.6, dodge=0.9, accuracy_mod=1.3),
+    }
+
+def expected(agents, weaver):
+    """compute_p_hit for every thrower/target pair."""
+    return {
+        t.name: {d.name: mechanics.compute_p_hit(agents, t, d, **weaver) for d in agents.values() if d is not t}
+        for t in agents.values()
+    }
+
+def verify_hit_table():
+    print("🧪 Verifying HitTable against mechanics.compute_p_hit...")
+    for weaver in ({}, WEAVER):
+        agents = roster()
+        if hit_probability_table(agents, **weaver) != expected(agents, weaver):
+            print(f"❌ FAILED: hit_probability_table differs from compute_p_hit (weaver {bool(weaver)}).")
+            return
+    print("✅ hit_probability_table is bit-identical, with and without the Weaver.")
+
+    agents = roster()
+    table = RosterTable(list(agents.values()))
+    table.bind()
+    hits = HitTable(table)
+    names = table.names
+
+    def cached(weaver):
+        return {names[i]: {names[j]: p for j, p in enumerate(row) if p is not None}
+                for i, row in enumerate(hits.matrix(**weaver))}
+
+    # Every input write must invalidate the cached terms it feeds
+    edits = [
+        ("accuracy_mod", lambda: setattr(agents["Quinn"], "accuracy_mod", 1.4)),
+        ("dodge", lambda: setattr(agents["Oracle"], "dodge", 0.2)),
+        ("spite_meter", lambda: setattr(agents["Ace"], "spite_meter", 1.0)),
+        ("beer_dodge_bonus", lambda: setattr(agents["Kryssie"], "beer_dodge_bonus", 0.3)),
+        ("holding_beer", lambda: setattr(agents["Kryssie"], "holding_beer", False)),
+        ("reset_mods", table.reset_mods),
+    ]
+    for label, edit in edits:
+        for weaver in ({}, WEAVER):
+            cached(weaver)  # Fill the cache before the write
+        edit()
+        for weaver in ({}, WEAVER):
+            if cached(weaver) != expected(agents, weaver):
+                print(f"❌ FAILED: stale hit probabilities after {label}.")
+                return
+        print(f"✅ {label}: cached terms refreshed.")
+    table.unbind()
+    print("✨ SUCCESS: cached hit probabilities track compute_p_hit.")
+
+if __name__ == "__main__":
+    verify_hit_table()
@@ -0,0 +1,78 @@
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.batch import run_batch
+from core.incremental import IncrementalRunner
+
+SEEDS = range(1, 31)
+TURNS = 30
+
+# No canon or sample dyad pair: the runner loads its roster from char_dir
+AGENTS = [
+    {"name": "Ace", "accuracy": 0.7, "dodge": 0.25, "spite_gain_on_hit": 0.35,
+     "spite_decay_per_turn": 0.05, "spite_max_bonus": 0.5, "spite_min_multiplier": 1.0},
+    {"name": "Janus", "accuracy": 0.6, "dodge": 0.35, "paradox_chance": 0.35,
+     "paradox_budget": 3, "untouchable_while_budget": True},
+    {"name": "Kryssie", "accuracy": 0.7, "dodge": 0.4, "beer_dodge_bonus_step": 0.05,
+     "beer_dodge_bonus_cap": 0.3},
+    {"name": "Oracle", "accuracy": 0.6, "dodge": 0.3},
+    {"name": "Claude", "accuracy": 0.55, "dodge": 0.3},
+]
+
+def write_agent(char_dir, agent):
+    (char_dir / f"{agent['name'].lower()}.json").write_text(json.dumps(agent), encoding="utf-8")
+
+def edit(char_dir, name, **fields):
+    path = char_dir / f"{name.lower()}.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(fields)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+def verify_incremental():
+    print(f"🧪 Verifying IncrementalRunner cache invalidation ({len(SEEDS)} seeds, {TURNS} turns)...")
+    tmp = Path(tempfile.mkdtemp())
+    char_dir, cache_dir = tmp / "characters", tmp / "cache"
+    char_dir.mkdir()
+    for agent in AGENTS:
+        write_agent(char_dir, agent)
+
+    def check(label, runner, expect):
+        """The runner's result must equal a fresh batch of the current roster."""
+        result = runner.run(SEEDS).to_dict()
+        fresh = run_batch(SEEDS, TURNS, char_dir, workers=1).to_dict()
+        replayed = set(runner.replayed.values())
+        if result != fresh:
+            print(f"❌ FAILED: {label}: result differs from a fresh batch.")
+            return False
+        if not expect(replayed):
+            print(f"❌ FAILED: {label}: unexpected replay turns {sorted(replayed, key=str)}.")
+            return False
+        print(f"✅ {label}: matches a fresh batch (replayed from {sorted(replayed, key=str)}).")
+        return True
+
+    runner = IncrementalRunner(char_dir, turns=TURNS, cache_dir=cache_dir)
+    ok = check("first run", runner, lambda r: r == {1})
+    ok = ok and check("unchanged roster", runner, lambda r: r == {None})
+
+    edit(char_dir, "Oracle", accuracy=0.75)
+    ok = ok and check("Oracle accuracy edited", runner, lambda r: any(isinstance(t, int) and t > 1 for t in r))
+
+    edit(char_dir, "Claude", paradox_budget=5)  # Only Janus' budget is ever read
+    ok = ok and check("unread field edited", runner, lambda r: r == {None})
+
+    ok = ok and check("disk cache in a new runner", IncrementalRunner(char_dir, turns=TURNS, cache_dir=cache_dir),
+                      lambda r: r == {None})
+
+    write_agent(char_dir, {"name": "Rook", "accuracy": 0.5, "dodge": 0.3})
+    ok = ok and check("agent added", runner, lambda r: r == {1})
+    if ok:
+        print("✨ SUCCESS: incremental runs match fresh runs after every edit.")
+
+if __name__ == "__main__":
+    verify_incremental()
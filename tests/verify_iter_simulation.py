@@ -0,0 +1,75 @@
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent, Event, SimulationSummary, agent_values
+from core.simulation import iter_simulation, run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEED = 777
+TURNS = 80
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def body(path):
+    """Ledger lines without the header (it carries a timestamp)."""
+    return path.read_text(encoding="utf-8").splitlines()[1:]
+
+def verify_iter_simulation():
+    print(f"🧪 Verifying iter_simulation against run_simulation (seed {SEED}, {TURNS} turns)...")
+    tmp = Path(tempfile.mkdtemp())
+    options = dict(char_dir=CHAR_DIR, dyad_classes=[], scenario_name="ricochet_audit")
+
+    events, roster = run_simulation(SEED, TURNS, tmp / "run.jsonl", roster=canon_roster(), **options)
+    streamed, summary = [], None
+    for item in iter_simulation(SEED, TURNS, tmp / "iter.jsonl", roster=canon_roster(), **options):
+        if isinstance(item, SimulationSummary):
+            summary = item
+        else:
+            streamed.append(item)
+
+    if streamed != events or not all(isinstance(e, Event) for e in streamed):
+        print("❌ FAILED: streamed events differ from run_simulation's list.")
+        return
+    if {n: agent_values(a) for n, a in summary.roster.items()} != {n: agent_values(a) for n, a in roster.items()}:
+        print("❌ FAILED: the summary roster differs from run_simulation's.")
+        return
+    if body(tmp / "iter.jsonl") != body(tmp / "run.jsonl"):
+        print("❌ FAILED: the streamed ledger differs from run_simulation's.")
+        return
+    print(f"✅ Same {len(events)} events, final roster and ledger.")
+
+    # Stopping early closes the ledger: every line written so far is whole
+    run = iter_simulation(SEED, TURNS, tmp / "early.jsonl", roster=canon_roster(), **options)
+    for _, item in zip(range(25), run):
+        pass
+    run.close()
+    lines = (tmp / "early.jsonl").read_text(encoding="utf-8").splitlines()
+    try:
+        records = [json.loads(line) for line in lines]
+    except json.JSONDecodeError:
+        print("❌ FAILED: closing the generator early left a torn ledger line.")
+        return
+    if records[0]["event_type"] != "LEDGER_HEADER" or lines[1:] != body(tmp / "run.jsonl")[:len(lines) - 1]:
+        print("❌ FAILED: the early-closed ledger is not a prefix of the full one.")
+        return
+    print(f"✅ Closing early leaves a clean ledger prefix ({len(lines) - 1} events).")
+    print("✨ SUCCESS: iter_simulation streams the run_simulation run.")
+
+if __name__ == "__main__":
+    verify_iter_simulation()
@@ -0,0 +1,141 @@
+import sys
+import os
+import random
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.ledger import LedgerWriter
+from core.ledger_binary import BinaryLedgerWriter, convert_ledger, is_binary_ledger, iter_binary_records
+from core.ledger_index import IndexedLedgerReader
+from core.auto_narrative_generator import LedgerParser
+
+def sample_payloads():
+    yield {
+        "event_type": "LEDGER_HEADER", "version": "v1.4", "timestamp": "2025-12-25T00:00:00",
+        "context": {"seed": 777, "mode": "open", "turns": 3}, "roster_hash": "Pending",
+        "roster_names": ["Ace", "Janus", "Quinn"]
+    }
+    for tick, (thrower, target, outcome) in enumerate([
+        ("Ace", "Janus", "UNTOUCHABLE"), ("Janus", "Quinn", "HIT"), ("Quinn", "Ace", "RICOCHET_HIT"),
+        ("Ace", "Quinn", "SNOW_NET_HIT (1/2)"), ("Ace", "Quinn", "MISS"),
+    ], start=1):
+        yield {
+            "event_type": "SNOWBALL_EVENT:v2.0", "seed": 777, "tick": tick,
+            "thrower": thrower, "intended": target, "outcome": outcome, "actual": target,
+            "notes": "Janus paradox reroll used (budget now 2)." if thrower == "Janus" else "",
+            "roll_hit": 0.1 * tick, "roll_ricochet": 0.25, "p_hit": 0.4132,
+            "tags": ["AUDIT"] if tick == 3 else [],
+            "context": {"ace_spite": 0.35, "weaver_active": False, "weaver_intensity": 1.0},
+            "weaver_turns_left": 0,
+        }
+    # Non-canonical shape (int roll) must survive untouched
+    yield {"event_type": "SNOWBALL_EVENT:v2.0", "seed": 777, "tick": 9, "roll_hit": 1}
+
+def long_run_payloads(turns):
+    """A long run: the turn context changes every few ticks, notes and tags repeat."""
+    rng = random.Random(5)
+    names = ["Ace", "Janus", "Quinn", "Mega"]
+    yield next(sample_payloads())
+    for tick in range(1, turns + 1):
+        thrower, target = rng.sample(names, 2)
+        yield {
+            "event_type": "SNOWBALL_EVENT:v2.0", "seed": 777, "tick": tick,
+            "thrower": thrower, "intended": target, "outcome": rng.choice(["HIT", "MISS", "RICOCHET_HIT"]),
+            "actual": target, "notes": rng.choice(["", "", "Janus paradox reroll used."]),
+            "roll_hit": rng.random(), "roll_ricochet": rng.random(), "p_hit": rng.random(),
+            "tags": rng.choice([[], [], ["AUDIT"]]),
+            "context": {"ace_spite": round(0.05 * (tick // 7 % 9), 2), "weaver_active": tick % 50 < 5},
+            "weaver_turns_left": max(0, 5 - tick % 50),
+        }
+
+def check_long_run(tmp):
+    """Per-turn context changes must not defeat interning; capped tables reset and still decode."""
+    jsonl, sklb, capped = tmp / "long.jsonl", tmp / "long.sklb", tmp / "capped.sklb"
+    with LedgerWriter(jsonl) as w:
+        for p in long_run_payloads(2000):
+            w.write(p)
+    with BinaryLedgerWriter(sklb) as w:
+        for p in long_run_payloads(2000):
+            w.write(p)
+    with BinaryLedgerWriter(capped, max_table_entries=8, index=True) as w:
+        for p in long_run_payloads(2000):
+            w.write(p)
+    expected = list(long_run_payloads(2000))
+    ratio = jsonl.stat().st_size / sklb.stat().st_size
+    if ratio < 8:
+        print(f"❌ FAILED: a 2000-event SKLB is only {ratio:.1f}x smaller than JSONL.")
+        return False
+    # Each reset writes the tables again, so a capped ledger is larger
+    if list(iter_binary_records(capped.read_bytes())) != expected or capped.stat().st_size <= sklb.stat().st_size:
+        print("❌ FAILED: a writer with capped tables did not reset or does not decode.")
+        return False
+    with IndexedLedgerReader(capped) as reader:
+        window = list(reader.events_in_ticks(990, 1010))
+    if window != [e for e in expected if 990 <= e.get("tick", 0) <= 1010]:
+        print("❌ FAILED: indexed reads across table resets.")
+        return False
+    print(f"✅ 2000 events: SKLB is {ratio:.1f}x smaller; capped tables reset and still decode.")
+    return True
+
+def verify_ledger_formats():
+    print("🧪 Verifying Skeletor Ledger formats (JSONL <-> SKLB)...")
+    tmp = Path(tempfile.mkdtemp())
+    jsonl, sklb, back = tmp / "a.jsonl", tmp / "a.sklb", tmp / "b.jsonl"
+
+    with LedgerWriter(jsonl) as w:
+        for p in sample_payloads():
+            w.write(p)
+    with BinaryLedgerWriter(sklb) as w:
+        for p in sample_payloads():
+            w.write(p)
+
+    if not is_binary_ledger(sklb) or is_binary_ledger(jsonl):
+        print("❌ FAILED: format auto-detection.")
+        return
+
+    events_j, chars_j = LedgerParser(jsonl).parse()
+    events_b, chars_b = LedgerParser(sklb).parse()
+    if events_j == events_b and chars_j.keys() == chars_b.keys():
+        print(f"✅ LedgerParser decodes both formats identically ({len(events_b)} events).")
+    else:
+        print("❌ FAILED: LedgerParser output differs between formats.")
+        return
+
+    convert_ledger(sklb, back)
+    if back.read_bytes() == jsonl.read_bytes():
+        print("✅ SKLB -> JSONL conversion is byte-for-byte.")
+    else:
+        print("❌ FAILED: converted JSONL differs from the original.")
+        return
+
+    # v1.5: shared turn context written once (context_id), then referenced (context_ref)
+    shared, shared_sklb = tmp / "s.jsonl", tmp / "s.sklb"
+    with LedgerWriter(shared) as w:
+        for p in sample_payloads():
+            if "context" in p and p["event_type"] != "LEDGER_HEADER":
+                p = dict(p)
+                if p["tick"] == 1:
+                    p["context_id"] = 1
+                else:
+                    del p["context"]
+                    p["context_ref"] = 1
+                p["weaver_turns_left"] = p.pop("weaver_turns_left")
+            w.write(p)
+    convert_ledger(shared, shared_sklb)
+    events_s, _ = LedgerParser(shared).parse()
+    events_sb, _ = LedgerParser(shared_sklb).parse()
+    if events_s == events_j and events_sb == events_j and events_s[1]["context"] is events_s[2]["context"]:
+        print("✅ Shared turn contexts are rehydrated in both formats.")
+    else:
+        print("❌ FAILED: context_ref rehydration.")
+        return
+    if not check_long_run(tmp):
+        return
+
+    print(f"✨ SUCCESS: {jsonl.stat().st_size} bytes JSONL vs {sklb.stat().st_size} bytes SKLB.")
+
+if __name__ == "__main__":
+    verify_ledger_formats()
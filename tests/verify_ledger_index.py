@@ -0,0 +1,111 @@
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.ledger_index import IndexedLedgerReader, index_path
+from core.models import Agent
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEEDS = (777, 778, 779)
+TURNS = 80
+ALL_TICKS = (-10**9, 10**9)
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def run(seed, ledger, **options):
+    run_simulation(seed, TURNS, ledger, CHAR_DIR, roster=canon_roster(), dyad_classes=[],
+                   scenario_name="ricochet_audit", **options)
+
+def reference(tmp, seed):
+    """The run's events as v1.4 records: every line carries its full context."""
+    ledger = tmp / f"reference-{seed}.jsonl"
+    run(seed, ledger, dedupe_context=False)
+    return [json.loads(line) for line in ledger.read_text(encoding="utf-8").splitlines()[1:]]
+
+def check_reader(label, ledger, expected):
+    with IndexedLedgerReader(ledger) as reader:
+        everything = list(reader.events_in_ticks(*ALL_TICKS))
+        window = list(reader.events_in_ticks(20, 35))
+        quinn = list(reader.events_for_agent("Quinn"))
+    if everything != expected:
+        print(f"❌ FAILED: {label}: indexed records differ from the full-context ledger.")
+        return False
+    if window != [r for r in expected if 20 <= r["tick"] <= 35]:
+        print(f"❌ FAILED: {label}: tick window 20..35 is wrong.")
+        return False
+    if quinn != [r for r in expected if "Quinn" in (r["thrower"], r["intended"], r["actual"])]:
+        print(f"❌ FAILED: {label}: Quinn's entries are wrong.")
+        return False
+    print(f"✅ {label}: {len(everything)} records, {len(window)} in ticks 20..35, {len(quinn)} involving Quinn.")
+    return True
+
+def check_context_defs(label, ledger):
+    """Each context_ref entry must point straight at the entry that wrote its context."""
+    lines = [json.loads(line) for line in ledger.read_text(encoding="utf-8").splitlines()]
+    records = [r for r in lines if r.get("event_type") != "LEDGER_HEADER"]
+    with IndexedLedgerReader(ledger) as reader:
+        defs = list(reader.index.context_defs)
+    refs = 0
+    for i, record in enumerate(records):
+        if "context_ref" not in record:
+            if defs[i] != -1:
+                print(f"❌ FAILED: {label}: entry {i} carries its own context but points at {defs[i]}.")
+                return False
+            continue
+        refs += 1
+        j = defs[i]
+        if not (0 <= j < i) or records[j].get("context_id") != record["context_ref"] \
+                or any(r.get("context_id") == record["context_ref"] for r in records[j + 1:i]):
+            print(f"❌ FAILED: {label}: entry {i} resolves its context through entry {j}.")
+            return False
+    if not refs:
+        print(f"❌ FAILED: {label}: expected v1.5 context refs in the ledger.")
+        return False
+    print(f"✅ {label}: {refs} context refs point at their defining entry.")
+    return True
+
+def verify_ledger_index():
+    print(f"🧪 Verifying the tick/agent sidecar index ({TURNS}-turn runs)...")
+    tmp = Path(tempfile.mkdtemp())
+    references = [reference(tmp, seed) for seed in SEEDS]
+
+    for fmt in ("jsonl", "binary"):
+        ledger = tmp / f"ledger.{fmt}"
+        run(SEEDS[0], ledger, ledger_format=fmt, ledger_index=True)
+        if not index_path(ledger).exists():
+            print(f"❌ FAILED: {fmt}: the writer did not emit a sidecar.")
+            return
+        if not check_reader(f"{fmt}, one run", ledger, references[0]):
+            return
+
+        # Appended runs extend the sidecar; context refs stay within their run
+        run(SEEDS[1], ledger, ledger_format=fmt, ledger_index=True)
+        if not check_reader(f"{fmt}, two runs", ledger, references[0] + references[1]):
+            return
+
+        # A run appended without the index leaves the sidecar stale: the reader rebuilds it
+        run(SEEDS[2], ledger, ledger_format=fmt)
+        if not check_reader(f"{fmt}, stale sidecar", ledger, references[0] + references[1] + references[2]):
+            return
+        if fmt == "jsonl" and not check_context_defs(f"{fmt}, context refs", ledger):
+            return
+    print("✨ SUCCESS: indexed reads match the full-context ledger.")
+
+if __name__ == "__main__":
+    verify_ledger_index()
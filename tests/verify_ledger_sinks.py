@@ -0,0 +1,67 @@
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.auto_narrative_generator import LedgerParser
+from core.ledger import MemoryLedgerSink, NullLedgerSink
+from core.models import Agent, agent_values
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEEDS = (777, 778)
+TURNS = 60
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def run(seed, ledger_path, **options):
+    return run_simulation(seed, TURNS, ledger_path, CHAR_DIR, roster=canon_roster(), dyad_classes=[],
+                          scenario_name="ricochet_audit", **options)
+
+def without_timestamps(records):
+    return [{k: v for k, v in r.items() if k != "timestamp"} for r in records]
+
+def verify_ledger_sinks():
+    print(f"🧪 Verifying in-memory and null ledger sinks ({len(SEEDS)} runs, {TURNS} turns)...")
+    tmp = Path(tempfile.mkdtemp())
+    ledger = tmp / "ledger.jsonl"
+    memory = MemoryLedgerSink()
+    for seed in SEEDS:
+        file_events, file_roster = run(seed, ledger)
+        sink_events, _ = run(seed, None, ledger_sink=memory)  # Flushed, not closed: both runs land in it
+        null_events, null_roster = run(seed, None, ledger_sink=NullLedgerSink())
+        if not (file_events == sink_events == null_events) or \
+                {n: agent_values(a) for n, a in null_roster.items()} != {n: agent_values(a) for n, a in file_roster.items()}:
+            print(f"❌ FAILED: seed {seed}: the sink changed the run.")
+            return
+    print("✅ File, memory and null sinks play the same runs.")
+
+    on_disk = [json.loads(line) for line in ledger.read_text(encoding="utf-8").splitlines()]
+    if without_timestamps(memory.records) != without_timestamps(on_disk):
+        print("❌ FAILED: in-memory records differ from the decoded ledger lines.")
+        return
+    print(f"✅ MemoryLedgerSink holds the file's {len(on_disk)} records ({len(memory.events)} events).")
+
+    from_file, from_memory = LedgerParser(ledger).parse(), LedgerParser(memory).parse()
+    if from_memory != from_file:
+        print("❌ FAILED: LedgerParser reads the sink differently from the file.")
+        return
+    print(f"✅ LedgerParser parses the sink like the file ({len(from_memory[0])} events).")
+    print("✨ SUCCESS: ledger sinks are interchangeable.")
+
+if __name__ == "__main__":
+    verify_ledger_sinks()
@@ -0,0 +1,73 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.ledger_store import LedgerStore, iter_ledger_file
+from core.models import Agent
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEEDS = (11, 12, 13, 14, 15)
+TURNS = 40
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+    }
+
+def run(seed, ledger, fmt):
+    run_simulation(seed, TURNS, ledger, CHAR_DIR, roster=canon_roster(), dyad_classes=[], ledger_format=fmt)
+
+def events(records):
+    """Records without the header (it carries a timestamp)."""
+    return [r for r in records if r.get("event_type") != "LEDGER_HEADER"]
+
+def verify_store(tmp, fmt, compression):
+    label = f"{fmt} + {compression}"
+    store = LedgerStore(tmp / f"store-{fmt}-{compression}", max_segment_runs=2, compression=compression, fmt=fmt)
+    expected = {}
+    for seed in SEEDS:
+        with store.run() as ledger_path:
+            run(seed, ledger_path, fmt)
+        single = tmp / f"single-{compression}-{seed}.{fmt}"  # The writer appends: one file per case
+        run(seed, single, fmt)
+        expected[seed] = events(iter_ledger_file(single))
+
+    # Reopened from its manifest: 2 closed, compressed segments and the open one
+    store = LedgerStore(store.root, max_segment_runs=2, compression=compression, fmt=fmt)
+    states = [(s["status"], s["compression"], len(s["runs"])) for s in store.segments]
+    if states != [("closed", compression, 2), ("closed", compression, 2), ("open", "none", 1)]:
+        print(f"❌ FAILED: {label}: unexpected segments {states}.")
+        return False
+    for seed in SEEDS:
+        (hit,) = store.find_runs(seed=seed)
+        if events(store.iter_run_records(*hit)) != expected[seed]:
+            print(f"❌ FAILED: {label}: run {seed} does not stream back as written.")
+            return False
+    if events(store.iter_records()) != [e for seed in SEEDS for e in expected[seed]]:
+        print(f"❌ FAILED: {label}: iter_records is not every run in order.")
+        return False
+    print(f"✅ {label}: {len(SEEDS)} runs in {len(store.segments)} segments stream back as written.")
+    return True
+
+def verify_ledger_store():
+    print("🧪 Verifying the segmented ledger store...")
+    tmp = Path(tempfile.mkdtemp())
+    for fmt in ("jsonl", "binary"):
+        for compression in ("gzip", "lzma"):
+            if not verify_store(tmp, fmt, compression):
+                return
+    print("✨ SUCCESS: stored runs replay from rotated, compressed segments.")
+
+if __name__ == "__main__":
+    verify_ledger_store()
@@ -0,0 +1,97 @@
+import sys
+import os
+import copy
+import pickle
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import EMPTY_CONTEXT, EMPTY_TAGS, Agent, Event, TurnContext, agent_values
+from core.simulation import run_simulation
+
+def event(**fields):
+    return Event(tick=3, thrower="Ace", intended="Janus", outcome="HIT", actual="Janus", notes="",
+                 roll_hit=0.1, roll_ricochet=0.9, p_hit=0.5, **fields)
+
+class AnnotatingDyad:
+    """Plugin-style dyad that tags and annotates the turn's events in place."""
+    hooks = ("on_turn_end",)
+
+    @staticmethod
+    def check_requirements(roster):
+        return True
+
+    def on_turn_end(self, ctx):
+        for evt in list(ctx.events)[-3:]:
+            if evt.tick == ctx.tick:
+                evt.tags.append("annotated")
+                evt.context["annotated_at"] = ctx.tick
+        return []
+
+def roster():
+    return {name: Agent(name=name, accuracy=0.6, dodge=0.3) for name in ("Rook", "Bishop", "Knight")}
+
+def check_plugin_mutation(tmp):
+    """Dyads mutating ctx.events: no errors, same ledger, only their own copies change."""
+    runs = {}
+    for label, dyads in (("plain", []), ("annotated", [AnnotatingDyad])):
+        ledger = tmp / f"{label}.jsonl"
+        events, _ = run_simulation(11, 40, ledger, tmp, roster=roster(), dyad_classes=dyads)
+        runs[label] = (events, ledger.read_text(encoding="utf-8").splitlines()[1:])
+    plain, annotated = runs["plain"][0], runs["annotated"][0]
+    changed = [e for e in annotated if "annotated" in e.raw_tags]
+    shared_intact = all("annotated_at" not in e.raw_context for e in annotated if "annotated" not in e.raw_tags)
+    return check("a dyad appending tags / setting context on ctx.events runs and keeps the ledger",
+                 len(changed) > 0 and shared_intact and runs["plain"][1] == runs["annotated"][1]
+                 and len(plain) == len(annotated)
+                 and all(e.context["annotated_at"] == e.tick for e in changed))
+
+def check(label, ok):
+    print(f"✅ {label}" if ok else f"❌ FAILED: {label}")
+    return ok
+
+def verify_models():
+    print("🧪 Verifying slotted models and their shared defaults...")
+    bare = event()
+    ok = check("omitted tags and context share the empty sentinels",
+               bare.raw_tags is EMPTY_TAGS and bare.raw_context is EMPTY_CONTEXT)
+
+    tags, context = ["AUDIT"], {"ace_spite": 0.3}
+    given = event(tags=tags, context=context)
+    empty_list = event(tags=[])
+    ok = ok and check("caller-supplied tags and context are kept as given (even an empty list)",
+                      given.tags is tags and given.context is context and isinstance(empty_list.tags, list))
+
+    # Plugin-style mutation copies the shared values first (copy-on-write)
+    bare.tags.append("ricochet")
+    bare.context["weaver_active"] = True
+    turn = TurnContext(3, {"ace_spite": 0.3})
+    shared, sibling = event(context=turn), event(context=turn)
+    shared.context["ace_spite"] = 0.5
+    helper = event()
+    helper.add_tag("AUDIT")
+    helper.set_context("ace_spite", 0.1)
+    ok = ok and check("tags.append / context[k] = v copy the shared values first",
+                      bare.tags == ["ricochet"] and bare.context == {"weaver_active": True}
+                      and EMPTY_TAGS == () and EMPTY_CONTEXT == {} and shared.context == {"ace_spite": 0.5}
+                      and turn == {"ace_spite": 0.3} and sibling.raw_context is turn
+                      and helper.tags == ["AUDIT"] and helper.context == {"ace_spite": 0.1})
+
+    pair = pickle.loads(pickle.dumps([sibling, event(context=turn)]))
+    ok = ok and check("events pickle and compare by value; a shared context stays shared",
+                      pickle.loads(pickle.dumps(given)) == given and pair[0] == sibling
+                      and pair[0].raw_context is pair[1].raw_context and sibling.raw_context is turn)
+    ok = ok and check_plugin_mutation(Path(tempfile.mkdtemp()))
+    ok = ok and check("thrower names are interned", event().thrower is sys.intern("".join(["A", "ce"])))
+
+    ace = Agent(name="Ace", accuracy=0.7, spite_meter=0.4)
+    clone = copy.deepcopy(ace)
+    ok = ok and check("Agent is slotted; deepcopy gives an equal, separate Agent",
+                      not hasattr(ace, "__dict__") and clone is not ace and agent_values(clone) == agent_values(ace))
+    if ok:
+        print("✨ SUCCESS: compact models keep their values and copy shared defaults on write.")
+
+if __name__ == "__main__":
+    verify_models()
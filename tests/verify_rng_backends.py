@@ -0,0 +1,127 @@
+import sys
+import os
+import math
+import pickle
+import random
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent, SimulationCheckpoint, SimulationSummary, agent_values
+from core.rng import make_rng, np
+from core.simulation import iter_simulation, run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEED = 4242
+TURNS = 80
+
+def canon_roster():
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+        "Oracle": Agent(name="Oracle", accuracy=0.6, dodge=0.3),
+    }
+
+def draws(rng, n=50):
+    return [rng.random() for _ in range(n)] + [rng.randrange(7) for _ in range(n)] + [rng.getrandbits(70)]
+
+def verify_stream():
+    """Determinism, state round trips (within and across blocks) and integer picks."""
+    if draws(make_rng(SEED)) != draws(random.Random(SEED)):
+        print("❌ FAILED: the mt backend is not random.Random.")
+        return False
+    if draws(make_rng(SEED, "numpy")) != draws(make_rng(SEED, "numpy")) or \
+            draws(make_rng(SEED, "numpy")) == draws(make_rng(SEED + 1, "numpy")):
+        print("❌ FAILED: the numpy backend is not deterministic per seed.")
+        return False
+    print("✅ mt is random.Random; numpy is deterministic per seed.")
+
+    for n in (1, SEED, 2**64 + 3):
+        if draws(make_rng(-n, "numpy")) == draws(make_rng(n, "numpy")) or \
+                draws(make_rng(-n, "numpy")) != draws(make_rng(-n, "numpy")):
+            print(f"❌ FAILED: numpy seeds {-n} and {n} do not give distinct, deterministic streams.")
+            return False
+    if make_rng(SEED, "numpy").random() != np.random.Generator(np.random.PCG64(SEED)).random():
+        print("❌ FAILED: non-negative seeds no longer seed PCG64 directly.")
+        return False
+    print("✅ numpy seeds -n and n give distinct streams; non-negative seeds are unchanged.")
+
+    for skip in (0, 100, 256, 1000, 9000):  # First block is 256 doubles, then 512, 1024, ...
+        rng = make_rng(SEED, "numpy")
+        for _ in range(skip):
+            rng.random()
+        state = rng.getstate()
+        expected = draws(rng)
+        restored = make_rng(0, "numpy")
+        restored.setstate(state)
+        if draws(restored) != expected or draws(pickle.loads(pickle.dumps(restored))) != draws(restored):
+            print(f"❌ FAILED: getstate/setstate or pickle round trip after {skip} draws.")
+            return False
+    print("✅ getstate/setstate and pickle resume the stream mid-block and across blocks.")
+
+    rng = make_rng(SEED, "numpy")
+    n = 60000
+    counts = Counter(rng.randrange(6) for _ in range(n))
+    worst = max(abs(counts[k] - n / 6) / math.sqrt(n * (1 / 6) * (5 / 6)) for k in range(6))
+    mean = sum(rng.random() for _ in range(n)) / n
+    if worst > 5.0 or abs(mean - 0.5) > 5 * math.sqrt(1 / 12 / n) or sorted(rng.sample(range(10), 10)) != list(range(10)):
+        print(f"❌ FAILED: integer picks or doubles are not uniform (worst |z| = {worst:.2f}, mean {mean:.4f}).")
+        return False
+    print(f"✅ randrange, random and sample are uniform (worst |z| = {worst:.2f}).")
+    return True
+
+def verify_runs():
+    """Full vs stats-only runs, checkpoint resume and the option guards on the numpy backend."""
+    tmp = Path(tempfile.mkdtemp())
+    options = dict(char_dir=CHAR_DIR, dyad_classes=[], rng_backend="numpy")
+
+    events, roster = run_simulation(SEED, TURNS, tmp / "full.jsonl", roster=canon_roster(), **options)
+    stats, _ = run_simulation(SEED, TURNS, None, roster=canon_roster(), stats_only=True, **options)
+    mt, _ = run_simulation(SEED, TURNS, None, CHAR_DIR, roster=canon_roster(), dyad_classes=[], stats_only=True)
+    if stats.landed != {n: a.landed for n, a in roster.items()} or (stats.landed, stats.outcomes) == (mt.landed, mt.outcomes):
+        print("❌ FAILED: numpy stats-only run differs from the full run (or replays the mt run).")
+        return False
+    print(f"✅ Full and stats-only numpy runs agree ({len(events)} events), and differ from the mt run.")
+
+    resumed, checkpoint = [], None
+    for item in iter_simulation(SEED, TURNS, None, roster=canon_roster(), stats_only=True, checkpoint_at=[33], **options):
+        if isinstance(item, SimulationCheckpoint):
+            checkpoint = pickle.loads(pickle.dumps(item))
+    for item in iter_simulation(SEED, TURNS, None, stats_only=True, resume=checkpoint, **options):
+        if isinstance(item, SimulationSummary):
+            resumed = item
+    if (resumed.stats.landed, resumed.stats.outcomes) != (stats.landed, stats.outcomes) or \
+            {n: agent_values(a) for n, a in resumed.roster.items()} != {n: agent_values(a) for n, a in roster.items()}:
+        print("❌ FAILED: resuming a numpy checkpoint does not replay the run.")
+        return False
+    print("✅ A numpy checkpoint resumes the run it was taken from.")
+
+    for label, bad in (("resume under mt", dict(options, rng_backend="mt", resume=checkpoint)),
+                       ("common_random_numbers", dict(options, common_random_numbers=True))):
+        try:
+            run_simulation(SEED, TURNS, None, roster=canon_roster(), stats_only=True, **bad)
+        except ValueError:
+            continue
+        print(f"❌ FAILED: {label} with the numpy backend was accepted.")
+        return False
+    print("✅ Resuming under another backend and combining with common_random_numbers are refused.")
+    return True
+
+def verify_rng_backends():
+    if np is None:
+        print("⚠️  NumPy is not installed: RNG backend check skipped.")
+        return
+    print("🧪 Verifying the RNG backends...")
+    if verify_stream() and verify_runs():
+        print("✨ SUCCESS: the numpy backend is a deterministic, resumable random.Random.")
+
+if __name__ == "__main__":
+    verify_rng_backends()
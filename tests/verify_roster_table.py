@@ -0,0 +1,69 @@
+import sys
+import os
+import copy
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent, agent_values
+from core.roster_table import RosterTable
+
+def roster():
+    return [
+        Agent(name="Ace", accuracy=0.7, dodge=0.25, accuracy_mod=1.2, spite_meter=0.3),
+        Agent(name="Janus", accuracy=0.6, dodge=0.35, landed=2),
+        Agent(name="Quinn", accuracy=0.5, dodge=0.15, dodge_mod=0.8, stray_magnet=1.5),
+        Agent(name="Oracle", accuracy=0.6, dodge=0.3, taken=4),
+    ]
+
+def check(label, got, expected):
+    if got != expected:
+        print(f"❌ FAILED: {label}: {got} != {expected}")
+        return False
+    print(f"✅ {label}")
+    return True
+
+def verify_roster_table():
+    print("🧪 Verifying RosterTable views against plain Agents...")
+    plain = roster()
+    agents = roster()
+    table = RosterTable(agents)
+    table.bind()
+
+    ok = check("ids follow turn order, roles resolved once",
+               (table.ids, table.ace, table.janus, table.quinn, table.kryssie),
+               ({"Ace": 0, "Janus": 1, "Quinn": 2, "Oracle": 3}, 0, 1, 2, None))
+    ok = ok and check("bound views read the table's columns",
+                      [agent_values(a) for a in agents], [agent_values(a) for a in plain])
+
+    # Same writes through the views and on plain Agents
+    for views in (agents, plain):
+        views[1].landed += 1
+        views[3].taken += 1
+        views[2].accuracy_mod = 1.5
+        views[0].spite_meter = 0.6  # Watched field: stays on the Agent
+    ok = ok and check("view writes land in the columns",
+                      (table.landed, table.taken, table.accuracy_mod), ([0, 3, 0, 0], [0, 0, 0, 5], [1.2, 1.0, 1.5, 1.0]))
+
+    snapshot = copy.deepcopy(agents[2])
+    ok = ok and check("deepcopy of a view is a plain Agent with its values",
+                      (type(snapshot), agent_values(snapshot)), (Agent, agent_values(plain[2])))
+
+    # First reset covers every agent, later ones only the touched mods
+    table.reset_mods()
+    ok = ok and check("first reset_mods clears every mod", (table.accuracy_mod, table.dodge_mod), ([1.0] * 4, [1.0] * 4))
+    agents[3].dodge_mod = 0.5
+    table.reset_mods()
+    ok = ok and check("later reset_mods clears touched mods", (table.dodge_mod, table.touched_mods), ([1.0] * 4, set()))
+
+    for agent in plain:
+        agent.accuracy_mod = agent.dodge_mod = 1.0
+    table.unbind()
+    ok = ok and check("unbind writes the columns back into plain Agents",
+                      ([type(a) for a in agents], [agent_values(a) for a in agents]),
+                      ([Agent] * 4, [agent_values(a) for a in plain]))
+    if ok:
+        print("✨ SUCCESS: RosterTable views behave like plain Agents.")
+
+if __name__ == "__main__":
+    verify_roster_table()
@@ -0,0 +1,83 @@
+import sys
+import os
+import hashlib
+import json
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.simulation import run_simulation
+
+TURNS = 60
+
+# No canon or sample dyad pair: runs load these from char_dir
+ROSTERS = {
+    "spite-paradox-beer": [
+        {"name": "Ace", "accuracy": 0.7, "dodge": 0.25, "spite_gain_on_hit": 0.35,
+         "spite_decay_per_turn": 0.05, "spite_max_bonus": 0.5, "spite_min_multiplier": 1.0},
+        {"name": "Janus", "accuracy": 0.6, "dodge": 0.35, "paradox_chance": 0.35,
+         "paradox_budget": 3, "untouchable_while_budget": True},
+        {"name": "Kryssie", "accuracy": 0.7, "dodge": 0.4, "beer_dodge_bonus_step": 0.05,
+         "beer_dodge_bonus_cap": 0.3},
+        {"name": "Oracle", "accuracy": 0.6, "dodge": 0.3},
+        {"name": "Claude", "accuracy": 0.55, "dodge": 0.3},
+    ],
+    "ricochet": [
+        {"name": "Quinn", "accuracy": 0.5, "dodge": 0.15, "stray_magnet": 1.5},
+        {"name": "Kryssie", "accuracy": 0.7, "dodge": 0.4, "beer_dodge_bonus_step": 0.05,
+         "beer_dodge_bonus_cap": 0.3},
+        {"name": "Oracle", "accuracy": 0.6, "dodge": 0.3},
+        {"name": "Claude", "accuracy": 0.55, "dodge": 0.3},
+        {"name": "Rook", "accuracy": 0.65, "dodge": 0.2},
+    ],
+}
+
+CASES = [
+    ("spite-paradox-beer", 7, {}),
+    ("spite-paradox-beer", 777, {"scenario_name": "hierarchy_test"}),
+    ("spite-paradox-beer", 1003, {"mode": "classic"}),
+    ("ricochet", 42, {}),
+    ("ricochet", 9999, {"scenario_name": "ricochet_audit", "audit_mode": "stabilize"}),
+]
+
+# sha256 of the ledger lines after the header, recorded with the original
+# (pre-LedgerWriter, pre-RosterTable) simulator
+GOLDEN = {
+    ("spite-paradox-beer", 7): "e82c08631c9a70744cbc465e35e255b1755c691d2c788e7b8488d738e9f0ea35",
+    ("spite-paradox-beer", 777): "bab507c45b792f1893b474177c9c970a4abb0b69808ab168446563f3eba738d9",
+    ("spite-paradox-beer", 1003): "6e85427d5b0d508cde15ace6632679a49d65cb7d33cd54a713e8cc7788127c0c",
+    ("ricochet", 42): "63ec51cb5f7b6677d81ea75b1638dc83594daa9c06abe09adef7c567df17db70",
+    ("ricochet", 9999): "2b1bad4c9fec76d77694fb38e4b8b36594e8618817c450bd5a500a8692d70ecf",
+}
+
+def write_roster(root, agents):
+    char_dir = root / "characters"
+    char_dir.mkdir()
+    for agent in agents:
+        (char_dir / f"{agent['name'].lower()}.json").write_text(json.dumps(agent), encoding="utf-8")
+    return char_dir
+
+def ledger_digest(roster_name, seed, options, **extra):
+    root = Path(tempfile.mkdtemp())
+    char_dir = write_roster(root, ROSTERS[roster_name])
+    ledger = root / "ledger.jsonl"
+    run_simulation(seed=seed, turns=TURNS, ledger_path=ledger, char_dir=char_dir, weaver_bankai=True, **options, **extra)
+    body = ledger.read_text(encoding="utf-8").splitlines()[1:]  # The header carries a timestamp
+    return hashlib.sha256("\n".join(body).encode("utf-8")).hexdigest()
+
+def verify_seed_replay():
+    print(f"🧪 Verifying that seeds replay the recorded ledgers ({len(CASES)} runs, {TURNS} turns)...")
+    for roster_name, seed, options in CASES:
+        # v1.4 lines: every event carries its full turn context, as the original ledger did
+        digest = ledger_digest(roster_name, seed, options, dedupe_context=False)
+        label = f"{roster_name}, seed {seed}, {options or 'defaults'}"
+        if digest != GOLDEN[(roster_name, seed)]:
+            print(f"❌ FAILED: {label}: ledger differs from the recorded run.")
+            return
+        print(f"✅ {label}")
+    print("✨ SUCCESS: every seed replays its recorded ledger byte for byte.")
+
+if __name__ == "__main__":
+    verify_seed_replay()
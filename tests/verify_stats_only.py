@@ -0,0 +1,61 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent, agent_values
+from core.simulation import run_simulation
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+SEEDS = (1, 7, 777, 2024)
+TURNS = 60
+
+def canon_roster():
+    """Spite, Bankai audits, paradox rerolls, beer mode and Quinn's ricochet pull."""
+    return {
+        "Ace": Agent(name="Ace", accuracy=0.7, dodge=0.25, spite_gain_on_hit=0.35,
+                     spite_decay_per_turn=0.05, spite_max_bonus=0.5, spite_min_multiplier=1.0),
+        "Mega": Agent(name="Mega", accuracy=0.65, dodge=0.3),
+        "Janus": Agent(name="Janus", accuracy=0.6, dodge=0.35, paradox_chance=0.35,
+                       paradox_budget=3, untouchable_while_budget=True),
+        "Kryssie": Agent(name="Kryssie", accuracy=0.7, dodge=0.4, beer_dodge_bonus_step=0.05,
+                         beer_dodge_bonus_cap=0.3),
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+        "Oracle": Agent(name="Oracle", accuracy=0.6, dodge=0.3),
+    }
+
+def event_counts(events):
+    """thrower -> outcome -> count, as SimulationStats.outcomes keeps them."""
+    counts = {}
+    for evt in events:
+        per_thrower = counts.setdefault(evt.thrower, {})
+        per_thrower[evt.outcome] = per_thrower.get(evt.outcome, 0) + 1
+    return counts
+
+def verify_stats_only():
+    print(f"🧪 Verifying stats_only counters against full runs ({len(SEEDS)} seeds x 2 scenarios)...")
+    tmp = Path(tempfile.mkdtemp())
+    for scenario in (None, "ricochet_audit"):
+        for seed in SEEDS:
+            options = dict(seed=seed, turns=TURNS, char_dir=CHAR_DIR, dyad_classes=[], scenario_name=scenario)
+            events, roster = run_simulation(ledger_path=tmp / f"{scenario}-{seed}.jsonl", roster=canon_roster(), **options)
+            stats, stats_roster = run_simulation(ledger_path=None, roster=canon_roster(), stats_only=True, **options)
+
+            label = f"seed {seed}, scenario {scenario}"
+            if stats.landed != {n: a.landed for n, a in roster.items()} or stats.taken != {n: a.taken for n, a in roster.items()}:
+                print(f"❌ FAILED: {label}: landed/taken counters differ from the full run.")
+                return
+            if stats.outcomes != event_counts(events):
+                print(f"❌ FAILED: {label}: outcome counts differ from the full run's events.")
+                return
+            if {n: agent_values(a) for n, a in stats_roster.items()} != {n: agent_values(a) for n, a in roster.items()}:
+                print(f"❌ FAILED: {label}: final rosters differ.")
+                return
+        print(f"✅ scenario {scenario}: counters, outcomes and final rosters match.")
+    print("✨ SUCCESS: stats_only replays the full runs.")
+
+if __name__ == "__main__":
+    verify_stats_only()
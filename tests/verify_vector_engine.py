@@ -0,0 +1,81 @@
+import sys
+import os
+import math
+from pathlib import Path
+
+# Add root to path so we can import core
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import Agent
+from core.simulation import run_simulation
+from core.vector_engine import UnsupportedRosterError, np, run_arenas
+
+CHAR_DIR = Path(__file__).resolve().parent.parent / "characters"
+TURNS = 30
+ARENAS = 20000
+SEEDS = range(1, 2001)
+
+def plain_roster():
+    """Plain throws plus Quinn's capped ricochet pull."""
+    return {
+        "Quinn": Agent(name="Quinn", accuracy=0.5, dodge=0.15, stray_magnet=1.5),
+        "Vanguard-01": Agent(name="Vanguard-01", accuracy=0.6, dodge=0.2),
+        "Striker-03": Agent(name="Striker-03", accuracy=0.7, dodge=0.3),
+        "Wildcard-04": Agent(name="Wildcard-04", accuracy=0.5, dodge=0.5),
+    }
+
+def monte_carlo():
+    """Per-agent landed/taken sums and squared sums from run_simulation."""
+    sums = {}
+    for seed in SEEDS:
+        stats, _ = run_simulation(seed=seed, turns=TURNS, ledger_path=None, char_dir=CHAR_DIR,
+                                  roster=plain_roster(), dyad_classes=[], stats_only=True)
+        for counter in ("landed", "taken"):
+            for name, value in getattr(stats, counter).items():
+                s = sums.setdefault((name, counter), [0.0, 0.0])
+                s[0] += value
+                s[1] += value * value
+    return sums
+
+def verify_vector_engine():
+    if np is None:
+        print("⚠️  NumPy is not installed: vector engine check skipped.")
+        return
+    print(f"🧪 Verifying the vector engine ({ARENAS} arenas) against {len(SEEDS)} Monte Carlo seeds...")
+    result = run_arenas(plain_roster(), ARENAS, TURNS, seed=9, dyad_classes=[])
+    again = run_arenas(plain_roster(), ARENAS, TURNS, seed=9, dyad_classes=[])
+    if not (np.array_equal(result.landed, again.landed) and np.array_equal(result.taken, again.taken)):
+        print("❌ FAILED: the same seed gave different arenas.")
+        return
+    if int(result.landed.sum()) != int(result.taken.sum()):
+        print("❌ FAILED: landed and taken totals disagree.")
+        return
+    print("✅ Deterministic per seed; every landed hit is taken by someone.")
+
+    n = len(SEEDS)
+    worst = 0.0
+    for (name, counter), (s1, s2) in sorted(monte_carlo().items()):
+        column = getattr(result, counter)[:, result.names.index(name)]
+        mc_mean = s1 / n
+        mc_var = max(s2 / n - mc_mean * mc_mean, 1e-12)
+        vec_mean = float(column.mean())
+        se = math.sqrt(mc_var / n + float(column.var()) / ARENAS)
+        z = (vec_mean - mc_mean) / se
+        worst = max(worst, abs(z))
+        print(f"   {name:12s} {counter:6s} vector {vec_mean:6.3f} | mc {mc_mean:6.3f} | z {z:+.2f}")
+    if worst > 4.0:
+        print(f"❌ FAILED: vector means disagree with Monte Carlo (worst |z| = {worst:.2f}).")
+        return
+    print(f"✅ Vector means match Monte Carlo (worst |z| = {worst:.2f}).")
+
+    try:
+        run_arenas(dict(plain_roster(), Ace=Agent(name="Ace")), 10, TURNS, dyad_classes=[])
+    except UnsupportedRosterError as e:
+        print(f"✅ Special agents are refused: {e}")
+    else:
+        print("❌ FAILED: a roster with Ace was accepted.")
+        return
+    print("✨ SUCCESS: vector engine verified.")
+
+if __name__ == "__main__":
+    verify_vector_engine()